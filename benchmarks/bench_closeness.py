@@ -0,0 +1,89 @@
+"""Closeness NetworkX (jarak lambda per edge) vs Dijkstra batch csgraph, divalidasi ke ``df_metric.csv``.
+
+NetworkX hanya dijalankan pada sampel ``--nx-nodes`` node lalu diekstrapolasi
+ke semua node. Kolom ``*_closeness`` hasil vektor dibandingkan dengan
+``df_metric.csv`` (galat relatif maksimum), begitu pula mode aproksimasi.
+
+Contoh:
+    python -m benchmarks.bench_closeness --input "UNAIR - GRAPH NEW.xlsx" --reference df_metric.csv
+"""
+
+import argparse
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import synthetic_transactions, timeit
+from txnet.closeness import closeness
+from txnet.graph import CSRGraph
+from txnet.metrics import metric_edges
+
+NX_DISTANCES = {
+    'unw': None,
+    'trx': lambda u, v, edata: 1.0 / edata['weight_trx'] if edata['weight_trx'] != 0 else 1.0,
+    'amt': lambda u, v, edata: 1.0 / edata['weight_amount'] if edata['weight_amount'] != 0 else 1.0,
+}
+
+
+def to_networkx(edges):
+    # DiGraph referensi dengan atribut bobot seperti di notebook
+    G = nx.DiGraph()
+    G.add_nodes_from(edges['source'].cat.categories)
+    G.add_edges_from(
+        (u, v, {'weight_amount': amount, 'weight_trx': trx})
+        for u, v, amount, trx in zip(edges['source'], edges['target'],
+                                     edges['amount_tx_idr'].tolist(), edges['trx'].tolist())
+    )
+    return G
+
+
+def nx_closeness(G, prefix, nodes):
+    return [nx.closeness_centrality(G, u=node, distance=NX_DISTANCES[prefix]) for node in nodes]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--input', help='file transaksi (xlsx/csv); default data sintetis')
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--reference', help='df_metric.csv untuk validasi')
+    parser.add_argument('--nx-nodes', type=int, default=200)
+    parser.add_argument('--pivots', type=int, nargs='*', default=[1000])
+    args = parser.parse_args(argv)
+
+    if args.input:
+        from txnet.store import read_sheet
+        df = read_sheet(args.input).drop_duplicates()
+    else:
+        df = synthetic_transactions(args.rows)
+    edges = metric_edges(df)
+    graph = CSRGraph.from_aggregated(edges)
+    G = to_networkx(edges)
+    n = graph.n_nodes
+    reference = pd.read_csv(args.reference, index_col=0).set_index('node') if args.reference else None
+    sample = np.random.default_rng(0).choice(n, size=min(args.nx_nodes, n), replace=False)
+    sample_names = list(graph.names[sample])
+
+    print(f"{n} node, {graph.n_edges} edge")
+    print(f"{'bobot':>5} {'nx (s, est.)':>13} {'csgraph (s)':>12} {'speedup':>8} {'galat vs nx':>12} {'galat vs ref':>13}")
+    for prefix in NX_DISTANCES:
+        nx_time, expected = timeit(nx_closeness, G, prefix, sample_names)
+        nx_time *= n / len(sample)
+        fast_time, values = timeit(closeness, graph, prefix)
+        expected = np.asarray(expected)
+        err_nx = np.max(np.abs(values[sample] - expected) / np.maximum(np.abs(expected), 1e-300))
+        err_ref = '-'
+        if reference is not None:
+            ref = reference[f'{prefix}_closeness'].reindex(graph.names).to_numpy()
+            err_ref = f"{np.max(np.abs(values - ref) / np.maximum(np.abs(ref), 1e-300)):.1e}"
+        print(f"{prefix:>5} {nx_time:>13.1f} {fast_time:>12.2f} {nx_time / fast_time:>7.0f}x "
+              f"{err_nx:>12.1e} {err_ref:>13}")
+        for k in args.pivots:
+            approx_time, approx = timeit(closeness, graph, prefix, k=k)
+            top = set(np.argsort(-values)[:100])
+            overlap = len(top & set(np.argsort(-approx)[:100])) / 100
+            print(f"{'':>5} k={k}: {approx_time:.2f}s, overlap top-100 {overlap:.2f}")
+
+
+if __name__ == '__main__':
+    main()
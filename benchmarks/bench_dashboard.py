@@ -0,0 +1,93 @@
+"""Latensi rerun tab Dashboard: agregasi ulang per rerun vs membaca ``DashboardCube``.
+
+Contoh:
+    python -m benchmarks.bench_dashboard --sizes 10k 1M
+    python -m benchmarks.bench_dashboard --app --reruns 5
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.common import SIZES, synthetic_transactions, timeit
+from txnet import build_edges
+from txnet.cube import DashboardCube
+
+
+def legacy_aggregates(df, edges_df, nodes_df):
+    # Salinan perhitungan lama tab Dashboard (dijalankan setiap rerun)
+    total_maybank_nodes = nodes_df[nodes_df['node'].str.contains(r'\(B1\)', na=False)].shape[0]
+    total_external_entities = nodes_df[~nodes_df['node'].str.contains(r'\(B1\)', na=False)].shape[0]
+    incoming_amount = edges_df[
+        (edges_df['type'] == 'INCOMING') & (edges_df['target'].str.contains(r'\(B1\)', na=False))
+    ]['amount_tx_idr'].sum()
+    outgoing_amount = edges_df[
+        (edges_df['type'] == 'OUTGOING') & (edges_df['source'].str.contains(r'\(B1\)', na=False))
+    ]['amount_tx_idr'].sum()
+    bank_partners = edges_df['source'].str.extract(r'\((B\d+)\)')[0].value_counts().reset_index()
+    top5_df = df.sort_values(by="amount_tx_idr", ascending=False).head(5)
+    top5_df["label"] = top5_df.apply(
+        lambda row: f"{row['debitor_name']} ({row['debitor_bank']}) → {row['sender_recipient_name']} ({row['sender_recipient_bank']})",
+        axis=1
+    )
+    type_summary = df.groupby('type', observed=True).agg(
+        Count=('type', 'count'), Total_Amount=('amount_tx_idr', 'sum')
+    ).reset_index()
+    partner_stats = edges_df.copy()
+    partner_stats['Bank'] = partner_stats['source'].str.extract(r'\((B\d+)\)')[0]
+    bank_partners = partner_stats.groupby('Bank').agg(
+        Count=('Bank', 'size'), Total_Amount=('amount_tx_idr', 'sum')
+    ).reset_index()
+    bank_partners = bank_partners[bank_partners['Bank'] != 'B1']
+    top_banks = bank_partners.sort_values('Count', ascending=False).head(10)
+    return (total_maybank_nodes, total_external_entities, incoming_amount, outgoing_amount,
+            top5_df, type_summary, top_banks)
+
+
+def cube_aggregates(cube):
+    return (cube.home_nodes, cube.external_nodes, cube.incoming_amount, cube.outgoing_amount,
+            cube.top_transactions.head(5), cube.type_summary, cube.top_banks(10))
+
+
+def app_reruns(reruns):
+    """Rata-rata waktu rerun dashboard (AppTest) saat radio visualisasi diklik."""
+    from streamlit.testing.v1 import AppTest
+
+    app = Path(__file__).resolve().parent.parent / "maybank_dashboard.py"
+    at = AppTest.from_file(str(app), default_timeout=600)
+    at.run()
+    options = ["Berdasarkan Frekuensi", "Berdasarkan Nominal"]
+    start = time.perf_counter()
+    for i in range(reruns):
+        radio = [r for r in at.radio if r.label == "Pilih Jenis Visualisasi:"][0]
+        radio.set_value(options[i % 2]).run()
+    return (time.perf_counter() - start) / reruns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['10k', '1M'], choices=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--app', action='store_true', help='ukur juga rerun dashboard penuh (AppTest)')
+    parser.add_argument('--reruns', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>6} {'legacy (ms)':>12} {'cube read (ms)':>15} {'cube build (s)':>15}")
+    for label in args.sizes:
+        df = synthetic_transactions(SIZES[label])
+        df[['source', 'target']] = build_edges(df)
+        edges_df = df[['source', 'target', 'amount_tx_idr', 'trx', 'type']].copy()
+        nodes_df = pd.DataFrame({'node': df['source'].cat.categories})
+        legacy_time, _ = timeit(legacy_aggregates, df, edges_df, nodes_df, repeat=args.repeat)
+        build_time, cube = timeit(DashboardCube, df)
+        read_time, _ = timeit(cube_aggregates, cube, repeat=args.repeat)
+        print(f"{label:>6} {legacy_time * 1e3:>12.0f} {read_time * 1e3:>15.3f} {build_time:>15.2f}")
+
+    if args.app:
+        print(f"rerun dashboard rata-rata: {app_reruns(args.reruns) * 1e3:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Memori privat dan waktu siap per replika: dataset pribadi per proses vs attach ke ``txnet.dataset``.
+
+Setiap replika dijalankan sebagai proses terpisah yang memuat dataset lalu
+menyentuh semua kolom dan array graf (seperti rerun pertama dashboard).
+Memori privat = halaman anonim (``Anonymous`` di ``/proc/self/smaps_rollup``),
+yaitu heap yang tidak bisa dibagi; halaman file memory-map berasal dari page
+cache dan dipakai bersama oleh semua replika.
+
+Contoh:
+    python -m benchmarks.bench_dataset --rows 1000000 --replicas 3
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import heavy_tailed_transactions
+from txnet.dataset import GRAPH_COLUMNS, attach, dataset_from_frame, publish
+
+VERSION = '0123456789abcdef'
+
+
+def _memory():
+    # (anonim, RSS) dalam MB dari smaps_rollup (Linux)
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    return fields['Anonymous'], fields['Rss']
+
+
+def _touch(df, graph_df, graph, positions):
+    # Baca semua data sekali agar halaman benar-benar dimuat
+    total = float(df['amount_tx_idr'].sum()) + float(graph_df['trx'].sum())
+    total += sum(float(np.asarray(values).sum()) for values in graph.to_arrays().values())
+    return total + float(np.asarray(positions).sum()) + len(graph.names)
+
+
+def _replica(mode, root, parquet, queue):
+    baseline, _ = _memory()
+    start = time.perf_counter()
+    if mode == 'pribadi':
+        import pandas as pd
+        df = pd.read_parquet(parquet)
+        dataset = dataset_from_frame(df, VERSION)
+    else:
+        dataset = attach(VERSION, root)
+    df = dataset.frame('transactions')
+    graph_df = dataset.frame('transactions', GRAPH_COLUMNS)
+    _touch(df, graph_df, dataset.graph, dataset.arrays['positions'])
+    elapsed = time.perf_counter() - start
+    private, rss = _memory()
+    queue.put((elapsed, private - baseline, rss))
+
+
+def run_replicas(mode, n, root, parquet):
+    ctx = mp.get_context('spawn')
+    queue = ctx.Queue()
+    results = []
+    for _ in range(n):
+        proc = ctx.Process(target=_replica, args=(mode, root, parquet, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--replicas', type=int, default=2)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        df = heavy_tailed_transactions(args.rows)
+        parquet = f'{root}/transactions.parquet'
+        df.to_parquet(parquet, index=False)
+        start = time.perf_counter()
+        publish(dataset_from_frame(df, VERSION), root)
+        print(f"{args.rows:,} baris; bangun + publikasi {time.perf_counter() - start:.1f}s")
+        del df
+
+        print(f"{'mode':>8} {'replika':>8} {'siap (s)':>9} {'privat (MB)':>12} {'RSS (MB)':>9}")
+        for mode in ('pribadi', 'bersama'):
+            for i, (elapsed, private, rss) in enumerate(run_replicas(mode, args.replicas, root, parquet)):
+                print(f"{mode:>8} {i + 1:>8} {elapsed:>9.2f} {private:>12.1f} {rss:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
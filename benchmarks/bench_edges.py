@@ -0,0 +1,55 @@
+"""Bandingkan pembentukan edge row-wise (df.apply) dengan txnet.build_edges.
+
+Contoh:
+    python -m benchmarks.bench_edges --sizes 10k 1M 10M --legacy-max 1000000
+"""
+
+import argparse
+
+import pandas as pd
+
+from benchmarks.common import SIZES, synthetic_transactions, timeit
+from txnet import build_edges
+
+
+def legacy_edges(df):
+    # Salinan logika lama di load_data (satu pd.Series per baris)
+    def get_transaction_direction(row):
+        if row['type'].upper() == 'INCOMING':
+            return pd.Series({
+                'source': f"{row['sender_recipient_name']} ({row['sender_recipient_bank']})",
+                'target': f"{row['debitor_name']} ({row['debitor_bank']})"
+            })
+        elif row['type'].upper() == 'OUTGOING':
+            return pd.Series({
+                'source': f"{row['debitor_name']} ({row['debitor_bank']})",
+                'target': f"{row['sender_recipient_name']} ({row['sender_recipient_bank']})"
+            })
+        return pd.Series({'source': None, 'target': None})
+
+    return df.apply(get_transaction_direction, axis=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=list(SIZES), choices=list(SIZES))
+    parser.add_argument('--legacy-max', type=int, default=1_000_000,
+                        help='lewati versi df.apply di atas jumlah baris ini')
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>10} {'apply (s)':>12} {'vector (s)':>12} {'speedup':>9}")
+    for label in args.sizes:
+        df = synthetic_transactions(SIZES[label])
+        vec_time, vec = timeit(build_edges, df, repeat=args.repeat)
+        if len(df) <= args.legacy_max:
+            old_time, old = timeit(legacy_edges, df, repeat=args.repeat)
+            assert (old['source'] == vec['source'].astype(object)).all()
+            assert (old['target'] == vec['target'].astype(object)).all()
+            print(f"{label:>10} {old_time:>12.3f} {vec_time:>12.3f} {old_time / vec_time:>8.1f}x")
+        else:
+            print(f"{label:>10} {'-':>12} {vec_time:>12.3f} {'-':>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Bandingkan filter mask pandas + ``CSRGraph.from_frame`` dengan ``FilterIndex``.
+
+Contoh:
+    python -m benchmarks.bench_filters --sizes 1M 10M
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.common import SIZES, synthetic_transactions, timeit
+from txnet import CSRGraph, build_edges
+from txnet.filters import FilterIndex
+
+
+def legacy_filter(df, amount_range, types):
+    # Logika lama tab Network Analysis: mask penuh, salin frame, agregasi ulang
+    filtered = df[
+        (df['amount_tx_idr'] >= amount_range[0]) &
+        (df['amount_tx_idr'] <= amount_range[1]) &
+        (df['type'].isin(types))
+    ]
+    return CSRGraph.from_frame(filtered)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['1M', '10M'], choices=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--legacy-max', type=int, default=1_000_000,
+                        help='lewati versi mask pandas di atas jumlah baris ini')
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>6} {'scenario':>14} {'selected':>10} {'legacy (ms)':>12} "
+          f"{'select (ms)':>12} {'graph (ms)':>11} {'index build (s)':>16}")
+    for label in args.sizes:
+        df = synthetic_transactions(SIZES[label])
+        edges = build_edges(df)
+        # Kolom nama tidak dibutuhkan setelah source/target terbentuk (hemat memori)
+        df = df[['amount_tx_idr', 'trx', 'type']].assign(source=edges['source'], target=edges['target'])
+        del edges
+        graph = CSRGraph.from_frame(df)
+        build_time, index = timeit(FilterIndex.from_frame, df, graph)
+        lo, hi = np.quantile(df['amount_tx_idr'], [0.0, 1.0])
+        mid = np.quantile(df['amount_tx_idr'], [0.25, 0.75])
+        narrow = np.quantile(df['amount_tx_idr'], [0.99, 0.995])
+        scenarios = {
+            'all': ((lo, hi), ['INCOMING', 'OUTGOING']),
+            'iqr+incoming': (tuple(mid), ['INCOMING']),
+            'narrow': (tuple(narrow), ['INCOMING', 'OUTGOING']),
+        }
+        for name, (amount_range, types) in scenarios.items():
+            legacy_time = float('nan')
+            if len(df) <= args.legacy_max:
+                legacy_time, _ = timeit(legacy_filter, df, amount_range, types, repeat=args.repeat)
+            select_time, rows = timeit(index.select, amount_range, types, repeat=args.repeat)
+            graph_time, _ = timeit(index.graph_for, rows, repeat=args.repeat)
+            print(f"{label:>6} {name:>14} {len(rows):>10,} {legacy_time * 1e3:>12.0f} "
+                  f"{select_time * 1e3:>12.1f} {graph_time * 1e3:>11.1f} {build_time:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
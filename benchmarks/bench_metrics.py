@@ -0,0 +1,65 @@
+"""Bandingkan betweenness eksak dengan aproksimasi k-pivot (waktu dan kesesuaian top-k).
+
+Contoh:
+    python -m benchmarks.bench_metrics --input "UNAIR - GRAPH NEW.xlsx" --epsilon 0.05 0.02
+    python -m benchmarks.bench_metrics --rows 20000 --pivots 500 2000 --workers 4
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.common import synthetic_transactions, timeit
+from txnet.graph import CSRGraph
+from txnet.metrics import metric_edges, pivot_count
+from txnet.parallel import MetricRunner
+
+
+def topk_overlap(exact, approx, k):
+    """Proporsi node top-k eksak yang juga masuk top-k aproksimasi."""
+    top_e = set(np.argsort(-exact, kind='stable')[:k])
+    top_a = set(np.argsort(-approx, kind='stable')[:k])
+    return len(top_e & top_a) / k
+
+
+def betweenness(runner, prefix, k=None):
+    columns, _ = runner.run(prefixes=(prefix,), k=k, metrics=('betweenness',), log=lambda msg: None)
+    return columns[f'{prefix}_betweenness']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--input', help='file transaksi (xlsx/csv); default data sintetis')
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--pivots', type=int, nargs='*', default=[])
+    parser.add_argument('--epsilon', type=float, nargs='*', default=[0.05, 0.02])
+    parser.add_argument('--weight', choices=['unw', 'trx', 'amt'], default='unw')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--topk', type=int, nargs='+', default=[10, 50, 100])
+    args = parser.parse_args(argv)
+
+    if args.input:
+        from txnet.store import read_sheet
+        df = read_sheet(args.input).drop_duplicates()
+    else:
+        df = synthetic_transactions(args.rows)
+    edges = metric_edges(df)
+    graph = CSRGraph.from_aggregated(edges)
+    runner = MetricRunner(edges, workers=args.workers)
+    n = graph.n_nodes
+
+    exact_time, exact = timeit(betweenness, runner, args.weight)
+    print(f"{n} node, {graph.n_edges} edge; eksak: {exact_time:.2f}s")
+
+    runs = [(f"k={k}", k) for k in args.pivots]
+    runs += [(f"eps={eps}", pivot_count(n, eps)) for eps in args.epsilon]
+    header = ' '.join(f"top{k:>4}" for k in args.topk)
+    print(f"{'run':>12} {'pivot':>7} {'waktu (s)':>10} {'speedup':>8} {header}")
+    for label, k in runs:
+        approx_time, approx = timeit(betweenness, runner, args.weight, k=k)
+        overlap = ' '.join(f"{topk_overlap(exact, approx, t):>7.2f}" for t in args.topk)
+        print(f"{label:>12} {k:>7} {approx_time:>10.2f} {exact_time / approx_time:>7.1f}x {overlap}")
+
+
+if __name__ == '__main__':
+    main()
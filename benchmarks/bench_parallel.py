@@ -0,0 +1,50 @@
+"""Skalabilitas ``MetricRunner`` (betweenness + closeness 3 pembobotan) terhadap jumlah worker.
+
+Hasil setiap jumlah worker dibandingkan bit-per-bit dengan jalur serial (``workers=1``).
+
+Contoh:
+    python -m benchmarks.bench_parallel --rows 50000 --workers 1 2 4 8 16 32
+    python -m benchmarks.bench_parallel --input "UNAIR - GRAPH NEW.xlsx" --workers 1 4
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.common import synthetic_transactions, timeit
+from txnet.metrics import metric_edges
+from txnet.parallel import MetricRunner, default_workers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--input', help='file transaksi (xlsx/csv); default data sintetis')
+    parser.add_argument('--rows', type=int, default=20_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--pivots', type=int, help='jumlah sumber sampel betweenness')
+    args = parser.parse_args(argv)
+
+    if args.input:
+        from txnet.store import read_sheet
+        df = read_sheet(args.input).drop_duplicates()
+    else:
+        df = synthetic_transactions(args.rows)
+    edges = metric_edges(df)
+    n = len(edges['source'].cat.categories)
+    print(f"{n} node, {len(edges)} edge, {default_workers()} CPU tersedia")
+
+    def run(workers):
+        return MetricRunner(edges, workers=workers).run(k=args.pivots, log=lambda msg: None)[0]
+
+    print(f"{'workers':>8} {'waktu (s)':>10} {'speedup':>8} {'identik':>8}")
+    base_time, base = None, None
+    for workers in args.workers:
+        elapsed, result = timeit(run, workers)
+        if base is None:
+            base_time, base = elapsed, result
+        same = all(np.array_equal(result[col], base[col]) for col in base)
+        print(f"{workers:>8} {elapsed:>10.2f} {base_time / elapsed:>7.1f}x {str(same):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Bandingkan HTML PyVis dengan payload graf ringkas (ukuran, waktu buat, waktu parse JS).
+
+Waktu parse diukur dengan Node.js (bila tersedia): JSON.parse array node/edge
+PyVis dibandingkan dengan JSON.parse payload + ``decodePayloadRecords``.
+
+Contoh:
+    python -m benchmarks.bench_payload --nodes 1000 10000 100000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+from pyvis.network import Network
+
+from benchmarks.common import timeit
+from txnet.payload import LOADER_PATH, graph_payload, payload_html, payload_json
+from txnet.render import network_html
+
+JS_HARNESS = """
+const fs = require('fs');
+eval(fs.readFileSync(process.argv[2], 'utf8'));
+var vis = {DataSet: function (items) { this.items = items; }, Network: function () {}};
+var nodes, edges, network;
+const legacy = fs.readFileSync(process.argv[3], 'utf8');
+const compact = fs.readFileSync(process.argv[4], 'utf8');
+function best(fn) {
+  let t = Infinity;
+  for (let i = 0; i < 5; i++) { const s = process.hrtime.bigint(); fn(); t = Math.min(t, Number(process.hrtime.bigint() - s) / 1e6); }
+  return t;
+}
+const a = best(() => { const d = JSON.parse(legacy); new vis.DataSet(d[0]); new vis.DataSet(d[1]); });
+const b = best(() => hydrateNetwork(null, JSON.parse(compact), {}));
+console.log(JSON.stringify([a, b]));
+"""
+
+
+def synthetic_network(n_nodes, edges_per_node=2, n_banks=120, seed=0):
+    """Daftar dict node/edge berformat PyVis, seperti keluaran tab Network Analysis."""
+    rng = np.random.default_rng(seed)
+    banks = rng.integers(1, n_banks + 1, n_nodes)
+    degree = rng.integers(1, 50, n_nodes)
+    xy = rng.uniform(-1500, 1500, (n_nodes, 2))
+    nodes = []
+    for i in range(n_nodes):
+        name = f"N{i} (B{banks[i]})"
+        nodes.append({"color": "#FFC700" if banks[i] == 1 else "#547792", "id": i, "label": name,
+                      "shape": "dot", "size": 15 + degree[i] / 50 * 100, "title": name, "borderWidth": 2,
+                      "x": float(xy[i, 0]), "y": float(xy[i, 1])})
+    n_edges = n_nodes * edges_per_node
+    src, dst = rng.integers(0, n_nodes, n_edges), rng.integers(0, n_nodes, n_edges)
+    amount = rng.lognormal(18, 2, n_edges)
+    trx = rng.integers(1, 100, n_edges)
+    kinds = np.where(rng.random(n_edges) < 0.57, "INCOMING", "OUTGOING")
+    edges = [{"arrows": {"to": {"enabled": True, "scaleFactor": 1.5}}, "color": "#0078D4",
+              "from": int(src[e]), "title": f"Amount: {amount[e]:,.2f} IDR\nTrx: {trx[e]}\nType: {kinds[e]}",
+              "to": int(dst[e]), "width": 2}
+             for e in range(n_edges)]
+    return nodes, edges
+
+
+def pyvis_network(nodes, edges):
+    # Isi Network langsung: add_node/add_edge PyVis O(n) per panggilan
+    net = Network(height="600px", width="100%", directed=True, notebook=False)
+    net.nodes, net.edges = nodes, edges
+    net.node_ids = [node["id"] for node in nodes]
+    net.node_map = {node["id"]: node for node in nodes}
+    net.toggle_physics(False)
+    return net
+
+
+def js_parse_times(nodes, edges, payload):
+    node_bin = shutil.which('node')
+    if node_bin is None:
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, name) for name in ('harness.js', 'legacy.json', 'compact.json')]
+        contents = (JS_HARNESS, json.dumps([nodes, edges]), payload_json(payload))
+        for path, content in zip(paths, contents):
+            with open(path, 'w', encoding='utf-8') as fh:
+                fh.write(content)
+        out = subprocess.run([node_bin, paths[0], str(LOADER_PATH), paths[1], paths[2]],
+                             check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', nargs='+', type=int, default=[1_000, 10_000, 100_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'nodes':>8} {'pyvis (KB)':>11} {'compact (KB)':>13} {'ratio':>6} "
+          f"{'pyvis gen (s)':>14} {'compact gen (s)':>16} {'JS parse (ms)':>14} {'JS hydrate (ms)':>16}")
+    for n_nodes in args.nodes:
+        nodes, edges = synthetic_network(n_nodes)
+        net = pyvis_network(nodes, edges)
+        legacy_time, legacy = timeit(network_html, net)
+
+        def compact_html():
+            payload = graph_payload(nodes, edges)
+            return payload, payload_html(payload, net.options.to_json())
+
+        compact_time, (payload, compact) = timeit(compact_html)
+        legacy_kb, compact_kb = len(legacy.encode()) / 1024, len(compact.encode()) / 1024
+        parse = js_parse_times(nodes, edges, payload)
+        parse_cols = f"{parse[0]:>14.1f} {parse[1]:>16.1f}" if parse else f"{'-':>14} {'-':>16}"
+        print(f"{n_nodes:>8} {legacy_kb:>11,.0f} {compact_kb:>13,.0f} {legacy_kb / compact_kb:>5.1f}x "
+              f"{legacy_time:>14.2f} {compact_time:>16.2f} {parse_cols}")
+
+
+if __name__ == '__main__':
+    main()
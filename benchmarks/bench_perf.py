@@ -0,0 +1,38 @@
+"""Overhead ``perf.stage`` per panggilan: nonaktif, waktu saja, dan dengan ``tracemalloc``.
+
+Contoh:
+    python -m benchmarks.bench_perf --calls 200000
+"""
+
+import argparse
+import logging
+import os
+
+from benchmarks.common import timeit
+from txnet import perf
+
+
+def run(calls):
+    for _ in range(calls):
+        with perf.stage('noop') as s:
+            s.rows = 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    # Log JSON per tahap tetap dibentuk, tapi tidak dicetak
+    logging.getLogger('txnet.perf').disabled = True
+    os.environ.pop(perf.LOG_ENV_VAR, None)
+    print(f"{'mode':>8} {'ns/tahap':>10}")
+    for mode in ('0', '1', 'memory'):
+        os.environ[perf.ENV_VAR] = mode
+        perf.start('bench')
+        elapsed, _ = timeit(run, args.calls, repeat=3)
+        print(f"{mode:>8} {elapsed / args.calls * 1e9:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Bandingkan ``core_candidates`` loop notebook dengan versi vektor (waktu dan kesamaan hasil).
+
+Kesamaan diperiksa pada kasus acak: ukuran kecil, nilai kembar, metrik NaN,
+dan k lebih besar dari jumlah node berskor.
+
+Contoh:
+    python -m benchmarks.bench_sensitivity --nodes 5000 --samples 200 --cases 200
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import timeit
+from txnet.sensitivity import core_candidates
+
+METRICS = ['m1', 'm2', 'm3']
+
+
+def legacy_core_candidates(df, metrics, k=20, n_samples=100, seed=42, thresh=0.8):
+    # Salinan fungsi di sdc-final.ipynb
+    rng = np.random.RandomState(seed)
+    freq = pd.Series(0, index=df['node'].values, dtype=int)
+    for _ in range(n_samples):
+        w = rng.rand(len(metrics))
+        w = w / w.sum()
+        score = sum(df[m] * w_i for m, w_i in zip(metrics, w))
+        rank = score.rank(ascending=False, method='min')
+        idx_topk = rank.nsmallest(k).index
+        nodes_topk = df.loc[idx_topk, 'node'].values
+        freq.loc[nodes_topk] += 1
+    freq = freq / n_samples
+    return freq[freq >= thresh].sort_values(ascending=False)
+
+
+def metric_frame(rng, n_nodes, nan_fraction=0.0, levels=None):
+    """Tabel metrik acak; ``levels`` membatasi nilai agar banyak kembar."""
+    values = rng.random((n_nodes, len(METRICS)))
+    if levels:
+        values = np.round(values * levels) / levels
+    values[rng.random(values.shape) < nan_fraction] = np.nan
+    frame = pd.DataFrame(values, columns=METRICS)
+    frame.insert(0, 'node', [f'N{i}|B1' for i in range(n_nodes)])
+    return frame
+
+
+def check_equivalence(n_cases, seed=0):
+    """Jumlah kasus acak yang hasilnya berbeda dari loop notebook."""
+    rng = np.random.default_rng(seed)
+    mismatches = 0
+    for case in range(n_cases):
+        df = metric_frame(rng, int(rng.integers(1, 60)), nan_fraction=rng.choice([0.0, 0.1, 0.5]),
+                          levels=rng.choice([None, 3]))
+        args = dict(k=int(rng.integers(1, 40)), n_samples=int(rng.integers(1, 30)), seed=case,
+                    thresh=float(rng.choice([0.0, 0.5])))
+        expected = legacy_core_candidates(df, METRICS, **args)
+        actual = core_candidates(df, METRICS, **args)
+        if not expected.index.equals(actual.index) or not np.allclose(expected.to_numpy(), actual.to_numpy()):
+            mismatches += 1
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=5000)
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--nan-fraction', type=float, default=0.01)
+    parser.add_argument('--cases', type=int, default=200, help='jumlah kasus acak pemeriksaan kesamaan')
+    args = parser.parse_args(argv)
+
+    mismatches = check_equivalence(args.cases)
+    print(f"kesamaan: {args.cases - mismatches}/{args.cases} kasus acak sama dengan loop notebook")
+
+    df = metric_frame(np.random.default_rng(0), args.nodes, args.nan_fraction)
+    old_time, old = timeit(legacy_core_candidates, df, METRICS, n_samples=args.samples, seed=0, thresh=0.0)
+    new_time, new = timeit(core_candidates, df, METRICS, n_samples=args.samples, seed=0, thresh=0.0)
+    assert old.index.equals(new.index) and np.allclose(old.to_numpy(), new.to_numpy())
+    print(f"{args.nodes} node, {args.samples} sampel: loop {old_time:.2f}s, vektor {new_time:.3f}s "
+          f"({old_time / new_time:.0f}x)")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+"""Suite benchmark end-to-end pada data sintetis berekor berat, hasil JSON untuk perbandingan versi.
+
+Suite: ``ingest`` (xlsx -> parquet, parquet, streaming CSV), ``edges``
+(``build_edges``, agregasi metrik), ``graph`` (``CSRGraph``), ``metrics``
+(degree, PageRank, betweenness & closeness per pembobotan), ``sensitivity``
+(``priority_tables``) dan ``html`` (PyVis + payload ringkas). Di atas
+``--exact-max-nodes`` betweenness/closeness memakai ``--pivots`` sumber sampel.
+
+Hasil dibandingkan per (ukuran, kasus); keluar dengan status 1 bila ada kasus
+yang melambat lebih dari ``--threshold``.
+
+Contoh:
+    python -m benchmarks.run --sizes 10k 1M --output bench-new.json
+    python -m benchmarks.run --sizes 10k --output bench-new.json --compare bench-old.json
+    python -m benchmarks.run --compare bench-old.json --against bench-new.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import scipy
+
+from benchmarks.common import SIZES, heavy_tailed_transactions, timeit
+from txnet import CSRGraph, build_edges, node_volume, top_k
+from txnet.metrics import degree_metrics, metric_edges, normalize
+from txnet.pagerank import pagerank
+from txnet.parallel import MetricRunner
+
+SUITES = ('ingest', 'edges', 'graph', 'metrics', 'sensitivity', 'html')
+PREFIXES = ('unw', 'trx', 'amt')
+
+# Excel maksimum ~1 juta baris dan penulisannya lambat; ingest xlsx hanya untuk data kecil
+XLSX_MAX_ROWS = 100_000
+HTML_NODES = 300
+
+
+class Context:
+    """Data satu ukuran; turunan (edge, graf, metrik) dihitung sekali saat pertama diminta, tanpa diukur."""
+
+    def __init__(self, df, args, workdir):
+        self.df = df
+        self.args = args
+        self.workdir = workdir
+        self._cache = {}
+
+    def get(self, name):
+        if name not in self._cache:
+            self._cache[name] = getattr(self, f'_make_{name}')()
+        return self._cache[name]
+
+    def _make_edges_frame(self):
+        frame = self.df.copy()
+        frame[['source', 'target']] = build_edges(frame)
+        return frame
+
+    def _make_graph(self):
+        return CSRGraph.from_frame(self.get('edges_frame'))
+
+    def _make_metric_edges(self):
+        return metric_edges(self.df)
+
+    def _make_metric_graph(self):
+        return CSRGraph.from_aggregated(self.get('metric_edges'))
+
+    def _make_sampling(self):
+        # (k betweenness, k closeness); None = eksak
+        n = self.get('metric_graph').n_nodes
+        k = None if n <= self.args.exact_max_nodes else self.args.pivots
+        return k, k
+
+    def _make_df_metric(self):
+        graph = self.get('metric_graph')
+        k, closeness_k = self.get('sampling')
+        columns = degree_metrics(graph)
+        columns.update(MetricRunner(self.get('metric_edges'), workers=self.args.workers).run(
+            k=k, closeness_k=closeness_k, log=lambda msg: None)[0])
+        ranks = pagerank(graph)
+        for j, prefix in enumerate(PREFIXES):
+            columns[f'{prefix}_pagerank'] = ranks[:, j]
+        return pd.DataFrame({'node': graph.names, **columns})
+
+    def csv_path(self):
+        path = os.path.join(self.workdir, 'transactions.csv')
+        if not os.path.exists(path):
+            self.df.to_csv(path, index=False)
+        return path
+
+    def parquet_path(self):
+        path = os.path.join(self.workdir, 'transactions.parquet')
+        if not os.path.exists(path):
+            self.df.to_parquet(path, index=False)
+        return path
+
+
+def suite_ingest(ctx):
+    from txnet.store import ingest_workbook
+    from txnet.stream import stream_transactions
+
+    if len(ctx.df) <= XLSX_MAX_ROWS:
+        path = os.path.join(ctx.workdir, 'transactions.xlsx')
+        ctx.df.to_excel(path, index=False)
+        # Direktori cache baru tiap ulangan agar konversi benar-benar dijalankan
+        yield 'ingest.xlsx', lambda: ingest_workbook(path, cache_dir=tempfile.mkdtemp(dir=ctx.workdir))
+    parquet = ctx.parquet_path()
+    yield 'ingest.parquet', lambda: pd.read_parquet(parquet)
+    csv = ctx.csv_path()
+    yield 'ingest.stream_csv', lambda: stream_transactions(csv)
+
+
+def suite_edges(ctx):
+    yield 'edges.build', lambda: build_edges(ctx.df)
+    yield 'edges.metric_aggregate', lambda: metric_edges(ctx.df)
+
+
+def suite_graph(ctx):
+    frame = ctx.get('edges_frame')
+    yield 'graph.from_frame', lambda: CSRGraph.from_frame(frame)
+    edges = ctx.get('metric_edges')
+    yield 'graph.from_aggregated', lambda: CSRGraph.from_aggregated(edges)
+
+
+def suite_metrics(ctx):
+    graph = ctx.get('metric_graph')
+    edges = ctx.get('metric_edges')
+    k, closeness_k = ctx.get('sampling')
+    runner = MetricRunner(edges, workers=ctx.args.workers)
+    yield 'metrics.degree', lambda: degree_metrics(graph)
+    yield 'metrics.pagerank', lambda: pagerank(graph)
+    for prefix in PREFIXES:
+        yield f'metrics.betweenness.{prefix}', lambda prefix=prefix: runner.run(
+            prefixes=(prefix,), k=k, metrics=('betweenness',), log=lambda msg: None)
+        yield f'metrics.closeness.{prefix}', lambda prefix=prefix: runner.run(
+            prefixes=(prefix,), metrics=('closeness',), closeness_k=closeness_k, log=lambda msg: None)
+
+
+def suite_sensitivity(ctx):
+    from txnet.sensitivity import priority_tables
+
+    df_metric2 = normalize(ctx.get('df_metric'))
+    for basis in ('amt', 'trx'):
+        yield f'sensitivity.{basis}', lambda basis=basis: priority_tables(df_metric2, basis, k=20, n_samples=200)
+
+
+def _network(graph, nodes):
+    # Graf PyVis node bervolume terbesar seperti tab Dashboard (posisi tetap, tanpa fisika)
+    from pyvis.network import Network
+
+    net = Network(height="600px", width="100%", directed=True, notebook=False, bgcolor="#ffffff", font_color="#252525")
+    degree = graph.degree()
+    max_degree = max(int(degree[nodes].max()), 1)
+    for node in nodes:
+        name = graph.names[node]
+        net.add_node(int(node), label=name, title=name, size=15 + degree[node] / max_degree * 100,
+                     color="#FFC700" if "(B1)" in name else "#547792")
+    for e in graph.edges_within(nodes):
+        net.add_edge(int(graph.src[e]), int(graph.dst[e]), width=2, color="#0078D4",
+                     title=f"Amount: {graph.amount[e]:,.2f} IDR\nTrx: {graph.trx[e]}")
+    net.toggle_physics(False)
+    return net
+
+
+def suite_html(ctx):
+    from txnet.payload import network_payload_html
+    from txnet.render import network_html
+
+    graph = ctx.get('graph')
+    nodes = np.sort(top_k(node_volume(graph, 'total'), HTML_NODES, candidates=graph.active_nodes()))
+    yield 'html.build', lambda: _network(graph, nodes)
+    net = _network(graph, nodes)
+    yield 'html.pyvis', lambda: network_html(net)
+    yield 'html.payload', lambda: network_payload_html(net)
+
+
+def run_size(label, rows, args, log=print):
+    start = time.perf_counter()
+    df = heavy_tailed_transactions(rows, seed=args.seed)
+    log(f"[{label}] {rows:,} baris dibuat dalam {time.perf_counter() - start:.1f}s")
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        ctx = Context(df, args, workdir)
+        graph = ctx.get('metric_graph')
+        shape = {'size': label, 'rows': rows, 'nodes': graph.n_nodes, 'edges': graph.n_edges}
+        for suite in args.suites:
+            for case, func in globals()[f'suite_{suite}'](ctx):
+                seconds, _ = timeit(func, repeat=args.repeat)
+                results.append({**shape, 'suite': suite, 'case': case, 'seconds': seconds})
+                log(f"[{label}] {case:<28} {seconds:>9.3f}s")
+    return results
+
+
+def environment(args):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'workers': args.workers,
+        'pivots': args.pivots,
+        'exact_max_nodes': args.exact_max_nodes,
+    }
+
+
+def compare(old, new, threshold, min_seconds=0.01):
+    """Baris perbandingan per (ukuran, kasus) yang ada di kedua hasil; ``regression`` bila melambat."""
+    before = {(r['size'], r['case']): r['seconds'] for r in old['results']}
+    rows = []
+    for r in new['results']:
+        key = (r['size'], r['case'])
+        if key not in before:
+            continue
+        ratio = r['seconds'] / before[key] if before[key] > 0 else float('inf')
+        slower = ratio > 1 + threshold and r['seconds'] - before[key] > min_seconds
+        rows.append({'size': key[0], 'case': key[1], 'before': before[key], 'after': r['seconds'],
+                     'ratio': ratio, 'regression': slower})
+    return rows
+
+
+def print_comparison(rows, old, new):
+    print(f"\n{old['environment'].get('commit')} -> {new['environment'].get('commit')}")
+    print(f"{'ukuran':>6} {'kasus':<28} {'sebelum':>9} {'sesudah':>9} {'rasio':>7}")
+    for row in rows:
+        flag = '  REGRESI' if row['regression'] else ''
+        print(f"{row['size']:>6} {row['case']:<28} {row['before']:>9.3f} {row['after']:>9.3f} "
+              f"{row['ratio']:>6.2f}x{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['10k'], choices=list(SIZES))
+    parser.add_argument('--suites', nargs='+', default=list(SUITES), choices=SUITES)
+    parser.add_argument('--repeat', type=int, default=1, help='ambil waktu terbaik dari sekian ulangan')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--pivots', type=int, default=64, help='sumber sampel betweenness/closeness graf besar')
+    parser.add_argument('--exact-max-nodes', type=int, default=20_000)
+    parser.add_argument('--output', help='simpan hasil JSON')
+    parser.add_argument('--compare', help='hasil JSON versi sebelumnya sebagai pembanding')
+    parser.add_argument('--against', help='bandingkan --compare dengan file ini tanpa menjalankan benchmark')
+    parser.add_argument('--threshold', type=float, default=0.2, help='ambang regresi relatif (0.2 = 20%% lebih lambat)')
+    args = parser.parse_args(argv)
+
+    if args.against:
+        with open(args.against, encoding='utf-8') as f:
+            report = json.load(f)
+    else:
+        report = {'environment': environment(args), 'results': []}
+        for label in args.sizes:
+            report['results'] += run_size(label, SIZES[label], args)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"hasil -> {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(baseline, report, args.threshold)
+        print_comparison(rows, baseline, report)
+        if any(row['regression'] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
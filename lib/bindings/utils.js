@@ -186,4 +186,58 @@ function highlightFilter(filter) {
     }
   }
   selectNodes(selectedNodes)
-}
\ No newline at end of file
+}
+
+// Compact graph payload (txnet.payload): typed-array columns + shared string table
+var PAYLOAD_ARRAYS = { int32: Int32Array, uint32: Uint32Array, float32: Float32Array, float64: Float64Array };
+var PAYLOAD_MISSING = 0xffffffff;
+
+function decodePayloadColumn(column) {
+  var binary = atob(column.data);
+  var bytes = new Uint8Array(binary.length);
+  for (var i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return new PAYLOAD_ARRAYS[column.dtype](bytes.buffer);
+}
+
+function decodePayloadRecords(table, strings, nodeIds) {
+  var records = new Array(table.count);
+  for (var i = 0; i < table.count; i++) {
+    records[i] = {};
+  }
+  for (var key in table.columns) {
+    var column = table.columns[key];
+    var values = decodePayloadColumn(column);
+    // nested values (e.g. arrows) are parsed once per distinct string
+    var parsed = {};
+    for (var i = 0; i < table.count; i++) {
+      var value = values[i];
+      if (column.kind === "node") {
+        value = nodeIds[value];
+      } else if (column.kind === "string" || column.kind === "json") {
+        if (value === PAYLOAD_MISSING) continue;
+        if (column.kind === "json") {
+          if (!(value in parsed)) parsed[value] = JSON.parse(strings[value]);
+          value = parsed[value];
+        } else {
+          value = strings[value];
+        }
+      } else if (value !== value) {
+        continue; // NaN marks a missing attribute
+      }
+      records[i][key] = value;
+    }
+  }
+  return records;
+}
+
+function hydrateNetwork(container, payload, options) {
+  var nodeRecords = decodePayloadRecords(payload.nodes, payload.strings);
+  var nodeIds = nodeRecords.map(function (node) { return node.id; });
+  var edgeRecords = decodePayloadRecords(payload.edges, payload.strings, nodeIds);
+  nodes = new vis.DataSet(nodeRecords);
+  edges = new vis.DataSet(edgeRecords);
+  network = new vis.Network(container, { nodes: nodes, edges: edges }, options);
+  return network;
+}
@@ -1,12 +1,24 @@
 import streamlit as st
 import pandas as pd
-import networkx as nx
+import numpy as np
 import plotly.express as px
 from pyvis.network import Network
 import streamlit.components.v1 as components
-from networkx.exception import NetworkXError
-import os
-import tempfile
+
+from txnet import perf
+from txnet.community import CommunityOverview
+from txnet.cube import DashboardCube
+from txnet.dataset import GRAPH_COLUMNS, build_dataset, open_dataset
+from txnet.ego import EgoService
+from txnet.filters import FilterIndex
+from txnet.layout import entity_positions, level_of_detail
+from txnet.payload import network_payload_html
+from txnet.ranking import node_volume, top_k
+from txnet.render import RenderCache, cache_key, network_html
+from txnet.search import NodeSearch
+from txnet.sensitivity import ACQUISITION_METRICS, RETENTION_METRICS, priority_tables
+from txnet.store import file_digest
+from txnet.warmup import PrecomputeScheduler, VersionedCache
 
 # Konfigurasi halaman dengan tema yang lebih profesional
 st.set_page_config(
@@ -15,6 +27,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Rekaman waktu/baris/memori per tahap untuk rerun ini (None bila TXNET_PERF tidak di-set)
+perf_recorder = perf.start("dashboard")
+
 # CSS untuk styling dashboard seperti Power BI/Tableau
 st.markdown("""
 <style>
@@ -217,42 +232,263 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Panel perf tersembunyi: hanya saat instrumentasi aktif dan URL memuat ?perf=1.
+# Tempatnya dipesan sebelum tab; isinya ditulis setelah semua tahap selesai
+perf_panel = st.sidebar.container() if perf_recorder is not None and st.query_params.get("perf") else None
+
 # Tabs
 tabs = st.tabs(["📊 Dashboard", "🔍 Network Analysis", "🔍 Node Network"])
 
 # Load Data
-@st.cache_data
-def load_data():
-    df = pd.read_excel("UNAIR - GRAPH NEW.xlsx").drop_duplicates()
-    def get_transaction_direction(row):
-        if row['type'].upper() == 'INCOMING':
-            return pd.Series({
-                'source': f"{row['sender_recipient_name']} ({row['sender_recipient_bank']})",
-                'target': f"{row['debitor_name']} ({row['debitor_bank']})"
-            })
-        elif row['type'].upper() == 'OUTGOING':
-            return pd.Series({
-                'source': f"{row['debitor_name']} ({row['debitor_bank']})",
-                'target': f"{row['sender_recipient_name']} ({row['sender_recipient_bank']})"
-            })
-        return pd.Series({'source': None, 'target': None})
-
-    # Tambahkan kolom source & target
-    df[['source', 'target']] = df.apply(get_transaction_direction, axis=1)
-    graph_df = df[['source', 'target', 'amount_tx_idr', 'trx', 'type']]
-
-    # Hitung edges_df dari graph_df
-    edges_df = graph_df.copy()
-
-    # Hitung nodes_df dari source dan target unik
-    all_nodes = pd.unique(graph_df[['source', 'target']].values.ravel())
-    nodes_df = pd.DataFrame({'node': all_nodes})
-    
-    # Tambahkan kolom bank (ambil dari isi dalam kurung)
-    nodes_df['bank'] = nodes_df['node'].str.extract(r'\((.*?)\)')
-    return df, graph_df, nodes_df, edges_df
+DATA_FILE = "UNAIR - GRAPH NEW.xlsx"
+
+# Artefak per versi dataset (hash isi file sumber) dibagi semua sesi dan thread prekomputasi;
+# versi aktif + sebelumnya disimpan. Sengaja tanpa st.cache_*: thread latar tidak punya
+# ScriptRunContext Streamlit
+@st.cache_resource
+def get_artifacts():
+    return VersionedCache(keep=2)
+
+artifacts = get_artifacts()
+
+# Frame dan array graf dipublikasikan sekali per versi ke .cache/dataset lalu di-memory-map
+# read-only: semua sesi dan replika pada host yang sama berbagi halaman yang sama.
+def load_data(version):
+    def build():
+        dataset = open_dataset(version, lambda: build_dataset(DATA_FILE, version))
+        df = dataset.frame('transactions')
+        graph_df = dataset.frame('transactions', GRAPH_COLUMNS)
+
+        # edges_df hanya dibaca: cukup alias graph_df (tanpa salinan ketiga di memori)
+        edges_df = graph_df
+
+        # Node (kategori urut kemunculan) dan kode bank dari isi dalam kurung
+        nodes_df = dataset.frame('nodes')
+        return df, graph_df, nodes_df, edges_df, dataset.graph, dataset.arrays['positions']
+    return artifacts.get(version, 'data', build)
+
+# Indeks filter (amount terurut + bitmap tipe) dibagi antar sesi tanpa salinan per rerun
+def load_filter_index(version):
+    def build():
+        _, graph_df, _, _, graph, _ = load_data(version)
+        return FilterIndex.from_frame(graph_df, graph)
+    return artifacts.get(version, 'filter', build)
+
+# Layanan ego-network k-hop (cache per node set, depth, arah, fan-out)
+def load_ego_service(version):
+    return artifacts.get(version, 'ego', lambda: EgoService(load_data(version)[4]))
+
+# Indeks pencarian node (prefix + trigram) untuk pemilih node tab Node Network
+def load_node_search(version):
+    return artifacts.get(version, 'search', lambda: NodeSearch(load_data(version)[4]))
+
+SEARCH_PAGE_SIZE = 20
+
+# Cache HTML graf bersama untuk semua sesi (dikunci hash parameter tampilan)
+@st.cache_resource
+def get_render_cache():
+    return RenderCache(max_entries=64)
+
+render_cache = get_render_cache()
+
+# Di atas batas ini node bervolume kecil diringkas menjadi super-node per bank
+LOD_MAX_NODES = 300
+LAYOUT_SCALE = 1500
+
+# Agregat KPI & grafik tab Dashboard, dibangun sekali per versi dataset
+def load_cube(version):
+    return artifacts.get(version, 'cube', lambda: DashboardCube(load_data(version)[0]))
+
+# Komunitas + matriks aliran komunitas/bank per bobot, dibangun sekali per versi dataset
+def load_overview(version, weight):
+    return artifacts.get(version, ('overview', weight),
+                         lambda: CommunityOverview(load_data(version)[4], weight=weight))
+
+OVERVIEW_WEIGHTS = {"Berdasarkan Nominal": "amount", "Berdasarkan Frekuensi": "trx"}
+OVERVIEW_MAX_GROUPS = 40
+
+# Tabel metrik ternormalisasi (hasil python -m txnet.metrics)
+METRICS_FILE = "df_metric2.csv"
+
+# Tabel metrik dan skor prioritas dimemo per versi file metrik + kombinasi parameter (LRU terbatas)
+@st.cache_resource
+def get_priority_cache():
+    return RenderCache(max_entries=64)
+
+priority_cache = get_priority_cache()
+
+def load_metrics(version):
+    return priority_cache.get(cache_key("metrics", version), lambda: pd.read_csv(METRICS_FILE))
+
+def compute_priorities(version, basis, k, n_samples, thresh_ret, thresh_aq, ret_weights, aq_weights):
+    key = cache_key("priorities", version, basis, k, n_samples, thresh_ret, thresh_aq, ret_weights, aq_weights)
+    return priority_cache.get(key, lambda: priority_tables(
+        load_metrics(version), basis, k=k, n_samples=n_samples, seed=0,
+        thresh=(thresh_ret, thresh_aq), weights=(ret_weights, aq_weights)
+    ))
+
+# Nilai awal slider skoring (juga dipakai prekomputasi tabel prioritas default)
+SCORE_DEFAULTS = dict(k=20, n_samples=200, thresh_ret=0.8, thresh_aq=0.7, weight=1.0)
+
+def default_priorities(basis):
+    d = SCORE_DEFAULTS
+    return compute_priorities(
+        file_digest(METRICS_FILE), basis, d['k'], d['n_samples'], d['thresh_ret'], d['thresh_aq'],
+        (d['weight'],) * len(RETENTION_METRICS[basis]), (d['weight'],) * len(ACQUISITION_METRICS[basis])
+    )
 
-df, graph_df, nodes_df, edges_df = load_data()
+def show_graph(name, view_key, render, height):
+    # HTML graf dari cache (atau dirender), lalu dikirim ke iframe; keduanya diukur terpisah
+    with perf.stage(f"{name}.render"):
+        result = render_cache.get(view_key, render)
+    html = result[0] if isinstance(result, tuple) else result
+    with perf.stage(f"{name}.html") as s:
+        s.note(bytes=len(html))
+        components.html(html, height=height)
+    return result
+
+def overview_groups(version, vis_option, level):
+    # Ringkasan kelompok terurut volume + kelompok yang tampil di super-graf
+    overview = load_overview(version, OVERVIEW_WEIGHTS.get(vis_option, "amount"))
+    group_summary = overview.summary(level).sort_values('volume', ascending=False)
+    return overview, group_summary, group_summary.head(OVERVIEW_MAX_GROUPS)
+
+def overview_view(version, vis_option, level):
+    """Kunci cache + fungsi render super-graf komunitas/bank (tanpa drill-down)."""
+    def render():
+        overview, _, shown_groups = overview_groups(version, vis_option, level)
+        node_positions = load_data(version)[5]
+        groups = overview.groups(level)
+        ids = shown_groups.index.to_numpy()
+        # Posisi kelompok = titik tengah posisi anggotanya pada layout global
+        centers = np.zeros((groups.max() + 1, 2))
+        np.add.at(centers, groups, node_positions)
+        centers /= np.maximum(np.bincount(groups, minlength=len(centers)), 1)[:, None]
+        centers = centers[ids] - centers[ids].mean(axis=0)
+        centers *= LAYOUT_SCALE / max(np.abs(centers).max(), 1e-9)
+
+        net = Network(height="600px", width="100%", directed=True, notebook=False, bgcolor="#ffffff", font_color="#252525")
+        max_members = shown_groups['members'].max()
+        for (gid, row), (x, y) in zip(shown_groups.iterrows(), centers):
+            title = f"{row['label']}: {row['members']:,} node\nBank dominan: {row['top_bank']}\nVolume: Rp {row['volume']:,.0f}"
+            color = "#FFC700" if row['top_bank'] == "B1" else "#547792"
+            net.add_node(int(gid), label=row['label'], title=title, color=color, borderWidth=2,
+                         size=15 + 45 * np.sqrt(row['members'] / max_members), x=float(x), y=float(y))
+
+        flows = overview.flows(level)
+        flows = flows[flows['source'].isin(ids) & flows['target'].isin(ids) & (flows['source'] != flows['target'])]
+        log_amount = np.log1p(flows['amount_tx_idr'].to_numpy())
+        span = max(log_amount.max() - log_amount.min(), 1e-9) if len(flows) else 1.0
+        for flow, width in zip(flows.itertuples(), 1 + 9 * (log_amount - (log_amount.min() if len(flows) else 0)) / span):
+            title = f"Amount: {flow.amount_tx_idr:,.2f} IDR\nTrx: {flow.trx}\nEdge: {flow.edges}"
+            net.add_edge(int(flow.source), int(flow.target), width=float(width), title=title, color="#0078D4",
+                         arrows={"to": {"enabled": True, "scaleFactor": 1.0}})
+        net.toggle_physics(False)
+        return network_payload_html(net)
+
+    return cache_key("overview", version, vis_option, level), render
+
+def network_defaults(version):
+    """Nilai awal filter tab Network Analysis: rentang nominal penuh dan semua tipe transaksi."""
+    df = load_data(version)[0]
+    return (float(df['amount_tx_idr'].min()), float(df['amount_tx_idr'].max())), df['type'].unique().tolist()
+
+def network_view(version, top_n, amount_range, selected_types, expanded_banks):
+    """Kunci cache + fungsi render graf tab Network Analysis untuk satu kombinasi filter."""
+    def render():
+        # Graf teragregasi hanya dari baris terpilih
+        filter_index = load_filter_index(version)
+        filtered_rows = filter_index.select(amount_range, selected_types)
+        with perf.stage("network.graph", rows=len(filtered_rows)) as s:
+            G = filter_index.graph_for(filtered_rows)
+            s.note(edges=G.n_edges)
+
+        # Hitung nilai transaksi per node (masuk + keluar) dari array edge
+        node_tx_values = node_volume(G, 'total')
+
+        # Ambil top-N node
+        top_ids = top_k(node_tx_values, top_n, candidates=G.active_nodes())
+
+        # Level of detail: node teratas tampil individual, sisanya super-node per bank
+        entities, links, entity = level_of_detail(G, top_ids, LOD_MAX_NODES, expanded_banks)
+        positions = entity_positions(entities, entity, load_data(version)[5]) * LAYOUT_SCALE
+
+        # Visualisasi Network
+        net = Network(height="600px", width="100%", directed=True, notebook=False, bgcolor="#ffffff", font_color="#252525")
+
+        # Hitung degree (jumlah hubungan) per node
+        node_degrees = G.degree()
+        max_degree = node_degrees.max() if G.n_edges else 1
+
+        for row, (x, y) in zip(entities.itertuples(), positions):
+            if row.group is None:
+                degree = node_degrees[row.node_id]
+                size = 15 + (degree / max_degree * 100)  # skala proporsional berdasarkan degree
+                color = "#FFC700" if row.bank == "B1" else "#547792"
+                net.add_node(int(row.entity), label=row.label, size=size, title=row.label, color=color,
+                             borderWidth=2, x=float(x), y=float(y))
+            else:
+                title = f"{row.members} node bank {row.group} diringkas"
+                net.add_node(int(row.entity), label=row.label, size=15 + 5 * np.sqrt(row.members), title=title,
+                             color="#BBBBBB", shape="box", x=float(x), y=float(y))
+
+        for link in links.itertuples():
+            title = f"Amount: {link.amount_tx_idr:,.2f} IDR\nTrx: {link.trx} ({link.count} baris)\nType: {link.type}"
+            net.add_edge(int(link.source), int(link.target), width=2, title=title, color="#0078D4",
+                         arrows={"to": {"enabled": True, "scaleFactor": 1.5}})
+
+        net.toggle_physics(False)
+        # Node/edge dikirim sebagai typed array + tabel string (dihidrasi utils.js)
+        return network_payload_html(net)
+
+    key = cache_key("network", version, top_n, amount_range, sorted(selected_types), sorted(expanded_banks))
+    return key, render
+
+# Jumlah node teratas yang umum dipilih; tampilannya dirender lebih dulu di latar belakang
+WARM_TOP_N = (200, 100, 50)
+
+def warm_tasks(version):
+    """Artefak mahal satu versi dataset, urut prioritas, untuk penjadwal prekomputasi."""
+    yield "dataset", lambda: load_data(version)
+    yield "cube", lambda: load_cube(version)
+    yield "filter", lambda: load_filter_index(version)
+    for top_n in WARM_TOP_N:
+        def warm_network(top_n=top_n):
+            amount_range, types = network_defaults(version)
+            render_cache.get(*network_view(version, top_n, amount_range, types, []))
+        yield f"network.top{top_n}", warm_network
+    for vis_option in OVERVIEW_WEIGHTS:
+        for level in ("community", "bank"):
+            yield f"overview.{OVERVIEW_WEIGHTS[vis_option]}.{level}", \
+                lambda vis_option=vis_option, level=level: render_cache.get(*overview_view(version, vis_option, level))
+    for basis in ("amt", "trx"):
+        yield f"priorities.{basis}", lambda basis=basis: default_priorities(basis)
+    yield "search", lambda: load_node_search(version)
+    yield "ego", lambda: load_ego_service(version)
+
+# Penjadwal tunggal per proses: memantau file sumber dan menghangatkan versi baru di latar
+# belakang; rerun tetap memakai versi lama sampai semua artefak versi baru siap
+@st.cache_resource
+def get_scheduler():
+    return PrecomputeScheduler(lambda: file_digest(DATA_FILE), warm_tasks).start()
+
+scheduler = get_scheduler()
+DATASET_VERSION = scheduler.served()
+
+with perf.stage("load_data") as s:
+    df, graph_df, nodes_df, edges_df, graph, node_positions = load_data(DATASET_VERSION)
+    s.rows = len(df)
+
+filter_index = load_filter_index(DATASET_VERSION)
+ego_service = load_ego_service(DATASET_VERSION)
+node_search = load_node_search(DATASET_VERSION)
+
+with perf.stage("dashboard.cube", rows=len(df)):
+    cube = load_cube(DATASET_VERSION)
+
+pending, done, total = scheduler.status()
+if pending is not None:
+    st.sidebar.info(f"Data baru sedang disiapkan ({done}/{total}); sementara menampilkan versi {DATASET_VERSION[:8]}.")
 
 # Tab Dashboard
 with tabs[0]:
@@ -260,21 +496,14 @@ with tabs[0]:
     
         # --- Metrik Ringkasan Maybank ---
     if edges_df is not None and nodes_df is not None:
-        total_maybank_nodes = nodes_df[nodes_df['node'].str.contains(r'\(B1\)', na=False)].shape[0]
-        total_external_entities = nodes_df[~nodes_df['node'].str.contains(r'\(B1\)', na=False)].shape[0]
-        total_connections = edges_df.shape[0]
-
-        incoming_amount = edges_df[
-            (edges_df['type'] == 'INCOMING') &
-            (edges_df['target'].str.contains(r'\(B1\)', na=False))
-        ]['amount_tx_idr'].sum()
-
-        outgoing_amount = edges_df[
-            (edges_df['type'] == 'OUTGOING') &
-            (edges_df['source'].str.contains(r'\(B1\)', na=False))
-        ]['amount_tx_idr'].sum()
-        
-        total_volume = incoming_amount + outgoing_amount
+        # Semua angka dibaca dari cube (tanpa scan regex per rerun)
+        total_maybank_nodes = cube.home_nodes
+        total_external_entities = cube.external_nodes
+        total_connections = cube.total_connections
+
+        incoming_amount = cube.incoming_amount
+        outgoing_amount = cube.outgoing_amount
+        total_volume = cube.total_volume
 
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -334,27 +563,13 @@ with tabs[0]:
     else:
         st.warning("Data belum tersedia. Pastikan file 'nodes.csv' dan 'edges.csv' ada.")
 
-    # Total uang masuk dan keluar
-    incoming_amount = edges_df[edges_df['type'] == 'INCOMING']['amount_tx_idr'].sum()
-    outgoing_amount = edges_df[edges_df['type'] == 'OUTGOING']['amount_tx_idr'].sum()
-    
-    # Identifikasi top bank partners
-    bank_partners = edges_df['source'].str.extract(r'\((B\d+)\)')[0].value_counts().reset_index()
-    bank_partners.columns = ['Bank', 'Count']
-    bank_partners = bank_partners[bank_partners['Bank'] != 'B1']  # Exclude Maybank
-    
-
     # --- Visualisasi: Bar & Pie & Top Bank Partners ---
     st.markdown("<h3 style='color: #FFFFFF; margin-top: 30px;'>🔍 Transaction Insights</h3>", unsafe_allow_html=True)
     col5, col6, col7 = st.columns(3)
 
     with col5:
         st.markdown("#### Top 5 Transaksi Tertinggi")
-        top5_df = df.sort_values(by="amount_tx_idr", ascending=False).head(5)
-        top5_df["label"] = top5_df.apply(
-            lambda row: f"{row['debitor_name']} ({row['debitor_bank']}) → {row['sender_recipient_name']} ({row['sender_recipient_bank']})",
-            axis=1
-        )
+        top5_df = cube.top_transactions.head(5)
         fig = px.bar(
             top5_df,
             x="amount_tx_idr",
@@ -402,10 +617,7 @@ with tabs[0]:
     # --- Distribusi Tipe Transaksi ---
     with col6:
         st.markdown("#### Distribusi Tipe Transaksi")
-        type_summary = df.groupby('type').agg(
-            Count=('type', 'count'),
-            Total_Amount=('amount_tx_idr', 'sum')
-        ).reset_index().rename(columns={'type': 'Type'})
+        type_summary = cube.type_summary
 
         fig = px.pie(
             type_summary,
@@ -440,19 +652,7 @@ with tabs[0]:
     with col7:
         st.markdown("#### Top Bank Partners")
 
-        partner_stats = edges_df.copy()
-        partner_stats['Bank'] = partner_stats['source'].str.extract(r'\((B\d+)\)')[0]
-
-        bank_partners = (
-            partner_stats.groupby('Bank')
-            .agg(
-                Count=('Bank', 'size'),
-                Total_Amount=('amount_tx_idr', 'sum')
-            )
-            .reset_index()
-        )
-        bank_partners = bank_partners[bank_partners['Bank'] != 'B1']
-        top_banks = bank_partners.sort_values('Count', ascending=False).head(10)
+        top_banks = cube.top_banks(10)
 
         fig = px.bar(
             top_banks,
@@ -496,53 +696,108 @@ with tabs[0]:
     st.markdown("<h3 style='color: #FFFFFF; margin-top: 30px;'>🌐 Network Graph</h3>", unsafe_allow_html=True)
     vis_option = st.radio("Pilih Jenis Visualisasi:", ["Berdasarkan Nominal", "Berdasarkan Frekuensi"], horizontal=True)
 
-    vis_file = {
-        "Berdasarkan Nominal": "nominal.html",
-        "Berdasarkan Frekuensi": "frekuensi.html",
-    }.get(vis_option, "")
+    # Ringkasan struktur: super-graf komunitas/bank (puluhan elemen), anggota dibuka sesuai permintaan
+    col_level, col_drill = st.columns([1, 2])
+    with col_level:
+        level_label = st.radio("Tingkat Ringkasan", ["Komunitas", "Bank"], horizontal=True)
+    level = {"Komunitas": "community", "Bank": "bank"}[level_label]
+    with perf.stage("overview.load", rows=graph.n_edges):
+        overview, group_summary, shown_groups = overview_groups(DATASET_VERSION, vis_option, level)
+    with col_drill:
+        drill_group = st.selectbox(
+            "Telusuri Kelompok", [None] + shown_groups.index.tolist(), key=f"drill_{level}",
+            format_func=lambda g: "(Ringkasan semua kelompok)" if g is None else
+            f"{group_summary.at[g, 'label']} · {group_summary.at[g, 'members']:,} node · bank dominan {group_summary.at[g, 'top_bank']}"
+        )
 
-    try:
-        with open(vis_file, "r", encoding="utf-8") as f:
-            html_content = f.read()
-        components.html(html_content, height=650, scrolling=True)
-    except Exception as e:
-        st.error(f"Visualisasi tidak ditemukan. Pastikan file `{vis_file}` ada di direktori.")
+    def render_group_graph():
+        # Anggota kelompok terpilih (maks. LOD_MAX_NODES bervolume terbesar) dan edge di antaranya
+        members = overview.members(level, drill_group)
+        ids = np.sort(top_k(node_volume(graph, 'total'), LOD_MAX_NODES, candidates=members))
+        xy = node_positions[ids] - node_positions[ids].mean(axis=0)
+        xy *= LAYOUT_SCALE / max(np.abs(xy).max(), 1e-9)
+        degree = graph.degree()
+        max_degree = max(degree[ids].max(), 1)
+
+        net = Network(height="600px", width="100%", directed=True, notebook=False, bgcolor="#ffffff", font_color="#252525")
+        for node, (x, y) in zip(ids, xy):
+            name = graph.names[node]
+            color = "#FFC700" if "(B1)" in name else "#547792"
+            net.add_node(int(node), label=name, title=name, color=color, borderWidth=2,
+                         size=15 + degree[node] / max_degree * 100, x=float(x), y=float(y))
+        for e in graph.edges_within(ids):
+            title = f"Amount: {graph.amount[e]:,.2f} IDR\nTrx: {graph.trx[e]}\nType: {graph.edge_type(e)}"
+            net.add_edge(int(graph.src[e]), int(graph.dst[e]), width=2, title=title, color="#0078D4",
+                         arrows={"to": {"enabled": True, "scaleFactor": 1.5}})
+        net.toggle_physics(False)
+        return network_payload_html(net)
+
+    if drill_group is None:
+        st.caption(f"{len(shown_groups)} dari {len(group_summary):,} kelompok bervolume terbesar"
+                   + (f" · modularitas {overview.modularity:.3f}" if level == "community" else ""))
+        show_graph("overview", *overview_view(DATASET_VERSION, vis_option, level), height=600)
+    else:
+        n_members = int(group_summary.at[drill_group, 'members'])
+        st.caption(f"Menampilkan {min(n_members, LOD_MAX_NODES):,} dari {n_members:,} anggota "
+                   f"{group_summary.at[drill_group, 'label']} (volume terbesar)")
+        view_key = cache_key("overview-group", DATASET_VERSION, vis_option, level, int(drill_group))
+        show_graph("overview", view_key, render_group_graph, height=600)
 
     # Tabel setelah network graph
     st.markdown(f"<h3 style='color: #FFFFFF; margin-top: 30px;'>📄 Prioritas Retensi & Akuisisi {vis_option}</h3>", unsafe_allow_html=True)
 
-    # Mapping visualisasi ke file dan sheet
-    excel_data = {
-        "Berdasarkan Nominal": "berdasarkan_nominal.xlsx",
-        "Berdasarkan Frekuensi": "berdasarkan_frekuensi.xlsx",
-    }
+    # Basis metrik per visualisasi (amt = nominal, trx = frekuensi)
+    basis = {
+        "Berdasarkan Nominal": "amt",
+        "Berdasarkan Frekuensi": "trx",
+    }.get(vis_option, "amt")
+    ret_mets = RETENTION_METRICS[basis]
+    aqs_mets = ACQUISITION_METRICS[basis]
+
+    with st.expander("⚙️ Parameter Skoring", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            score_k = st.slider("Top-k per simulasi", 5, 100, SCORE_DEFAULTS['k'], key=f"k_{basis}")
+            thresh_ret = st.slider("Ambang Retensi", 0.0, 1.0, SCORE_DEFAULTS['thresh_ret'], 0.05, key=f"thr_ret_{basis}")
+            ret_weights = tuple(
+                st.slider(f"Bobot {m}", 0.0, 2.0, SCORE_DEFAULTS['weight'], 0.1, key=f"w_{m}") for m in ret_mets
+            )
+        with col2:
+            n_samples = st.slider("Jumlah Simulasi", 50, 2000, SCORE_DEFAULTS['n_samples'], 50, key=f"n_{basis}")
+            thresh_aq = st.slider("Ambang Akuisisi", 0.0, 1.0, SCORE_DEFAULTS['thresh_aq'], 0.05, key=f"thr_aq_{basis}")
+            aq_weights = tuple(
+                st.slider(f"Bobot {m}", 0.0, 2.0, SCORE_DEFAULTS['weight'], 0.1, key=f"w_{m}") for m in aqs_mets
+            )
 
-    selected_excel = excel_data.get(vis_option, "")
-    if selected_excel:
+    # Semua bobot 0 membuat skor tidak terdefinisi (core_candidates menolaknya)
+    zero_weights = [name for name, w in (("retensi", ret_weights), ("akuisisi", aq_weights)) if not any(w)]
+    if zero_weights:
+        st.warning(f"⚠️ Semua bobot metrik {' dan '.join(zero_weights)} bernilai 0; "
+                   "naikkan minimal satu bobot untuk menghitung prioritas.")
+    else:
         try:
-            xl = pd.ExcelFile(selected_excel)
+            core_ret, core_aq = compute_priorities(
+                file_digest(METRICS_FILE), basis, score_k, n_samples,
+                thresh_ret, thresh_aq, ret_weights, aq_weights
+            )
 
             col1, col2 = st.columns(2)
 
             with col1:
                 st.markdown("#### Prioritas Retensi")
-                top_retensi = xl.parse(xl.sheet_names[0]).head(10)
-                top_retensi.columns = ['Entity', 'Score']
+                top_retensi = core_ret.rename_axis('Entity').reset_index(name='Score')
                 st.dataframe(top_retensi, use_container_width=True)
 
             with col2:
                 st.markdown("#### Prioritas Akuisisi")
-                top_akuisisi = xl.parse(xl.sheet_names[1]).head(10)
-                top_akuisisi.columns = ['Entity', 'Score']
+                top_akuisisi = core_aq.rename_axis('Entity').reset_index(name='Score')
                 st.dataframe(top_akuisisi, use_container_width=True)
 
         except Exception as e:
-            st.error(f"Gagal memuat data dari file: {e}")
+            st.error(f"Gagal menghitung prioritas dari `{METRICS_FILE}`: {e}")
     
     # Penjelasan & Insight Berdasarkan Pilihan
     if vis_option == "Berdasarkan Nominal":
-        ret_mets = ['amt_in_deg', 'amt_betweenness', 'amt_pagerank']
-        aqs_mets = ['amt_out_deg', 'amt_closeness']
         st.markdown("### ℹ️ Deskripsi: Berdasarkan Nominal")
         st.markdown("""
         - **Retensi Metrics**: Mengukur *seberapa besar nilai uang (amount)* yang masuk ke node Maybank melalui:
@@ -560,8 +815,6 @@ with tabs[0]:
         """)
 
     elif vis_option == "Berdasarkan Frekuensi":
-        ret_mets = ['trx_in_deg', 'trx_betweenness', 'trx_pagerank']
-        aqs_mets = ['trx_out_deg','trx_closeness']
         st.markdown("### ℹ️ Deskripsi: Berdasarkan Frekuensi Transaksi")
         st.markdown("""
         - **Retensi Metrics**: Mengukur *seberapa sering transaksi masuk* ke Maybank:
@@ -588,129 +841,135 @@ with tabs[1]:
         all_nodes = pd.unique(df[['debitor_name', 'sender_recipient_name']].values.ravel('K'))
         top_n = st.slider("Jumlah Node Teratas", 5, len(all_nodes), 200)
 
-        min_amount = float(df['amount_tx_idr'].min())
-        max_amount = float(df['amount_tx_idr'].max())
+        (min_amount, max_amount), transaction_types = network_defaults(DATASET_VERSION)
         amount_range = st.slider("Rentang Nilai Transaksi", min_amount, max_amount, (min_amount, max_amount), format="%.0f")
 
-        transaction_types = df['type'].unique().tolist()
         selected_types = st.multiselect("Tipe Transaksi", transaction_types, default=transaction_types)
 
-    # Apply filters
-    filtered_df = df[
-        (df['amount_tx_idr'] >= amount_range[0]) &
-        (df['amount_tx_idr'] <= amount_range[1]) &
-        (df['type'].isin(selected_types))
-    ]
-
-    # Source-target column logic
-    if not filtered_df.empty:
-        filtered_df[['source', 'target']] = filtered_df.apply(
-            lambda row: pd.Series({
-                'source': f"{row['sender_recipient_name']} ({row['sender_recipient_bank']})",
-                'target': f"{row['debitor_name']} ({row['debitor_bank']})"
-            }) if row['type'].upper() == 'INCOMING' else pd.Series({
-                'source': f"{row['debitor_name']} ({row['debitor_bank']})",
-                'target': f"{row['sender_recipient_name']} ({row['sender_recipient_bank']})"
-            }),
-            axis=1
-        )
-    else:
-        st.warning("⚠️ Tidak ada data yang sesuai dengan filter yang dipilih.")
-        st.stop()
-
-    filtered_graph_df = filtered_df[['source', 'target', 'amount_tx_idr', 'trx', 'type']]
-    G = nx.from_pandas_edgelist(filtered_graph_df, 'source', 'target',
-                                edge_attr=['amount_tx_idr', 'trx', 'type'],
-                                create_using=nx.DiGraph())
-
-    # Hitung nilai transaksi per node
-    node_tx_values = {
-        node: sum(d['amount_tx_idr'] for _, _, d in G.in_edges(node, data=True)) +
-              sum(d['amount_tx_idr'] for _, _, d in G.out_edges(node, data=True))
-        for node in G.nodes()
-    }
+        # Grup bank yang ingin dibuka (klik di iframe tidak bisa mengirim balik ke server)
+        expanded_banks = []
+        if top_n > LOD_MAX_NODES:
+            expanded_banks = st.multiselect(
+                f"Perluas Grup Bank (di luar {LOD_MAX_NODES} node teratas diringkas per bank)",
+                sorted(nodes_df['bank'].dropna().unique(), key=lambda b: (len(b), b))
+            )
 
-    # Ambil top-N node
-    top_nodes = sorted(node_tx_values.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    top_node_names = [n for n, _ in top_nodes]
-    top_subgraph = G.subgraph(top_node_names)
-
-    # Visualisasi Network
-    net = Network(height="600px", width="100%", directed=True, notebook=False, bgcolor="#ffffff", font_color="#252525")
-
-    max_tx_value = max([v for _, v in top_nodes]) if top_nodes else 1
-
-    # Hitung degree (jumlah hubungan) per node
-    node_degrees = dict(G.degree())
-    max_degree = max(node_degrees.values()) if node_degrees else 1
-
-    for node in top_node_names:
-        degree = node_degrees.get(node, 0)
-        size = 15 + (degree / max_degree * 100)  # skala proporsional berdasarkan degree
-        color = "#FFC700" if "(B1)" in node else "#547792"
-        net.add_node(node, label=node, size=size, title=node, color=color, borderWidth=2)
-        
-    for source, target, attr in top_subgraph.edges(data=True):
-        width = 2  # Tetap
-        title = f"Amount: {attr.get('amount_tx_idr', 0):,.2f} IDR\nType: {attr.get('type', 'N/A')}"
-        net.add_edge(source, target, width=width, title=title, color="#0078D4", arrows={"to": {"enabled": True, "scaleFactor": 1.5}})
-
-    net.toggle_physics(True)
-    path = os.path.join(tempfile.gettempdir(), "network_graph.html")
-    net.save_graph(path)
-    with open(path, "r", encoding="utf-8") as f:
-        components.html(f.read(), height=600)
+    # Apply filters: posisi baris lewat binary search amount + bitmap tipe (tanpa salin frame)
+    with perf.stage("network.filter", rows=len(graph_df)) as s:
+        filtered_rows = filter_index.select(amount_range, selected_types)
+        s.note(selected=len(filtered_rows))
+
+    # Tanpa st.stop(): tab Node Network dan panel perf tetap dirender
+    if len(filtered_rows) == 0:
+        st.warning("⚠️ Tidak ada data yang sesuai dengan filter yang dipilih.")
+    else:
+        show_graph("network", *network_view(DATASET_VERSION, top_n, amount_range, selected_types, expanded_banks),
+                   height=600)
 
 # Tab 2 - Node Network Viewer
 with tabs[2]:
     st.markdown("### 🧠 Node Network Viewer")
 
-    # Buat Graph
-    G = nx.from_pandas_edgelist(graph_df, 'source', 'target', ['amount_tx_idr', 'trx', 'type'], create_using=nx.DiGraph())
-
-    # Ambil node dari graph G langsung
-    all_nodes = list(G.nodes())
-    node_connections = {node: G.degree(node) for node in all_nodes}
-    sorted_nodes = sorted(all_nodes, key=lambda x: node_connections[x], reverse=True)
+    # Graph CSR sudah dibangun sekali di load_data
+    G = graph
+
+    # Degree per node sudah dihitung di indeks pencarian
+    node_connections = node_search.scores['degree']
+
+    # Cari node di server; browser hanya menerima satu halaman hasil
+    col_query, col_bank, col_order, col_page = st.columns([3, 1, 1, 1])
+    with col_query:
+        search_query = st.text_input("Cari Node (nama, sebagian nama, atau kode bank)", "")
+    with col_bank:
+        bank_codes = sorted(nodes_df['bank'].dropna().unique(), key=lambda b: (len(b), b))
+        search_bank = st.selectbox("Bank", ["Semua"] + bank_codes)
+    with col_order:
+        order_labels = {"degree": "Jumlah Koneksi", "volume": "Volume Transaksi"}
+        search_order = st.selectbox("Urutkan Hasil", list(order_labels), format_func=order_labels.get)
+
+    search_args = dict(query=search_query, bank=None if search_bank == "Semua" else search_bank,
+                       order=search_order, page_size=SEARCH_PAGE_SIZE)
+    with perf.stage("node.search") as s:
+        page_ids, n_matches = node_search.search(page=0, **search_args)
+        s.rows = n_matches
+    n_pages = max(1, -(-n_matches // SEARCH_PAGE_SIZE))
+    with col_page:
+        search_page = st.number_input("Halaman", min_value=1, max_value=n_pages, value=1)
+    if search_page > 1:
+        page_ids, _ = node_search.search(page=search_page - 1, **search_args)
+
+    # Node yang sudah dipilih tetap menjadi opsi walau tidak ada di halaman hasil; node yang
+    # hilang setelah pergantian versi dataset dibuang dari pilihan
+    selected_before = st.session_state.get("selected_nodes", [])
+    known_before = [n for n in selected_before if n in G.names]
+    if len(known_before) != len(selected_before):
+        st.session_state["selected_nodes"] = known_before
+    options = list(dict.fromkeys(known_before + list(G.names[page_ids])))
+
+    def node_label(node):
+        node_id = G.names.get_indexer([node])[0]
+        return f"{node} ({node_connections[node_id]} koneksi)" if node_id >= 0 else node
 
-    # Buat list opsi untuk multiselect dengan label
-    node_options = [(node, f"{node} ({node_connections[node]} koneksi)") for node in sorted_nodes]
     selected_nodes = st.multiselect(
         "Pilih Beberapa Node untuk Dianalisis",
-        options=[opt[0] for opt in node_options],
-        format_func=lambda x: dict(node_options)[x]
+        options=options,
+        format_func=node_label,
+        key="selected_nodes"
     )
+    st.caption(f"{n_matches:,} node cocok · halaman {search_page} dari {n_pages}")
+
+    col_depth, col_direction, col_fanout, col_rank = st.columns(4)
+    with col_depth:
+        ego_depth = st.slider("Kedalaman Hop", 1, 3, 1)
+    with col_direction:
+        direction_labels = {"both": "Dua arah", "out": "Aliran keluar", "in": "Aliran masuk"}
+        ego_direction = st.selectbox("Arah", list(direction_labels), format_func=direction_labels.get)
+    with col_fanout:
+        ego_fanout = st.number_input("Maks. Tetangga per Node per Hop (0 = semua)", min_value=0, value=0, step=5)
+    with col_rank:
+        rank_labels = {"amount": "Nominal", "trx": "Frekuensi"}
+        ego_rank = st.selectbox("Urutkan Tetangga Berdasarkan", list(rank_labels), format_func=rank_labels.get)
 
     if selected_nodes:
-        # Bangun set semua node yang terhubung ke selected_nodes
-        connected_nodes = set(selected_nodes)
-        for node in selected_nodes:
-            connected_nodes.update(G.predecessors(node))
-            connected_nodes.update(G.successors(node))
-
-        subgraph = G.subgraph(connected_nodes)
-
-        # Visualisasi pakai PyVis
-        net = Network(height="600px", width="100%", directed=True, bgcolor="#ffffff", font_color="#000000")
-
-        for node in subgraph.nodes():
-            # Ambil kode bank dari nama node (dalam tanda kurung)
-            bank_code = node.split("(")[-1].replace(")", "").strip()
-            color = "#FFC700" if bank_code == "B1" else "#547792"
-            size = 25 if node in selected_nodes else 15
-            net.add_node(node, label=node, color=color, size=size)
-
-        for source, target, data in subgraph.edges(data=True):
-            label = f"Amount: {data.get('amount_tx_idr', 0):,.0f} IDR\nTrx: {data.get('trx', 0)}"
-            net.add_edge(source, target, title=label, value=data.get("trx", 1))
-
-        net.toggle_physics(True)
-        path = os.path.join(tempfile.gettempdir(), "selected_nodes_network.html")
-        net.save_graph(path)
-        components.html(open(path, "r", encoding="utf-8").read(), height=650)
+        def render_node_network():
+            # Node dalam k hop dari selected_nodes + edge terinduksi langsung dari array CSR
+            with perf.stage("node.ego") as s:
+                connected_nodes, node_hops, subgraph_edges = ego_service.query_names(
+                    selected_nodes, depth=ego_depth, direction=ego_direction,
+                    fanout=ego_fanout or None, rank_by=ego_rank
+                )
+                s.rows = len(subgraph_edges)
+
+            # Visualisasi pakai PyVis
+            net = Network(height="600px", width="100%", directed=True, bgcolor="#ffffff", font_color="#000000")
+
+            for node, hop in zip(G.names[connected_nodes], node_hops):
+                # Ambil kode bank dari nama node (dalam tanda kurung)
+                bank_code = node.split("(")[-1].replace(")", "").strip()
+                color = "#FFC700" if bank_code == "B1" else "#547792"
+                size = 25 if node in selected_nodes else 15
+                net.add_node(node, label=node, color=color, size=size, title=f"{node}\nHop: {hop}")
+
+            for edge in subgraph_edges:
+                source, target = G.names[G.src[edge]], G.names[G.dst[edge]]
+                label = f"Amount: {G.amount[edge]:,.0f} IDR\nTrx: {G.trx[edge]} ({G.count[edge]} baris)"
+                net.add_edge(source, target, title=label, value=int(G.trx[edge]))
+
+            net.toggle_physics(True)
+            return network_html(net), len(connected_nodes), len(subgraph_edges)
+
+        view_key = cache_key("node_network", DATASET_VERSION, sorted(selected_nodes),
+                             ego_depth, ego_direction, ego_fanout, ego_rank)
+        _, n_connected, n_connections = show_graph("node", view_key, render_node_network, height=650)
 
         # Statistik Jaringan
         st.markdown("### Network Statistics")
-        st.metric("Total Connected Nodes", len(subgraph.nodes()))
-        st.metric("Total Connections", len(subgraph.edges()))
-
+        st.metric("Total Connected Nodes", n_connected)
+        st.metric("Total Connections", n_connections)
+
+if perf_panel is not None:
+    with perf_panel.expander("⏱️ Perf", expanded=True):
+        st.caption(f"Log JSON per tahap ke stderr (logger txnet.perf); set {perf.LOG_ENV_VAR}=path untuk file.")
+        st.dataframe(perf_recorder.summary(), use_container_width=True, hide_index=True)
+        st.download_button("Unduh trace (Chrome/Perfetto)", perf_recorder.trace_json(),
+                           file_name="txnet-trace.json", mime="application/json")
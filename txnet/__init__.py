@@ -0,0 +1,16 @@
+"""Komponen inti analisis jaringan transaksi yang dipakai dashboard dan notebook."""
+
+from txnet.aggregate import aggregate_edges
+from txnet.edges import NODE_FORMAT, build_edges
+from txnet.graph import CSRGraph
+from txnet.ranking import node_volume, top_entities, top_k
+
+__all__ = [
+    "NODE_FORMAT",
+    "CSRGraph",
+    "aggregate_edges",
+    "build_edges",
+    "node_volume",
+    "top_entities",
+    "top_k",
+]
@@ -0,0 +1,44 @@
+"""Agregasi multi-edge: satu baris per pasangan (source, target).
+
+Pasangan yang muncul berkali-kali dijumlahkan (amount, trx), dihitung
+jumlah barisnya, serta dicatat nilai minimum/maksimum dan tipe pertama/terakhir.
+"""
+
+import pandas as pd
+
+
+def aggregate_edges(frame, source='source', target='target'):
+    """Agregasi vektor ``frame`` (kolom source/target kategorikal) per pasangan edge.
+
+    Hasilnya terurut berdasarkan kemunculan pertama pasangan dan memakai
+    kategori node yang sama dengan input.
+    """
+    src_cat, dst_cat = frame[source].array, frame[target].array
+    keep = (src_cat.codes >= 0) & (dst_cat.codes >= 0)
+    rows = pd.DataFrame({
+        'src': src_cat.codes[keep],
+        'dst': dst_cat.codes[keep],
+        'amount_tx_idr': frame['amount_tx_idr'].to_numpy()[keep],
+        'trx': frame['trx'].to_numpy()[keep],
+    })
+    aggs = dict(
+        amount_tx_idr=('amount_tx_idr', 'sum'),
+        trx=('trx', 'sum'),
+        count=('amount_tx_idr', 'size'),
+        amount_min=('amount_tx_idr', 'min'),
+        amount_max=('amount_tx_idr', 'max'),
+    )
+    has_type = 'type' in frame
+    if has_type:
+        type_codes, type_names = pd.factorize(frame['type'])
+        rows['type'] = type_codes[keep]
+        aggs.update(type_first=('type', 'first'), type_last=('type', 'last'))
+
+    edges = rows.groupby(['src', 'dst'], sort=False).agg(**aggs).reset_index()
+    if has_type:
+        for col in ('type_first', 'type_last'):
+            edges[col] = pd.Categorical.from_codes(edges[col], categories=pd.Index(type_names, dtype=object))
+    categories = src_cat.categories
+    edges.insert(0, source, pd.Categorical.from_codes(edges.pop('src'), categories=categories))
+    edges.insert(1, target, pd.Categorical.from_codes(edges.pop('dst'), categories=categories))
+    return edges
@@ -0,0 +1,89 @@
+"""Lapisan agregat (cube) untuk KPI dan grafik tab Dashboard.
+
+Dibangun sekali per versi dataset dari frame transaksi (kolom source/target
+kategorikal hasil ``build_edges``): kode bank per baris diambil dari kategori
+node (bukan regex per baris), lalu total dan jumlah transaksi dimaterialisasi
+per (bank source, bank target, tipe). KPI, distribusi tipe, mitra bank, dan
+top-N transaksi terbesar tinggal dibaca dari tabel kecil ini.
+"""
+
+import numpy as np
+import pandas as pd
+
+from txnet.labels import node_banks
+
+
+def _bank_column(column, node_bank):
+    # Kode bank per baris = kode bank kategori node (ekstraksi hanya atas kategori unik)
+    codes = column.array.codes
+    codes = np.where(codes >= 0, node_bank.codes[codes], -1)
+    return pd.Categorical.from_codes(codes, categories=node_bank.categories)
+
+
+def _top_rows(values, n):
+    # Posisi n nilai terbesar, urut menurun (seri: posisi terkecil dulu)
+    n = min(n, len(values))
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-values, n - 1)[:n] if n < len(values) else np.arange(len(values))
+    return top[np.lexsort((top, -values[top]))]
+
+
+class DashboardCube:
+    """Agregat tab Dashboard; semua atribut adalah tabel kecil siap tampil."""
+
+    def __init__(self, frame, home_bank='B1', top_n=50, source='source', target='target'):
+        self.home_bank = home_bank
+        # source/target berbagi kategori node yang sama (hasil build_edges)
+        node_bank = pd.Categorical(node_banks(frame[source].cat.categories))
+        source_bank, target_bank = _bank_column(frame[source], node_bank), _bank_column(frame[target], node_bank)
+        amount = frame['amount_tx_idr']
+
+        # Tabel fakta ringkas: per (bank source, bank target, tipe)
+        self.flows = (
+            pd.DataFrame({'source_bank': source_bank, 'target_bank': target_bank,
+                          'type': frame['type'], 'amount_tx_idr': amount.to_numpy()})
+            .groupby(['source_bank', 'target_bank', 'type'], observed=True)
+            .agg(count=('amount_tx_idr', 'size'), amount_tx_idr=('amount_tx_idr', 'sum'))
+            .reset_index()
+        )
+
+        # Node per bank (dari kategori node)
+        self.nodes_per_bank = pd.Series(node_bank).value_counts()
+        self.home_nodes = int(self.nodes_per_bank.get(home_bank, 0))
+        self.external_nodes = len(node_bank) - self.home_nodes
+        self.total_connections = len(frame)
+
+        # Arah terhadap bank sendiri: masuk = INCOMING ke bank sendiri, keluar = OUTGOING dari bank sendiri
+        is_type = frame['type'].to_numpy()
+        incoming = (is_type == 'INCOMING') & (np.asarray(target_bank) == home_bank)
+        outgoing = (is_type == 'OUTGOING') & (np.asarray(source_bank) == home_bank)
+        self.incoming_amount = amount[incoming].sum()
+        self.outgoing_amount = amount[outgoing].sum()
+        self.total_volume = self.incoming_amount + self.outgoing_amount
+
+        self.type_summary = frame.groupby('type', observed=True).agg(
+            Count=('type', 'count'),
+            Total_Amount=('amount_tx_idr', 'sum')
+        ).reset_index().rename(columns={'type': 'Type'})
+
+        partners = (
+            pd.DataFrame({'Bank': source_bank, 'amount_tx_idr': amount.to_numpy()})
+            .groupby('Bank', observed=True)
+            .agg(Count=('Bank', 'size'), Total_Amount=('amount_tx_idr', 'sum'))
+            .reset_index()
+        )
+        partners['Bank'] = partners['Bank'].astype(object)
+        self.bank_partners = partners[partners['Bank'] != home_bank]
+
+        # Top-N transaksi terbesar (argpartition, tanpa sort penuh)
+        top = frame.iloc[_top_rows(amount.to_numpy(), top_n)].copy()
+        if 'debitor_name' in top:
+            top['label'] = (top['debitor_name'].astype(str) + ' (' + top['debitor_bank'].astype(str) + ') → '
+                            + top['sender_recipient_name'].astype(str) + ' ('
+                            + top['sender_recipient_bank'].astype(str) + ')')
+        self.top_transactions = top
+
+    def top_banks(self, n=10):
+        """Mitra bank dengan jumlah transaksi terbanyak."""
+        return self.bank_partners.sort_values('Count', ascending=False).head(n)
@@ -0,0 +1,242 @@
+"""Dataset bersama lintas proses: frame dan array graf dipublikasikan sekali per versi.
+
+Satu versi dataset (hash isi file sumber) disimpan di ``DATASET_DIR/<versi>/``:
+
+- frame sebagai file Arrow IPC tanpa kompresi; kolom teks berulang disimpan
+  sebagai dictionary (kategori) sehingga kolom numerik dan kode kategori dibaca
+  langsung dari memory-map tanpa salinan;
+- array ``CSRGraph`` dan koordinat layout sebagai ``.npy`` yang dibuka
+  ``mmap_mode='r'``;
+- ``manifest.json`` ditulis terakhir.
+
+Publikasi ditulis ke direktori sementara lalu di-``rename`` (atomik); bila
+beberapa replika Streamlit membangun versi yang sama bersamaan, yang pertama
+menang dan sisanya memakai hasilnya. Halaman memory-map dibagi page cache OS,
+sehingga replika tambahan hanya menyalin tabel kecil (kategori, nama node
+untuk hash lookup) dan attach hampir instan.
+
+Contoh (publikasikan lebih dulu agar replika langsung attach):
+    python -m txnet.dataset "UNAIR - GRAPH NEW.xlsx"
+"""
+
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from txnet import perf
+from txnet.store import CACHE_DIR, HAS_ARROW, file_digest, read_sheet
+
+DATASET_DIR = os.path.join(CACHE_DIR, "dataset")
+
+# Dinaikkan bila isi/format dataset berubah agar versi lama tidak di-attach
+FORMAT_VERSION = 1
+
+# Versi yang disimpan per sumber (versi aktif + sebelumnya untuk proses yang masih memakainya)
+KEEP_VERSIONS = 2
+
+GRAPH_COLUMNS = ['source', 'target', 'amount_tx_idr', 'trx', 'type']
+
+
+class Dataset:
+    """Frame, graf, dan array satu versi dataset (read-only bila hasil ``attach``)."""
+
+    def __init__(self, version, frames, graph, arrays=None, path=None):
+        self.version = version
+        self.frames = frames
+        self.graph = graph
+        self.arrays = arrays or {}
+        self.path = path
+        # Kolom teks yang isinya sama (kategori source/target, nama node) dikonversi sekali
+        self._strings = []
+
+    def frame(self, name, columns=None):
+        """Frame ``name``; ``columns`` memilih kolom tanpa menyalin data (langsung dari file)."""
+        table = self.frames[name]
+        if isinstance(table, pd.DataFrame):
+            return table if columns is None else table[columns]
+        names = table.column_names if columns is None else columns
+        return pd.DataFrame({col: self._column(table.column(col)) for col in names}, copy=False)
+
+    def strings(self, array):
+        """``pd.Index`` objek untuk array string Arrow, dipakai bersama oleh kolom berisi sama."""
+        for known, index in self._strings:
+            if len(known) == len(array) and known.equals(array):
+                return index
+        index = pd.Index(array.to_numpy(zero_copy_only=False), dtype=object)
+        self._strings.append((array, index))
+        return index
+
+    def _column(self, column):
+        import pyarrow as pa
+
+        array = column.combine_chunks()
+        if pa.types.is_dictionary(array.type):
+            # Kode kategori = view ke memory-map; hanya kategori yang dikonversi
+            indices = array.indices.fill_null(-1) if array.null_count else array.indices
+            dtype = pd.CategoricalDtype(self.strings(array.dictionary))
+            return pd.Categorical.from_codes(indices.to_numpy(), dtype=dtype, validate=False)
+        if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+            return self.strings(array).to_numpy()
+        return array.to_numpy(zero_copy_only=False)
+
+
+def build_dataset(path, version=None):
+    """Bangun dataset dashboard dari file transaksi: frame transaksi + node, graf CSR, dan layout."""
+    with perf.stage("dataset.read") as s:
+        df = read_sheet(path).drop_duplicates()
+        s.rows = len(df)
+    return dataset_from_frame(df, version or file_digest(path))
+
+
+def dataset_from_frame(df, version):
+    """Dataset dari baris transaksi (sudah ``drop_duplicates``)."""
+    from txnet.edges import build_edges
+    from txnet.graph import CSRGraph
+    from txnet.labels import node_banks
+    from txnet.layout import compute_layout
+
+    df = df.reset_index(drop=True)
+    # Kolom source & target (vektor, node kategorikal)
+    with perf.stage("dataset.edges", rows=len(df)):
+        df[['source', 'target']] = build_edges(df)
+    # Graf CSR (id int32, multi-edge diagregasi)
+    with perf.stage("dataset.graph", rows=len(df)):
+        graph = CSRGraph.from_frame(df[GRAPH_COLUMNS])
+    nodes = pd.DataFrame({'node': graph.names.to_numpy(), 'bank': node_banks(graph.names)})
+    # Koordinat semua node (browser tanpa simulasi fisika)
+    with perf.stage("dataset.layout", rows=graph.n_nodes):
+        positions = compute_layout(graph)
+    return Dataset(version, {'transactions': df, 'nodes': nodes}, graph, {'positions': positions})
+
+
+def _version_dir(root, version):
+    return os.path.join(root, f"{version[:16]}-f{FORMAT_VERSION}")
+
+
+def _categorize(frame):
+    # Teks berulang -> kategori (dictionary Arrow); kolom unik (mis. nama node) tetap string
+    frame = frame.copy()
+    for col in frame.columns:
+        values = frame[col]
+        if values.dtype == object and len(values) and values.nunique() < len(values):
+            frame[col] = values.astype('category')
+    return frame
+
+
+def publish(dataset, root=DATASET_DIR):
+    """Tulis ``dataset`` ke ``root`` secara atomik; kembalikan direktori versi (milik siapa pun yang menang)."""
+    import pyarrow as pa
+
+    target = _version_dir(root, dataset.version)
+    if os.path.exists(os.path.join(target, "manifest.json")):
+        return target
+    os.makedirs(root, exist_ok=True)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    manifest = {"version": dataset.version, "format": FORMAT_VERSION, "frames": [], "arrays": [],
+                "graph": {"type_names": [str(t) for t in dataset.graph.type_names],
+                          "arrays": sorted(dataset.graph.to_arrays())}}
+    for name, frame in dataset.frames.items():
+        table = pa.Table.from_pandas(_categorize(frame), preserve_index=False)
+        with pa.OSFile(os.path.join(tmp, f"{name}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        manifest["frames"].append(name)
+    for name, values in dataset.graph.to_arrays().items():
+        np.save(os.path.join(tmp, f"graph.{name}.npy"), np.ascontiguousarray(values))
+    for name, values in dataset.arrays.items():
+        np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(values))
+        manifest["arrays"].append(name)
+    with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        # Proses lain sudah mempublikasikan versi ini lebih dulu
+        shutil.rmtree(tmp, ignore_errors=True)
+    return target
+
+
+def attach(version, root=DATASET_DIR):
+    """Buka versi yang sudah dipublikasikan (read-only, memory-map); ``None`` bila belum ada."""
+    import pyarrow as pa
+
+    from txnet.graph import CSRGraph
+
+    path = _version_dir(root, version)
+    try:
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    frames = {name: pa.ipc.open_file(pa.memory_map(os.path.join(path, f"{name}.arrow"))).read_all()
+              for name in manifest["frames"]}
+    graph_arrays = {name: np.load(os.path.join(path, f"graph.{name}.npy"), mmap_mode="r")
+                    for name in manifest["graph"]["arrays"]}
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in manifest["arrays"]}
+    dataset = Dataset(version, frames, None, arrays, path)
+    names = dataset.strings(frames["nodes"].column("node").combine_chunks())
+    dataset.graph = CSRGraph.from_arrays(names, graph_arrays, manifest["graph"]["type_names"])
+    return dataset
+
+
+def purge(root=DATASET_DIR, keep=KEEP_VERSIONS):
+    """Hapus versi lama (terlama berdasarkan waktu publikasi) selain ``keep`` versi terbaru.
+
+    Proses yang masih memetakan file versi lama tetap aman: di POSIX file yang
+    dihapus tetap terbaca selama masih di-map.
+    """
+    pattern = re.compile(r"[0-9a-f]{16}-f\d+$")
+    try:
+        entries = [e for e in os.scandir(root) if e.is_dir() and pattern.match(e.name)]
+    except FileNotFoundError:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    for entry in entries[keep:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def open_dataset(version, build, root=DATASET_DIR):
+    """Attach versi ``version``; bila belum ada, ``build()`` lalu publikasikan dan attach.
+
+    Tanpa pyarrow hasil ``build()`` dipakai langsung (salinan per proses seperti sebelumnya).
+    """
+    if not HAS_ARROW:
+        return build()
+    with perf.stage("dataset.attach"):
+        dataset = attach(version, root)
+    if dataset is None:
+        built = build()
+        with perf.stage("dataset.publish"):
+            publish(built, root)
+            purge(root)
+        with perf.stage("dataset.attach"):
+            dataset = attach(version, root)
+    return dataset
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Publikasikan dataset dashboard ke penyimpanan bersama.")
+    parser.add_argument("input", nargs="?", default="UNAIR - GRAPH NEW.xlsx")
+    parser.add_argument("--root", default=DATASET_DIR)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    version = file_digest(args.input)
+    dataset = open_dataset(version, lambda: build_dataset(args.input, version), args.root)
+    print(f"{args.input}: {len(dataset.frame('transactions')):,} baris, {dataset.graph.n_nodes:,} node "
+          f"-> {dataset.path} ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Pembentukan edge (source -> target) dari baris transaksi secara vektor.
+
+Perspektif kolom ``type`` selalu dari sisi debitor:
+INCOMING  -> sender_recipient mengirim ke debitor
+OUTGOING  -> debitor mengirim ke sender_recipient
+Tipe lain tidak punya arah sehingga source/target-nya kosong (NaN).
+"""
+
+import numpy as np
+import pandas as pd
+
+NODE_FORMAT = "{name} ({bank})"
+
+
+def _pair_codes(names, banks):
+    # Faktorisasi nama & bank terpisah lalu gabungkan jadi satu kunci int64
+    name_codes, name_uniques = pd.factorize(names)
+    bank_codes, bank_uniques = pd.factorize(banks)
+    n_banks = len(bank_uniques)
+    valid = (name_codes >= 0) & (bank_codes >= 0)
+    codes = np.full(len(name_codes), -1, dtype=np.int64)
+    codes[valid], key_uniques = pd.factorize(name_codes[valid].astype(np.int64) * n_banks + bank_codes[valid])
+    name_idx, bank_idx = np.divmod(key_uniques, max(n_banks, 1))
+    return codes, np.asarray(name_uniques, dtype=object)[name_idx], np.asarray(bank_uniques, dtype=object)[bank_idx]
+
+
+def build_edges(df, node_format=NODE_FORMAT):
+    """Kembalikan DataFrame ``source``/``target`` (kategorikal) sejajar dengan ``df``.
+
+    Kategori node diurutkan berdasarkan kemunculan pertama (source lalu target per baris),
+    sama dengan urutan node ``nx.from_pandas_edgelist`` pada hasilnya.
+    """
+    n = len(df)
+    names = pd.concat([df['debitor_name'], df['sender_recipient_name']], ignore_index=True)
+    banks = pd.concat([df['debitor_bank'], df['sender_recipient_bank']], ignore_index=True)
+    codes, pair_names, pair_banks = _pair_codes(names, banks)
+    debitor, counterpart = codes[:n], codes[n:]
+
+    # Cukup upper() pada nilai unik kolom type
+    type_codes, type_uniques = pd.factorize(df['type'])
+    upper = pd.Index(type_uniques).astype(str).str.upper()
+    incoming = np.isin(type_codes, np.flatnonzero(upper == 'INCOMING'))
+    outgoing = np.isin(type_codes, np.flatnonzero(upper == 'OUTGOING'))
+
+    source = np.where(incoming, counterpart, np.where(outgoing, debitor, -1))
+    target = np.where(incoming, debitor, np.where(outgoing, counterpart, -1))
+
+    # Urutkan ulang kode node berdasarkan kemunculan pertama
+    interleaved = np.column_stack([source, target]).ravel()
+    order = pd.unique(interleaved[interleaved >= 0])
+    # Slot terakhir menampung kode -1 (baris tanpa arah) agar tetap -1
+    remap = np.full(len(pair_names) + 1, -1, dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    source, target = remap[source], remap[target]
+
+    labels = [node_format.format(name=name, bank=bank)
+              for name, bank in zip(pair_names[order], pair_banks[order])]
+    categories = pd.Index(labels, dtype=object)
+    return pd.DataFrame({
+        'source': pd.Categorical.from_codes(source, categories=categories),
+        'target': pd.Categorical.from_codes(target, categories=categories),
+    }, index=df.index)
@@ -0,0 +1,122 @@
+"""Indeks filter baris transaksi untuk tab Network Analysis.
+
+Filter rentang nominal memakai indeks amount terurut (binary search batas
+bawah/atas), filter tipe memakai bitmap baris per tipe yang dihitung sekali.
+Hasilnya array posisi baris (naik) tanpa menyalin DataFrame; graf untuk
+tampilan terfilter diagregasi langsung dari posisi tersebut ke edge graf
+penuh dengan ``np.bincount``.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Di bawah proporsi ini hasil jendela amount diurutkan langsung (O(k log k));
+# di atasnya dipakai mask baris (O(n) tanpa pengurutan)
+SORT_FRACTION = 1 / 16
+
+
+class FilterIndex:
+    """Indeks amount terurut + bitmap tipe untuk ``frame`` dan graf agregatnya."""
+
+    def __init__(self, graph, amount, trx, type_codes, type_names, edge_of_row):
+        self.graph = graph
+        self.amount = np.asarray(amount, dtype=np.float64)
+        self.trx = np.asarray(trx, dtype=np.int64)
+        self.type_codes = np.asarray(type_codes, dtype=np.int8)
+        self.type_names = list(type_names)
+        self.edge_of_row = np.asarray(edge_of_row, dtype=np.int64)
+
+        self.order = np.argsort(self.amount, kind='stable')
+        self.sorted_amount = self.amount[self.order]
+        # Peringkat amount per baris: jendela [lo, hi) menjadi satu perbandingan unsigned
+        self.rank = np.empty(len(self.order), dtype=np.uint32 if len(self.order) < 2**32 else np.uint64)
+        self.rank[self.order] = np.arange(len(self.order), dtype=self.rank.dtype)
+        self._type_masks = {}
+        self._full_rows = {}
+        # Baris tanpa edge valid (tipe lain) tidak pernah lolos filter tipe
+        valid = self.edge_of_row >= 0
+        self.n_valid = int(valid.sum())
+        self.type_bitmaps = {name: (self.type_codes == code) & valid for code, name in enumerate(self.type_names)}
+
+    @classmethod
+    def from_frame(cls, frame, graph, source='source', target='target'):
+        """Bangun indeks untuk ``frame`` (kolom source/target hasil ``build_edges``) dan ``graph``-nya."""
+        src, dst = frame[source].array.codes, frame[target].array.codes
+        n = np.int64(graph.n_nodes)
+        # Edge graf terurut (src, dst) sehingga kunci src * n + dst naik
+        keys = graph.src.astype(np.int64) * n + graph.dst
+        row_keys = src.astype(np.int64) * n + dst
+        edge_of_row = np.minimum(np.searchsorted(keys, row_keys), max(graph.n_edges - 1, 0))
+        matched = (src >= 0) & (dst >= 0) & (graph.n_edges > 0)
+        matched &= keys[edge_of_row] == row_keys if graph.n_edges else False
+        edge_of_row = np.where(matched, edge_of_row, -1)
+        type_codes, type_names = pd.factorize(frame['type'])
+        return cls(graph, frame['amount_tx_idr'].to_numpy(), frame['trx'].to_numpy(),
+                   type_codes, type_names, edge_of_row)
+
+    def __len__(self):
+        return len(self.amount)
+
+    def _type_mask(self, key):
+        # Gabungan bitmap per kombinasi tipe dihitung sekali
+        if key not in self._type_masks:
+            bitmaps = [self.type_bitmaps[t] for t in sorted(key)]
+            self._type_masks[key] = bitmaps[0] if len(bitmaps) == 1 else np.logical_or.reduce(bitmaps)
+        return self._type_masks[key]
+
+    def select(self, amount_range=None, types=None):
+        """Posisi baris (naik) dengan amount dalam ``amount_range`` (inklusif) dan tipe di ``types``.
+
+        Array hasil bisa dibagi antar pemanggilan; perlakukan sebagai read-only.
+        """
+        n = len(self.amount)
+        lo, hi = 0, n
+        if amount_range is not None:
+            lo = np.searchsorted(self.sorted_amount, amount_range[0], side='left')
+            hi = np.searchsorted(self.sorted_amount, amount_range[1], side='right')
+        if types is None:
+            types = self.type_names
+        key = frozenset(types) & set(self.type_bitmaps)
+        if hi <= lo or not key:
+            return np.empty(0, dtype=np.int64)
+        type_mask = self._type_mask(key)
+
+        if hi - lo < n * SORT_FRACTION:
+            rows = np.sort(self.order[lo:hi])
+            return rows[type_mask[rows]]
+        if lo == 0 and hi == n:
+            # Seluruh rentang: hasil per kombinasi tipe disimpan (dipakai ulang tanpa salin)
+            if key not in self._full_rows:
+                self._full_rows[key] = np.flatnonzero(type_mask)
+            return self._full_rows[key]
+        dtype = self.rank.dtype.type
+        mask = np.less(np.subtract(self.rank, dtype(lo)), dtype(hi - lo))
+        mask &= type_mask
+        return np.flatnonzero(mask)
+
+    def graph_for(self, rows):
+        """``CSRGraph`` teragregasi hanya dari baris ``rows`` (hasil ``select``).
+
+        Hasilnya sama dengan ``CSRGraph.from_frame(frame.iloc[rows])``: amount dan
+        trx dijumlahkan per edge sesuai urutan baris, tipe edge dari baris terakhir.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == self.n_valid:
+            return self.graph
+        edge = self.edge_of_row[rows]
+        if len(rows) < self.graph.n_edges * SORT_FRACTION:
+            # Seleksi kecil: padatkan id edge agar bincount tidak berukuran n_edge
+            edges, edge = np.unique(edge, return_inverse=True)
+            size = len(edges)
+        else:
+            edges, size = None, self.graph.n_edges
+        count = np.bincount(edge, minlength=size)
+        amount = np.bincount(edge, weights=self.amount[rows], minlength=size)
+        trx = np.bincount(edge, weights=self.trx[rows], minlength=size)
+        last = np.full(size, -1, dtype=np.int64)
+        np.maximum.at(last, edge, rows)
+        if edges is None:
+            edges = np.flatnonzero(count)
+            count, amount, trx, last = count[edges], amount[edges], trx[edges], last[edges]
+        return self.graph.edge_subset(edges, amount, trx.astype(np.int64), count,
+                                      self.type_codes[last], self.type_names)
@@ -0,0 +1,185 @@
+"""Graf berarah ringkas berbasis array CSR/CSC.
+
+Nama node di-intern menjadi id int32 (urutan kategori ``source``/``target``),
+adjacency keluar disimpan sebagai CSR dan adjacency masuk sebagai CSC,
+dengan bobot per edge ``amount_tx_idr`` dan ``trx`` (hasil agregasi) dalam array NumPy.
+"""
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+from txnet.aggregate import aggregate_edges
+
+# Atribut array CSRGraph (urutan edge dan indeks CSR/CSC) yang cukup disimpan apa adanya
+ARRAY_FIELDS = ('src', 'dst', 'amount', 'trx', 'count', 'types', 'indptr', 'in_edges', 'in_indptr')
+
+
+class CSRGraph:
+    """Graf berarah berbobot dengan satu edge per pasangan (source, target).
+
+    Edge disimpan terurut berdasarkan (src, dst). ``in_edges`` berisi id edge
+    terurut berdasarkan dst sehingga edge masuk node ``v`` adalah
+    ``in_edges[in_indptr[v]:in_indptr[v + 1]]``.
+    """
+
+    def __init__(self, names, src, dst, amount, trx, count=None, types=None, type_names=()):
+        self.names = pd.Index(names, dtype=object)
+        n = len(self.names)
+
+        order = np.lexsort((dst, src))
+        self.src = np.asarray(src, dtype=np.int32)[order]
+        self.dst = np.asarray(dst, dtype=np.int32)[order]
+        self.amount = np.asarray(amount, dtype=np.float64)[order]
+        self.trx = np.asarray(trx, dtype=np.int64)[order]
+        self.count = np.ones(len(order), dtype=np.int64) if count is None else np.asarray(count, dtype=np.int64)[order]
+        self.types = None if types is None else np.asarray(types, dtype=np.int8)[order]
+        self.type_names = list(type_names)
+
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.src, minlength=n), out=self.indptr[1:])
+        self.in_edges = np.argsort(self.dst, kind='stable').astype(np.int64)
+        self.in_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.dst, minlength=n), out=self.in_indptr[1:])
+
+    @classmethod
+    def from_frame(cls, frame, source='source', target='target'):
+        """Bangun graf dari DataFrame dengan kolom source/target kategorikal (hasil ``build_edges``).
+
+        Pasangan (source, target) yang berulang digabung lewat ``aggregate_edges``:
+        amount dan trx dijumlahkan, ``count`` berisi jumlah baris transaksi,
+        dan tipe edge diambil dari baris terakhir.
+        """
+        return cls.from_aggregated(aggregate_edges(frame, source, target), source, target)
+
+    @classmethod
+    def from_aggregated(cls, edges, source='source', target='target'):
+        """Bangun graf dari hasil ``aggregate_edges`` (satu baris per pasangan)."""
+        src_cat, dst_cat = edges[source].array, edges[target].array
+        types, type_names = None, ()
+        if 'type_last' in edges:
+            types, type_names = pd.factorize(edges['type_last'])
+        return cls(src_cat.categories, src_cat.codes, dst_cat.codes,
+                   edges['amount_tx_idr'].to_numpy(), edges['trx'].to_numpy(),
+                   edges['count'].to_numpy(), types, type_names)
+
+    @classmethod
+    def from_arrays(cls, names, arrays, type_names=()):
+        """Graf dari array hasil ``to_arrays`` (mis. memory-map read-only) tanpa mengurutkan ulang."""
+        graph = object.__new__(cls)
+        graph.names = pd.Index(names, dtype=object)
+        for name in ARRAY_FIELDS:
+            setattr(graph, name, arrays.get(name))
+        graph.type_names = list(type_names)
+        return graph
+
+    def to_arrays(self):
+        """Array penyusun graf (tanpa nama node) untuk disimpan atau dibagi antar proses."""
+        return {name: getattr(self, name) for name in ARRAY_FIELDS if getattr(self, name) is not None}
+
+    @property
+    def n_nodes(self):
+        return len(self.names)
+
+    @property
+    def n_edges(self):
+        return len(self.src)
+
+    def node_id(self, name):
+        return self.names.get_loc(name)
+
+    def node_ids(self, names):
+        ids = self.names.get_indexer(list(names))
+        return ids[ids >= 0]
+
+    def successors(self, node):
+        return self.dst[self.indptr[node]:self.indptr[node + 1]]
+
+    def predecessors(self, node):
+        return self.src[self.in_edges[self.in_indptr[node]:self.in_indptr[node + 1]]]
+
+    def out_degree(self):
+        return np.diff(self.indptr)
+
+    def in_degree(self):
+        return np.diff(self.in_indptr)
+
+    def degree(self):
+        return self.out_degree() + self.in_degree()
+
+    def _weights(self, weight):
+        return {'amount': self.amount, 'trx': self.trx, None: None}[weight]
+
+    def out_strength(self, weight='amount'):
+        return np.bincount(self.src, weights=self._weights(weight), minlength=self.n_nodes)
+
+    def in_strength(self, weight='amount'):
+        return np.bincount(self.dst, weights=self._weights(weight), minlength=self.n_nodes)
+
+    def strength(self, weight='amount'):
+        return self.out_strength(weight) + self.in_strength(weight)
+
+    def active_nodes(self):
+        """Id node yang punya minimal satu edge."""
+        return np.flatnonzero(self.degree() > 0)
+
+    def neighbors(self, nodes):
+        """Gabungan node, predecessor, dan successor-nya (id unik)."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        parts = [nodes]
+        for node in nodes:
+            parts.append(self.successors(node))
+            parts.append(self.predecessors(node))
+        return np.unique(np.concatenate(parts))
+
+    def edges_within(self, nodes):
+        """Id edge yang kedua ujungnya ada di ``nodes`` (subgraf terinduksi)."""
+        member = np.zeros(self.n_nodes, dtype=bool)
+        member[np.asarray(nodes, dtype=np.int64)] = True
+        return np.flatnonzero(member[self.src] & member[self.dst])
+
+    def adjacency(self, weights=None):
+        """Matriks adjacency ``scipy.sparse.csr_matrix`` (n_node x n_node) tanpa menyalin indeks."""
+        data = np.ones(self.n_edges) if weights is None else weights
+        return sp.csr_matrix((data, self.dst, self.indptr), shape=(self.n_nodes, self.n_nodes))
+
+    def weak_components(self):
+        """Label komponen terhubung lemah per node."""
+        _, labels = connected_components(self.adjacency(), directed=True, connection='weak')
+        return labels
+
+    def edge_subset(self, edges, amount, trx, count, types=None, type_names=None):
+        """Graf pada node yang sama dengan subset edge ``edges`` (id naik) dan bobot baru.
+
+        Urutan (src, dst) diturunkan dari graf induk; CSC juga diturunkan dari induk
+        (O(n_edge induk)) kecuali subset kecil yang cukup diurutkan ulang.
+        """
+        edges = np.asarray(edges, dtype=np.int64)
+        sub = object.__new__(CSRGraph)
+        sub.names = self.names
+        sub.src, sub.dst = self.src[edges], self.dst[edges]
+        sub.amount = np.asarray(amount, dtype=np.float64)
+        sub.trx = np.asarray(trx, dtype=np.int64)
+        sub.count = np.asarray(count, dtype=np.int64)
+        sub.types = None if types is None else np.asarray(types, dtype=np.int8)
+        sub.type_names = list(self.type_names if type_names is None else type_names)
+
+        n = self.n_nodes
+        sub.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sub.src, minlength=n), out=sub.indptr[1:])
+        if len(edges) * 16 < self.n_edges:
+            sub.in_edges = np.argsort(sub.dst, kind='stable').astype(np.int64)
+        else:
+            new_id = np.full(self.n_edges, -1, dtype=np.int64)
+            new_id[edges] = np.arange(len(edges))
+            in_edges = new_id[self.in_edges]
+            sub.in_edges = in_edges[in_edges >= 0]
+        sub.in_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sub.dst, minlength=n), out=sub.in_indptr[1:])
+        return sub
+
+    def edge_type(self, edge):
+        if self.types is None or self.types[edge] < 0:
+            return 'N/A'
+        return self.type_names[self.types[edge]]
@@ -0,0 +1,259 @@
+"""Pembaruan inkremental edge store dan metrik untuk batch transaksi baru.
+
+Store berisi edge teragregasi (``edges.parquet``), tabel metrik lengkap
+(``metrics.parquet``, kolom ``df_metric`` ditambah penanda ``stale``) dan sidik
+baris yang sudah pernah masuk (``seen.npy``) agar ``drop_duplicates`` tetap
+berlaku lintas batch.
+
+Saat delta diterapkan:
+- degree/strength dihitung ulang secara eksak dari edge store (vektor, murah);
+- PageRank diperbarui dengan warm start dari nilai sebelumnya (kriteria berhenti
+  ``WARM_START_TOL``; nilai saat ``build`` disempurnakan dengan kriteria yang sama);
+- betweenness/closeness hanya dihitung ulang di komponen terhubung lemah yang
+  tersentuh delta. Komponen lain tidak berubah, cukup diskalakan ulang karena
+  normalisasinya bergantung pada jumlah node total.
+
+Contoh:
+    python -m txnet.incremental init "UNAIR - GRAPH NEW.xlsx" --store .cache/metric_store
+    python -m txnet.incremental apply delta.xlsx --store .cache/metric_store --export
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from txnet.closeness import closeness
+from txnet.graph import CSRGraph
+from txnet.metrics import METRIC_COLUMNS, WEIGHTINGS, compute_metrics, degree_metrics, metric_edges, normalize
+from txnet.pagerank import pagerank
+from txnet.parallel import MetricRunner
+
+TRANSACTION_COLUMNS = [
+    'debitor_name', 'debitor_bank', 'sender_recipient_name', 'sender_recipient_bank',
+    'amount_tx_idr', 'trx', 'type',
+]
+
+
+def row_fingerprints(df):
+    """Hash 64-bit per baris transaksi (padanan ``drop_duplicates`` lintas batch)."""
+    return pd.util.hash_pandas_object(df[TRANSACTION_COLUMNS].astype(object), index=False).to_numpy()
+
+
+def read_transactions(path):
+    if path.endswith('.csv'):
+        return pd.read_csv(path)
+    from txnet.store import read_sheet
+    return read_sheet(path)
+
+
+def merge_edges(old, new):
+    """Gabungkan dua tabel hasil ``aggregate_edges`` (kolom source/target berupa string)."""
+    combined = pd.concat([old, new], ignore_index=True)
+    return combined.groupby(['source', 'target'], sort=False).agg(
+        amount_tx_idr=('amount_tx_idr', 'sum'),
+        trx=('trx', 'sum'),
+        count=('count', 'sum'),
+        amount_min=('amount_min', 'min'),
+        amount_max=('amount_max', 'max'),
+        type_first=('type_first', 'first'),
+        type_last=('type_last', 'last'),
+    ).reset_index()
+
+
+def _categorical_edges(edges):
+    # Urutan node = kemunculan pertama (source lalu target), sama seperti build_edges
+    nodes = pd.unique(np.column_stack([edges['source'], edges['target']]).ravel())
+    categories = pd.Index(nodes, dtype=object)
+    return edges.assign(
+        source=pd.Categorical(edges['source'], categories=categories),
+        target=pd.Categorical(edges['target'], categories=categories),
+    )
+
+
+def _component_edges(edges, ids):
+    # Edge di antara node ``ids`` (gabungan komponen utuh), id node dipetakan ulang ke 0..len(ids)-1;
+    # urutan edge dipertahankan agar traversal sama dengan graf penuh
+    src = edges['source'].array.codes
+    dst = edges['target'].array.codes
+    remap = np.full(len(edges['source'].cat.categories), -1)
+    remap[ids] = np.arange(len(ids))
+    keep = remap[src] >= 0
+    categories = edges['source'].cat.categories[ids]
+    return edges[keep].assign(
+        source=pd.Categorical.from_codes(remap[src[keep]], categories=categories),
+        target=pd.Categorical.from_codes(remap[dst[keep]], categories=categories),
+    )
+
+
+class MetricStore:
+    """Edge store + tabel metrik yang bisa diperbarui per batch."""
+
+    def __init__(self, path, edges, metrics, seen):
+        self.path = path
+        self.edges = edges
+        self.metrics = metrics
+        self.seen = seen
+
+    @classmethod
+    def build(cls, df, path, workers=1, log=print):
+        """Bangun store penuh dari seluruh transaksi (setara satu kali run ``txnet.metrics``)."""
+        df = df.drop_duplicates()
+        edges = metric_edges(df)
+        metrics = compute_metrics(df, workers=workers, log=log)
+        # PageRank disempurnakan ke kriteria warm start agar sama dengan hasil apply_delta berikutnya
+        graph = CSRGraph.from_aggregated(edges)
+        columns = [f'{prefix}_pagerank' for prefix in WEIGHTINGS]
+        metrics[columns] = pagerank(graph, weights=tuple(WEIGHTINGS), x0=metrics[columns].to_numpy())
+        metrics['stale'] = False
+        plain = edges.assign(source=edges['source'].astype(object), target=edges['target'].astype(object))
+        store = cls(path, plain, metrics, np.unique(row_fingerprints(df)))
+        store.save()
+        return store
+
+    @classmethod
+    def load(cls, path):
+        edges = pd.read_parquet(os.path.join(path, 'edges.parquet'))
+        metrics = pd.read_parquet(os.path.join(path, 'metrics.parquet'))
+        seen = np.load(os.path.join(path, 'seen.npy'))
+        return cls(path, edges, metrics, seen)
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        for name, frame in (('edges.parquet', self.edges), ('metrics.parquet', self.metrics)):
+            tmp = os.path.join(self.path, f'{name}.tmp')
+            frame.to_parquet(tmp, index=False)
+            os.replace(tmp, os.path.join(self.path, name))
+        np.save(os.path.join(self.path, 'seen.npy'), self.seen)
+        with open(os.path.join(self.path, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'nodes': len(self.metrics),
+                'edges': len(self.edges),
+                'rows': len(self.seen),
+                'stale_nodes': int(self.metrics['stale'].sum()),
+                'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }, f, indent=2)
+
+    def apply_delta(self, delta, recompute=True, workers=1):
+        """Terapkan baris transaksi baru; kembalikan ringkasan perubahan.
+
+        Dengan ``recompute=False`` betweenness/closeness di komponen yang tersentuh
+        hanya ditandai ``stale`` (nilai lama diskalakan) untuk dihitung ulang nanti.
+        """
+        fingerprints = row_fingerprints(delta)
+        fresh = ~pd.Series(fingerprints).duplicated().to_numpy() & ~np.isin(fingerprints, self.seen)
+        delta = delta[fresh]
+        summary = {'rows': int(fresh.sum()), 'duplicates': int((~fresh).sum())}
+        if delta.empty:
+            return summary
+
+        new_edges = metric_edges(delta)
+        touched = set(new_edges['source'].cat.categories)
+        new_edges = new_edges.assign(source=new_edges['source'].astype(object),
+                                     target=new_edges['target'].astype(object))
+        edges = _categorical_edges(merge_edges(self.edges, new_edges))
+        graph = CSRGraph.from_aggregated(edges)
+        nodes = graph.names
+        n_old, n = len(self.metrics), len(nodes)
+
+        old = self.metrics.set_index('node').reindex(nodes)
+        metrics = pd.DataFrame({'node': nodes})
+        for col, values in degree_metrics(graph).items():
+            metrics[col] = values
+
+        prefixes = tuple(WEIGHTINGS)
+        start = old[[f'{p}_pagerank' for p in prefixes]].fillna(1.0 / n).to_numpy()
+        ranks = pagerank(graph, weights=prefixes, x0=start)
+        for j, prefix in enumerate(prefixes):
+            metrics[f'{prefix}_pagerank'] = ranks[:, j]
+
+        # Komponen di luar delta: nilai lama hanya perlu dinormalisasi ulang ke n baru
+        labels = graph.weak_components()
+        affected = np.isin(labels, labels[nodes.get_indexer(list(touched))])
+        betw_scale = ((n_old - 1) * (n_old - 2)) / ((n - 1) * (n - 2)) if n > 2 and n_old > 2 else 0.0
+        close_scale = (n_old - 1) / (n - 1) if n > 1 else 0.0
+        for prefix in prefixes:
+            metrics[f'{prefix}_betweenness'] = old[f'{prefix}_betweenness'].fillna(0.0).to_numpy() * betw_scale
+            metrics[f'{prefix}_closeness'] = old[f'{prefix}_closeness'].fillna(0.0).to_numpy() * close_scale
+        metrics['stale'] = old['stale'].astype('boolean').fillna(True).to_numpy(dtype=bool) | affected
+
+        if recompute:
+            self._recompute(metrics, edges, np.flatnonzero(metrics['stale']), workers)
+
+        self.edges = edges.assign(source=edges['source'].astype(object), target=edges['target'].astype(object))
+        self.metrics = metrics[['node'] + METRIC_COLUMNS + ['stale']]
+        self.seen = np.union1d(self.seen, fingerprints[fresh])
+        summary.update(nodes=n, new_nodes=n - n_old, edges=len(edges),
+                       affected_nodes=int(affected.sum()), stale_nodes=int(self.metrics['stale'].sum()))
+        return summary
+
+    def _recompute(self, metrics, edges, ids, workers):
+        # Betweenness dan closeness eksak untuk node stale (komponen utuh), normalisasi n global
+        if not len(ids):
+            return
+        graph = CSRGraph.from_aggregated(edges)
+        nodes = graph.node_ids(metrics['node'].iloc[ids])
+        n, n_sub = graph.n_nodes, len(nodes)
+        betw = MetricRunner(_component_edges(edges, nodes), workers=workers).run(
+            prefixes=tuple(WEIGHTINGS), metrics=('betweenness',), log=lambda msg: None)[0]
+        # MetricRunner menormalisasi dengan n subgraf; skala ulang ke n seluruh graf
+        scale = ((n_sub - 1) * (n_sub - 2)) / ((n - 1) * (n - 2)) if n_sub > 2 else 0.0
+        for prefix in WEIGHTINGS:
+            metrics.loc[ids, f'{prefix}_betweenness'] = betw[f'{prefix}_betweenness'] * scale
+            metrics.loc[ids, f'{prefix}_closeness'] = closeness(graph, prefix, nodes=nodes)
+        metrics.loc[ids, 'stale'] = False
+
+    def recompute_stale(self, workers=1):
+        """Hitung ulang betweenness/closeness untuk semua node bertanda ``stale``."""
+        edges = _categorical_edges(self.edges)
+        metrics = self.metrics.copy()
+        ids = np.flatnonzero(metrics['stale'])
+        self._recompute(metrics, edges, ids, workers)
+        self.metrics = metrics
+        return len(ids)
+
+    def export(self, output='df_metric.csv', normalized_output='df_metric2.csv'):
+        df_metric = self.metrics[['node'] + METRIC_COLUMNS]
+        df_metric.to_csv(output)
+        normalize(df_metric).to_csv(normalized_output, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pembaruan inkremental edge store dan metrik.")
+    parser.add_argument('--store', default=os.path.join('.cache', 'metric_store'))
+    parser.add_argument('--workers', type=int, default=1)
+    sub = parser.add_subparsers(dest='command', required=True)
+    init = sub.add_parser('init', help='bangun store penuh dari file transaksi')
+    init.add_argument('input')
+    apply = sub.add_parser('apply', help='terapkan file delta dengan skema yang sama')
+    apply.add_argument('delta')
+    apply.add_argument('--no-recompute', action='store_true',
+                       help='hanya tandai betweenness/closeness komponen terdampak sebagai stale')
+    sub.add_parser('refresh', help='hitung ulang node stale')
+    for p in (init, apply, sub.choices['refresh']):
+        p.add_argument('--export', action='store_true', help='tulis df_metric.csv dan df_metric2.csv')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.command == 'init':
+        store = MetricStore.build(read_transactions(args.input), args.store, workers=args.workers)
+        print(f"store: {len(store.metrics)} node, {len(store.edges)} edge")
+    else:
+        store = MetricStore.load(args.store)
+        if args.command == 'apply':
+            summary = store.apply_delta(read_transactions(args.delta), recompute=not args.no_recompute,
+                                        workers=args.workers)
+            print(json.dumps(summary))
+        else:
+            print(f"{store.recompute_stale(workers=args.workers)} node dihitung ulang")
+        store.save()
+    if args.export:
+        store.export()
+    print(f"selesai dalam {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""Operasi vektor atas label node ``"N123 (B4)"`` / ``"N123|B4"``.
+
+Kode bank diekstrak sekali per label unik (``str.extract``) lalu dipetakan
+kembali lewat kode kategori. ``label_matrix`` menyimpan label sebagai matriks
+byte UTF-8 (untuk indeks trigram pencarian) tanpa array perantara int64.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Kode bank = teks setelah '(' atau '|' terakhir, sampai ')' / akhir label
+BANK_PATTERN = r'^.*[(|]([^)]*)'
+
+
+def label_matrix(names, lower=False):
+    """Label -> matriks (n, lebar) uint8 berisi UTF-8 (rata kiri, sisa diisi 0).
+
+    ``lower=True`` mengecilkan huruf ASCII.
+    """
+    encoded = np.asarray(pd.Series(names, dtype=object).str.encode('utf-8').to_numpy(), dtype=bytes)
+    width = max(encoded.dtype.itemsize, 3)
+    matrix = encoded.astype(f'S{width}').view(np.uint8).reshape(len(encoded), width)
+    if lower:
+        upper = (matrix >= ord('A')) & (matrix <= ord('Z'))
+        matrix[upper] += ord('a') - ord('A')
+    return matrix
+
+
+def node_banks(names):
+    """Kode bank (str, NaN bila tidak ada) dari nama node ``"N1 (B1)"`` atau ``"N1|B1"``."""
+    if len(names) == 0:
+        return np.empty(0, dtype=object)
+    codes, uniques = pd.factorize(pd.Series(names, dtype=object))
+    banks = pd.Series(uniques).str.extract(BANK_PATTERN, expand=False)
+    banks = banks.where(banks != '').to_numpy(dtype=object)
+    return banks[codes]
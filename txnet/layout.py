@@ -0,0 +1,183 @@
+"""Layout node yang dihitung sekali di server dan rendering level-of-detail.
+
+``compute_layout`` menghitung koordinat semua node satu kali per versi dataset:
+setiap komponen terhubung lemah ditata dengan Fruchterman-Reingold vektor
+(komponen kecil) atau layout spektral sparse (komponen besar), lalu komponen
+disusun berbaris menurut ukurannya. Dengan koordinat tetap, browser tidak perlu
+menjalankan simulasi fisika.
+
+``level_of_detail`` menampilkan node prioritas satu per satu dan meringkas
+sisanya menjadi super-node per bank.
+"""
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import ArpackNoConvergence, eigsh
+
+from txnet.labels import node_banks
+
+# Di atas ukuran ini komponen ditata spektral (FR padat berbiaya O(m^2) per iterasi)
+DENSE_LIMIT = 1500
+# Batas jumlah sel matriks (komponen x m x m) per batch FR
+BATCH_CELLS = 2_000_000
+
+
+def _fruchterman_reingold(adj, pos, iterations=50):
+    # adj: (c, m, m) simetris padat, pos: (c, m, 2); c komponen berukuran sama
+    # ditata bersamaan dan semua pasangan node dihitung sekaligus per iterasi
+    m = pos.shape[1]
+    k = np.sqrt(1.0 / m)
+    t = 0.1
+    dt = t / (iterations + 1)
+    for _ in range(iterations):
+        delta = pos[:, :, None, :] - pos[:, None, :, :]
+        distance = np.maximum(np.sqrt(np.einsum('cijk,cijk->cij', delta, delta)), 0.01)
+        force = k * k / distance ** 2 - adj * distance / k
+        disp = np.einsum('cijk,cij->cik', delta, force)
+        length = np.maximum(np.sqrt(np.einsum('cik,cik->ci', disp, disp)), 0.01)
+        pos = pos + disp * (t / length)[..., None]
+        t -= dt
+    return pos
+
+
+def _spectral(adj, rng):
+    # Dua vektor eigen terkecil non-trivial dari Laplacian ternormalisasi
+    degree = np.asarray(adj.sum(axis=1)).ravel()
+    d = sp.diags(1.0 / np.sqrt(np.maximum(degree, 1e-12)))
+    identity = sp.identity(adj.shape[0])
+    laplacian = identity - d @ adj @ d
+    try:
+        _, vectors = eigsh(laplacian, k=3, which='SM', tol=1e-3)
+    except ArpackNoConvergence:
+        # Nilai eigen Laplacian di [0, 2]: yang terkecil = yang terbesar dari 2I - L,
+        # dan ujung spektrum atas jauh lebih mudah konvergen bagi ARPACK
+        try:
+            values, vectors = eigsh(2 * identity - laplacian, k=3, which='LA', tol=1e-3)
+        except ArpackNoConvergence:
+            # Tetap gagal: posisi acak seperti awal FR, agar prekomputasi layout tidak berhenti
+            return rng.random((adj.shape[0], 2))
+        vectors = vectors[:, np.argsort(-values)]
+    return vectors[:, 1:3]
+
+
+def _normalize(pos):
+    pos = pos - pos.mean(axis=0)
+    scale = np.abs(pos).max()
+    return pos / scale if scale > 0 else pos
+
+
+def compute_layout(graph, seed=0, iterations=50):
+    """Koordinat (n_node, 2) float32 untuk seluruh node ``CSRGraph``."""
+    n = graph.n_nodes
+    rng = np.random.default_rng(seed)
+    adj = graph.adjacency()
+    sym = ((adj + adj.T) > 0).astype(np.float64).tocsr()
+    labels = graph.weak_components()
+    sizes = np.bincount(labels)
+    order = np.argsort(-sizes, kind='stable')
+    members = np.argsort(labels, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(sizes)])
+
+    # Posisi lokal tiap node di dalam komponennya
+    local_index = np.empty(n, dtype=np.int64)
+    local_index[members] = np.arange(n) - starts[labels[members]]
+    local = np.zeros((n, 2))
+
+    # Komponen kecil dikelompokkan per ukuran dan ditata dalam satu batch
+    edge_comp = labels[graph.src]
+    for m in np.unique(sizes[(sizes > 1) & (sizes <= DENSE_LIMIT)]):
+        comps = np.flatnonzero(sizes == m)
+        per_batch = max(1, BATCH_CELLS // (m * m))
+        for begin in range(0, len(comps), per_batch):
+            batch = comps[begin:begin + per_batch]
+            slot = np.full(len(sizes), -1)
+            slot[batch] = np.arange(len(batch))
+            adj = np.zeros((len(batch), m, m))
+            edges = np.flatnonzero(slot[edge_comp] >= 0)
+            c = slot[edge_comp[edges]]
+            i, j = local_index[graph.src[edges]], local_index[graph.dst[edges]]
+            adj[c, i, j] = adj[c, j, i] = 1.0
+            adj[:, np.arange(m), np.arange(m)] = 0.0
+            pos = _fruchterman_reingold(adj, rng.random((len(batch), m, 2)), iterations)
+            ids = np.flatnonzero(slot[labels] >= 0)
+            local[ids] = pos[slot[labels[ids]], local_index[ids]]
+    for comp in np.flatnonzero(sizes > DENSE_LIMIT):
+        ids = members[starts[comp]:starts[comp + 1]]
+        local[ids] = _spectral(sym[ids][:, ids], rng)
+
+    positions = np.zeros((n, 2))
+    # Penyusunan baris (shelf packing): radius komponen ~ sqrt(ukuran)
+    row_width = max(np.sqrt(sizes.sum()) * 2.5, 1.0)
+    x = y = row_height = 0.0
+    for comp in order:
+        ids = members[starts[comp]:starts[comp + 1]]
+        radius = np.sqrt(len(ids))
+        if x + 2 * radius > row_width and x > 0:
+            x, y, row_height = 0.0, y + row_height, 0.0
+        positions[ids] = _normalize(local[ids]) * radius + [x + radius, y + radius]
+        x += 2 * radius + 1
+        row_height = max(row_height, 2 * radius + 1)
+    return _normalize(positions).astype(np.float32)
+
+
+def level_of_detail(graph, node_ids, max_nodes, expanded=()):
+    """Node prioritas ditampilkan satu per satu; sisanya diringkas per bank.
+
+    ``node_ids`` terurut menurut prioritas. ``max_nodes`` node pertama (ditambah
+    semua anggota bank di ``expanded``) tampil individual. Kembalikan dua
+    DataFrame: entitas (node/grup) dan edge teragregasi antar entitas.
+    """
+    node_ids = np.asarray(node_ids, dtype=np.int64)
+    banks = node_banks(graph.names[node_ids])
+    detail = np.zeros(len(node_ids), dtype=bool)
+    detail[:max_nodes] = True
+    detail |= np.isin(banks, list(expanded))
+
+    group_codes, group_banks = pd.factorize(banks[~detail])
+    entity = np.full(graph.n_nodes, -1, dtype=np.int64)
+    n_detail = int(detail.sum())
+    entity[node_ids[detail]] = np.arange(n_detail)
+    entity[node_ids[~detail]] = n_detail + group_codes
+
+    entities = pd.DataFrame({
+        'entity': np.arange(n_detail + len(group_banks)),
+        'label': list(graph.names[node_ids[detail]]) + [f"{b} (+{c} node)" for b, c in
+                                                         zip(group_banks, np.bincount(group_codes, minlength=len(group_banks)))],
+        'group': [None] * n_detail + list(group_banks),
+        'bank': list(banks[detail]) + list(group_banks),
+        'members': np.concatenate([np.ones(n_detail, dtype=np.int64),
+                                   np.bincount(group_codes, minlength=len(group_banks))]),
+    })
+    entities['node_id'] = np.concatenate([node_ids[detail], np.full(len(group_banks), -1)])
+
+    edges = graph.edges_within(node_ids)
+    src, dst = entity[graph.src[edges]], entity[graph.dst[edges]]
+    keep = src != dst
+    links = pd.DataFrame({
+        'source': src[keep], 'target': dst[keep],
+        'amount_tx_idr': graph.amount[edges][keep], 'trx': graph.trx[edges][keep],
+        'count': graph.count[edges][keep],
+        'type': graph.types[edges][keep] if graph.types is not None else -1,
+    })
+    links = links.groupby(['source', 'target'], sort=False).agg(
+        amount_tx_idr=('amount_tx_idr', 'sum'), trx=('trx', 'sum'), count=('count', 'sum'),
+        type_min=('type', 'min'), type_max=('type', 'max'),
+    ).reset_index()
+    # Tipe edge: satu tipe bila seragam, selain itu "CAMPURAN"
+    type_names = np.array(list(graph.type_names) + ['N/A', 'CAMPURAN'], dtype=object)
+    code = np.where(links['type_min'] < 0, len(graph.type_names), links['type_min'])
+    code = np.where(links['type_min'] != links['type_max'], len(graph.type_names) + 1, code)
+    links['type'] = type_names[code]
+    links = links.drop(columns=['type_min', 'type_max'])
+    return entities, links, entity
+
+
+def entity_positions(entities, entity, positions):
+    """Posisi entitas: posisi node, atau rata-rata posisi anggota untuk super-node."""
+    valid = entity >= 0
+    n_entities = len(entities)
+    counts = np.bincount(entity[valid], minlength=n_entities)
+    sums = np.stack([np.bincount(entity[valid], weights=positions[valid, axis], minlength=n_entities)
+                     for axis in range(2)], axis=1)
+    return sums / np.maximum(counts, 1)[:, None]
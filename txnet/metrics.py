@@ -0,0 +1,157 @@
+"""Pipeline metrik sentralitas offline (pengganti sel notebook ``sdc-final.ipynb``).
+
+Menghasilkan 15 kolom ``df_metric.csv`` (degree, betweenness, closeness, PageRank
+untuk bobot unw/trx/amt) dan varian min-max ``df_metric2.csv``. Betweenness bisa
+diaproksimasi dengan sampel pivot (k sumber). Betweenness dan closeness semua
+pembobotan dijalankan ``txnet.parallel.MetricRunner`` (graf CSR di shared memory,
+potongan sumber dibagi ke pool proses); hasilnya sama untuk berapa pun worker.
+
+Contoh:
+    python -m txnet.metrics "UNAIR - GRAPH NEW.xlsx" --workers 8 --epsilon 0.01
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from txnet.aggregate import aggregate_edges
+from txnet.edges import build_edges
+from txnet.graph import CSRGraph
+from txnet.pagerank import pagerank
+from txnet.parallel import MetricRunner
+
+METRIC_NODE_FORMAT = "{name}|{bank}"
+
+# Prefix kolom -> atribut bobot edge (nama kolom notebook NetworkX)
+WEIGHTINGS = {'unw': None, 'trx': 'weight_trx', 'amt': 'weight_amount'}
+
+METRIC_COLUMNS = [
+    f"{prefix}_{metric}"
+    for prefix in WEIGHTINGS
+    for metric in ('in_deg', 'out_deg', 'betweenness', 'closeness', 'pagerank')
+]
+
+
+def metric_edges(df):
+    """Edge teragregasi dengan id node ``nama|bank`` (nama di-strip) seperti di notebook."""
+    df = df.assign(
+        debitor_name=df['debitor_name'].astype(str).str.strip(),
+        sender_recipient_name=df['sender_recipient_name'].astype(str).str.strip(),
+    )
+    df[['source', 'target']] = build_edges(df, node_format=METRIC_NODE_FORMAT)
+    return aggregate_edges(df)
+
+
+def pivot_count(n_nodes, epsilon, delta=0.1):
+    """Jumlah pivot agar galat aditif betweenness ternormalisasi <= epsilon dengan peluang 1 - delta.
+
+    Batas Hoeffding + union bound atas semua node: k >= ln(2n / delta) / (2 epsilon^2).
+    """
+    k = math.ceil(math.log(2 * n_nodes / delta) / (2 * epsilon ** 2))
+    return min(k, n_nodes)
+
+
+def degree_metrics(graph):
+    """Kolom in/out degree unw/trx/amt dari ``CSRGraph`` (vektor)."""
+    return {
+        'unw_in_deg': graph.in_degree(),
+        'unw_out_deg': graph.out_degree(),
+        'trx_in_deg': graph.in_strength('trx').astype(np.int64),
+        'trx_out_deg': graph.out_strength('trx').astype(np.int64),
+        'amt_in_deg': graph.in_strength('amount'),
+        'amt_out_deg': graph.out_strength('amount'),
+    }
+
+
+def compute_metrics(df, workers=1, k=None, seed=0, previous=None, closeness_k=None, log=print):
+    """Hitung 15 kolom metrik dari baris transaksi (sudah ``drop_duplicates``).
+
+    ``previous`` (opsional) adalah ``df_metric`` run sebelumnya; kolom PageRank-nya
+    dipakai sebagai warm start. ``closeness_k`` mengaktifkan closeness aproksimasi
+    dengan sumber sampel.
+    """
+    edges = metric_edges(df)
+    graph = CSRGraph.from_aggregated(edges)
+    nodes = list(graph.names)
+
+    columns = degree_metrics(graph)
+
+    def run_pagerank():
+        # Dijalankan di proses utama selagi worker menghitung betweenness/closeness
+        start = time.perf_counter()
+        ranks = pagerank(graph, weights=tuple(WEIGHTINGS), x0=_pagerank_start(graph, previous))
+        log(f"pagerank {time.perf_counter() - start:.2f}s")
+        return ranks
+
+    heavy, ranks = MetricRunner(edges, workers=workers).run(
+        prefixes=tuple(WEIGHTINGS), k=k, seed=seed, closeness_k=closeness_k, background=run_pagerank, log=log)
+    columns.update(heavy)
+    for j, prefix in enumerate(WEIGHTINGS):
+        columns[f'{prefix}_pagerank'] = ranks[:, j]
+
+    df_metric = pd.DataFrame({'node': nodes})
+    for col in METRIC_COLUMNS:
+        df_metric[col] = columns[col]
+    return df_metric
+
+
+def _pagerank_start(graph, previous):
+    # Vektor awal dari run sebelumnya; node baru diberi nilai seragam 1/n
+    if previous is None:
+        return None
+    cols = [f'{prefix}_pagerank' for prefix in WEIGHTINGS]
+    aligned = previous.set_index('node')[cols].reindex(graph.names)
+    return aligned.fillna(1.0 / graph.n_nodes).to_numpy()
+
+
+def normalize(df_metric, columns=METRIC_COLUMNS):
+    """Min-max scaling per kolom (setara ``MinMaxScaler``; kolom konstan menjadi 0)."""
+    df_metric2 = df_metric.copy()
+    values = df_metric[columns].astype(float)
+    span = values.max() - values.min()
+    df_metric2[columns] = (values - values.min()) / span.where(span != 0, 1.0)
+    return df_metric2
+
+
+def main(argv=None):
+    from txnet.store import read_sheet
+
+    parser = argparse.ArgumentParser(description="Hitung df_metric.csv dan df_metric2.csv.")
+    parser.add_argument('input', nargs='?', default="UNAIR - GRAPH NEW.xlsx")
+    parser.add_argument('--output', default='df_metric.csv')
+    parser.add_argument('--normalized-output', default='df_metric2.csv')
+    parser.add_argument('--workers', type=int, default=1, help='jumlah proses (0 = semua CPU)')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--pivots', type=int, help='jumlah sumber sampel untuk betweenness aproksimasi')
+    group.add_argument('--epsilon', type=float, help='batas galat aditif betweenness ternormalisasi')
+    parser.add_argument('--delta', type=float, default=0.1, help='peluang gagal untuk --epsilon')
+    parser.add_argument('--closeness-pivots', type=int, help='jumlah sumber sampel untuk closeness aproksimasi')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--warm-start', help='df_metric.csv sebelumnya untuk warm start PageRank')
+    args = parser.parse_args(argv)
+
+    if args.input.endswith('.csv'):
+        df = pd.read_csv(args.input)
+    else:
+        df = read_sheet(args.input)
+    df = df.drop_duplicates()
+
+    k = args.pivots
+    if args.epsilon is not None:
+        n_nodes = len(metric_edges(df)['source'].cat.categories)
+        k = pivot_count(n_nodes, args.epsilon, args.delta)
+        print(f"epsilon={args.epsilon} delta={args.delta} -> {k} pivot dari {n_nodes} node")
+
+    previous = pd.read_csv(args.warm_start, index_col=0) if args.warm_start else None
+    df_metric = compute_metrics(df, workers=args.workers, k=k, seed=args.seed, previous=previous,
+                                closeness_k=args.closeness_pivots)
+    df_metric.to_csv(args.output)
+    normalize(df_metric).to_csv(args.normalized_output, index=False)
+    print(f"{len(df_metric)} node -> {args.output}, {args.normalized_output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+"""Runner metrik paralel di atas graf CSR di shared memory.
+
+Adjacency keluar (CSR) dan masuk (CSC) disalin sekali ke satu blok
+``multiprocessing.shared_memory``; worker hanya menempel ke blok itu (tanpa
+salinan graf per worker) dan membaca array lewat ``memoryview``.
+
+Setiap metrik berat (betweenness dan closeness untuk unw/trx/amt) dipecah
+menjadi potongan sumber dengan jumlah potongan tetap, lalu semua potongan dari
+semua metrik dikirim ke satu pool proses. Pembagian sumber tidak bergantung pada
+jumlah worker dan hasil parsial digabung sesuai urutan potongan, sehingga hasil
+identik untuk berapa pun worker (termasuk jalur serial ``workers=1``).
+
+Traversal betweenness mengikuti langkah ``nx.betweenness_centrality`` (urutan
+tetangga = urutan penyisipan edge), sehingga urutan operasi floating point sama
+dengan NetworkX. Closeness memakai Dijkstra batch ``scipy.sparse.csgraph``
+(``txnet.closeness``) di atas jarak 1/bobot yang sudah dihitung sekali.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from itertools import count
+from multiprocessing import shared_memory
+
+import numpy as np
+import scipy.sparse as sp
+
+from txnet.closeness import (
+    inverse_distance,
+    row_closeness,
+    sample_sources,
+    sampled_closeness,
+    source_sums,
+    weak_labels,
+)
+
+# Jumlah potongan sumber per metrik (tetap, agar penggabungan deterministik)
+N_CHUNKS = 128
+
+_ALIGN = 64
+
+# Prefix metrik -> array bobot edge (None = tanpa bobot)
+WEIGHT_FIELDS = {'unw': None, 'trx': 'trx', 'amt': 'amount'}
+
+
+class SharedGraph:
+    """Adjacency CSR/CSC (urutan penyisipan edge) dalam satu blok shared memory.
+
+    Field: ``out_indptr``, ``out_nbr``, ``out_trx``, ``out_amount`` (bobot edge,
+    untuk betweenness) serta ``in_indptr``, ``in_nbr``, ``in_inv_trx``,
+    ``in_inv_amount`` (jarak 1/bobot graf terbalik, untuk closeness).
+    """
+
+    def __init__(self, shm, layout, n_nodes, owner=False):
+        self.shm = shm
+        self.layout = layout
+        self.n_nodes = n_nodes
+        self.owner = owner
+        self.arrays = {
+            name: np.ndarray((size,), dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, (offset, size, dtype) in layout.items()
+        }
+
+    @classmethod
+    def from_edges(cls, edges, source='source', target='target'):
+        """Salin hasil ``aggregate_edges`` (source/target kategorikal) ke shared memory."""
+        src = edges[source].array.codes.astype(np.int64)
+        dst = edges[target].array.codes.astype(np.int64)
+        n = len(edges[source].cat.categories)
+        trx = edges['trx'].to_numpy(dtype=np.float64)
+        amount = edges['amount_tx_idr'].to_numpy(dtype=np.float64)
+
+        out_order = np.argsort(src, kind='stable')
+        in_order = np.argsort(dst, kind='stable')
+        inv_trx, inv_amount = inverse_distance(trx), inverse_distance(amount)
+        data = {
+            'out_indptr': np.r_[0, np.cumsum(np.bincount(src, minlength=n))],
+            'out_nbr': dst[out_order],
+            'out_trx': trx[out_order],
+            'out_amount': amount[out_order],
+            'in_indptr': np.r_[0, np.cumsum(np.bincount(dst, minlength=n))],
+            'in_nbr': src[in_order],
+            'in_inv_trx': inv_trx[in_order],
+            'in_inv_amount': inv_amount[in_order],
+        }
+
+        layout, offset = {}, 0
+        for name, values in data.items():
+            layout[name] = (offset, len(values), values.dtype.str)
+            offset += -(-values.nbytes // _ALIGN) * _ALIGN
+        shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        graph = cls(shm, layout, n, owner=True)
+        for name, values in data.items():
+            graph.arrays[name][:] = values
+        return graph
+
+    @property
+    def spec(self):
+        """Deskriptor kecil (picklable) untuk ``attach`` di worker."""
+        return self.shm.name, self.layout, self.n_nodes
+
+    @classmethod
+    def attach(cls, spec):
+        name, layout, n_nodes = spec
+        return cls(shared_memory.SharedMemory(name=name), layout, n_nodes)
+
+    def views(self, *names):
+        return [memoryview(self.arrays[name]) for name in names]
+
+    def close(self):
+        self.arrays = {}
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- Kernel traversal (dijalankan di worker) ---
+
+def _bfs_paths(indptr, nbr, s):
+    # Langkah _single_source_shortest_path_basic NetworkX; state hanya untuk node tercapai
+    S, P, sigma, D = [], {s: []}, {s: 1.0}, {s: 0}
+    Q = deque([s])
+    while Q:
+        v = Q.popleft()
+        S.append(v)
+        Dv = D[v]
+        sigmav = sigma[v]
+        for i in range(indptr[v], indptr[v + 1]):
+            w = nbr[i]
+            if w not in D:
+                Q.append(w)
+                D[w] = Dv + 1
+                sigma[w] = 0.0
+                P[w] = []
+            if D[w] == Dv + 1:
+                sigma[w] += sigmav
+                P[w].append(v)
+    return S, P, sigma
+
+
+def _dijkstra_paths(indptr, nbr, weight, s):
+    # Langkah _single_source_dijkstra_path_basic NetworkX (termasuk sigma[s] += sigma[s])
+    S, P, sigma, D = [], {s: []}, {s: 1.0}, {}
+    seen = {s: 0}
+    c = count()
+    Q = [(0, next(c), s, s)]
+    while Q:
+        dist, _, pred, v = heappop(Q)
+        if v in D:
+            continue
+        sigma[v] += sigma[pred]
+        S.append(v)
+        D[v] = dist
+        for i in range(indptr[v], indptr[v + 1]):
+            w = nbr[i]
+            vw_dist = dist + weight[i]
+            if w not in D and (w not in seen or vw_dist < seen[w]):
+                seen[w] = vw_dist
+                heappush(Q, (vw_dist, next(c), v, w))
+                sigma[w] = 0.0
+                P[w] = [v]
+            elif vw_dist == seen[w]:
+                sigma[w] += sigma[v]
+                P[w].append(v)
+    return S, P, sigma
+
+
+_worker_graph = None
+_worker_matrices = {}
+
+
+def _attach_worker(spec):
+    global _worker_graph
+    _worker_graph = SharedGraph.attach(spec)
+
+
+def _distance_matrix(prefix, reverse):
+    # Matriks jarak csgraph di atas array shared memory, dibuat sekali per worker
+    key = (prefix, reverse)
+    if key not in _worker_matrices:
+        graph = _worker_graph
+        field = WEIGHT_FIELDS[prefix]
+        side = 'in' if reverse else 'out'
+        indptr, nbr = graph.arrays[f'{side}_indptr'], graph.arrays[f'{side}_nbr']
+        if field is None:
+            data = np.ones(len(nbr))
+        elif reverse:
+            data = graph.arrays[f'in_inv_{field}']
+        else:
+            data = inverse_distance(graph.arrays[f'out_{field}'])
+        n = graph.n_nodes
+        _worker_matrices[key] = sp.csr_matrix((data, nbr, indptr), shape=(n, n))
+    return _worker_matrices[key]
+
+
+def _betweenness_task(sources, prefix):
+    # Kontribusi mentah (tanpa normalisasi) dari sekumpulan sumber, _accumulate_basic NetworkX
+    graph = _worker_graph
+    indptr, nbr = graph.views('out_indptr', 'out_nbr')
+    field = WEIGHT_FIELDS[prefix]
+    weight = graph.views(f'out_{field}')[0] if field else None
+    partial = [0.0] * graph.n_nodes
+    for s in sources:
+        if weight is None:
+            S, P, sigma = _bfs_paths(indptr, nbr, s)
+        else:
+            S, P, sigma = _dijkstra_paths(indptr, nbr, weight, s)
+        delta = dict.fromkeys(S, 0)
+        while S:
+            w = S.pop()
+            coeff = (1 + delta[w]) / sigma[w]
+            for v in P[w]:
+                delta[v] += sigma[v] * coeff
+            if w != s:
+                partial[w] += delta[w]
+    return np.array(partial, dtype=np.float64)
+
+
+def _closeness_task(nodes, prefix):
+    # Closeness eksak: satu baris Dijkstra graf terbalik per node (csgraph, batch)
+    reverse = _distance_matrix(prefix, reverse=True)
+    if 'labels' not in _worker_matrices:
+        _worker_matrices['labels'] = weak_labels(reverse)
+    return row_closeness(reverse, nodes, labels=_worker_matrices['labels'])
+
+
+def _closeness_sample_task(sources, prefix):
+    # Closeness aproksimasi: jumlah pencapai dan jarak per node dari sumber sampel
+    return source_sums(_distance_matrix(prefix, reverse=False), sources)
+
+
+def _split(ids, n_chunks=N_CHUNKS):
+    # Potongan berselang (ids[i::n]) agar sumber mahal tersebar; tidak bergantung jumlah worker
+    n_chunks = max(1, min(n_chunks, len(ids)))
+    return [ids[i::n_chunks] for i in range(n_chunks)]
+
+
+class MetricRunner:
+    """Jalankan betweenness/closeness beberapa pembobotan sekaligus di satu pool proses."""
+
+    def __init__(self, edges, workers=1):
+        self.edges = edges
+        self.workers = max(1, int(workers or default_workers()))
+
+    def run(self, prefixes=tuple(WEIGHT_FIELDS), k=None, seed=0, metrics=('betweenness', 'closeness'),
+            closeness_k=None, background=None, log=print):
+        """Kembalikan dict ``{f'{prefix}_{metric}': array per node}``.
+
+        ``k``: jumlah pivot betweenness; ``closeness_k``: jumlah sumber sampel
+        closeness (aproksimasi). ``background`` (opsional) dipanggil di proses utama
+        selama worker bekerja, misalnya PageRank; hasilnya dikembalikan sebagai
+        elemen kedua.
+        """
+        with SharedGraph.from_edges(self.edges) as graph:
+            n = graph.n_nodes
+            sources = sample_sources(n, k, seed)
+            close_sources = sample_sources(n, closeness_k, seed)
+            sampled = len(close_sources) < n
+            tasks = []
+            for prefix in prefixes:
+                if 'betweenness' in metrics:
+                    tasks += [(f'{prefix}_betweenness', _betweenness_task, chunk, prefix)
+                              for chunk in _split(sources.tolist())]
+                if 'closeness' in metrics and sampled:
+                    tasks += [(f'{prefix}_closeness', _closeness_sample_task, chunk, prefix)
+                              for chunk in _split(close_sources)]
+                elif 'closeness' in metrics:
+                    tasks += [(f'{prefix}_closeness', _closeness_task, chunk, prefix)
+                              for chunk in _split(np.arange(n))]
+
+            start = time.perf_counter()
+            # Parsial dilipat segera sesuai urutan tugas (deterministik) agar memori tidak
+            # menampung satu array n per potongan sekaligus
+            results, sums = {}, {}
+            if self.workers == 1:
+                extra = background() if background else None
+                _attach_worker(graph.spec)
+                try:
+                    for task in tasks:
+                        _, func, chunk, prefix = task
+                        self._fold(results, sums, task, func(chunk, prefix), n)
+                finally:
+                    _release_worker()
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_attach_worker,
+                                         initargs=(graph.spec,)) as pool:
+                    futures = [pool.submit(func, chunk, prefix) for _, func, chunk, prefix in tasks]
+                    extra = background() if background else None
+                    for i, task in enumerate(tasks):
+                        self._fold(results, sums, task, futures[i].result(), n)
+                        futures[i] = None
+            log(f"{len(tasks)} tugas, {self.workers} worker: {time.perf_counter() - start:.1f}s")
+
+        return self._finish(results, sums, n, len(sources), close_sources), extra
+
+    @staticmethod
+    def _fold(results, sums, task, part, n):
+        column, func, chunk, _ = task
+        if func is _betweenness_task:
+            results.setdefault(column, np.zeros(n))
+            results[column] += part
+        elif func is _closeness_sample_task:
+            hits, total = sums.setdefault(column, (np.zeros(n), np.zeros(n)))
+            hits += part[0]
+            total += part[1]
+        else:
+            results.setdefault(column, np.zeros(n))[chunk] = part
+
+    @staticmethod
+    def _finish(results, sums, n, n_sources, close_sources):
+        for column, (hits, total) in sums.items():
+            results[column] = sampled_closeness(hits, total, close_sources, n)
+        scale = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+        if n_sources < n:
+            scale *= n / n_sources
+        for column in results:
+            if column.endswith('_betweenness'):
+                results[column] = results[column] * scale
+        return results
+
+
+def _release_worker():
+    global _worker_graph
+    _worker_matrices.clear()
+    if _worker_graph is not None:
+        _worker_graph.arrays = {}
+        _worker_graph.shm.close()
+        _worker_graph = None
+
+
+def default_workers():
+    """Jumlah CPU yang boleh dipakai proses ini."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
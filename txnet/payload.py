@@ -0,0 +1,213 @@
+"""Payload graf ringkas (typed array + tabel string bersama) untuk vis-network.
+
+HTML PyVis menulis setiap node dan edge sebagai objek JSON lengkap, sehingga
+label, title, warna, dan opsi panah terulang di setiap elemen. Di sini atribut
+disimpan per kolom:
+
+- angka menjadi ``int32`` bila muat, ``float32`` hanya bila nilainya kembali
+  persis setelah round-trip, selain itu ``float64`` (mis. id besar atau nominal
+  IDR 1e9-1e12), little-endian (base64),
+- string dan nilai kompleks menjadi indeks ``uint32`` ke satu tabel string,
+- ``from``/``to`` edge menjadi indeks baris node.
+
+``hydrateNetwork`` di ``lib/bindings/utils.js`` mengembalikan payload menjadi
+DataSet vis-network di browser.
+
+Contoh:
+    python -m txnet.payload nominal.html frekuensi.html
+"""
+
+import argparse
+import base64
+import json
+import numbers
+import os
+from pathlib import Path
+
+import numpy as np
+
+FORMAT = "txnet-graph/1"
+MISSING = 0xFFFFFFFF
+LOADER_PATH = Path(__file__).resolve().parent.parent / "lib" / "bindings" / "utils.js"
+
+VIS_CSS = "https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/dist/vis-network.min.css"
+VIS_JS = "https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js"
+
+HTML_TEMPLATE = """<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="{vis_css}" />
+<script src="{vis_js}"></script>
+<script>{loader}</script>
+<style>#mynetwork {{ width: {width}; height: {height}; background-color: {bgcolor}; position: relative; }}</style>
+</head>
+<body>
+<div id="mynetwork"></div>
+<script type="application/json" id="graph-payload">{payload}</script>
+<script>
+var network, nodes, edges;
+hydrateNetwork(
+  document.getElementById("mynetwork"),
+  JSON.parse(document.getElementById("graph-payload").textContent),
+  {options}
+);
+</script>
+</body>
+</html>
+"""
+
+
+class StringTable:
+    """Tabel string bersama; setiap string unik disimpan sekali."""
+
+    def __init__(self):
+        self.strings = []
+        self._index = {}
+
+    def intern(self, value):
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def encode_array(values, dtype):
+    """Array numerik -> ``{"dtype", "data"}`` (base64, little-endian)."""
+    data = np.asarray(values).astype(np.dtype(dtype).newbyteorder('<'), copy=False).tobytes()
+    return {"dtype": dtype, "data": base64.b64encode(data).decode('ascii')}
+
+
+def decode_array(column):
+    """Kebalikan ``encode_array``."""
+    return np.frombuffer(base64.b64decode(column["data"]), dtype=np.dtype(column["dtype"]).newbyteorder('<'))
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def _encode_column(values, strings):
+    present = [v for v in values if v is not None]
+    if present and all(_is_number(v) for v in present):
+        if len(present) == len(values) and all(isinstance(v, numbers.Integral) for v in present):
+            array = np.asarray(values, dtype=np.int64)
+            if array.size == 0 or (array.min() >= -2**31 and array.max() < 2**31):
+                return {"kind": "number", **encode_array(array, 'int32')}
+        array = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        # float32 hanya ~7 digit signifikan (eksak sampai 2^24); pakai bila tidak ada nilai berubah
+        exact = np.array_equal(array.astype(np.float32).astype(np.float64), array, equal_nan=True)
+        return {"kind": "number", **encode_array(array, 'float32' if exact else 'float64')}
+    kind = "string" if all(isinstance(v, str) for v in present) else "json"
+    index = np.fromiter(
+        (MISSING if v is None else strings.intern(v if kind == "string" else json.dumps(v, sort_keys=True))
+         for v in values),
+        dtype=np.uint32, count=len(values),
+    )
+    return {"kind": kind, **encode_array(index, 'uint32')}
+
+
+def _encode_records(records, strings, node_index=None):
+    keys = list(dict.fromkeys(key for record in records for key in record))
+    columns = {}
+    for key in keys:
+        values = [record.get(key) for record in records]
+        if node_index is not None and key in ("from", "to"):
+            columns[key] = {"kind": "node", **encode_array([node_index[v] for v in values], 'uint32')}
+        else:
+            columns[key] = _encode_column(values, strings)
+    return {"count": len(records), "columns": columns}
+
+
+def graph_payload(nodes, edges):
+    """Susun payload dari daftar dict node dan edge (format ``Network.nodes``/``edges``)."""
+    strings = StringTable()
+    node_index = {node["id"]: i for i, node in enumerate(nodes)}
+    return {
+        "format": FORMAT,
+        "nodes": _encode_records(nodes, strings),
+        "edges": _encode_records(edges, strings, node_index),
+        "strings": strings.strings,
+    }
+
+
+def _decode_records(table, strings, node_ids=None):
+    records = [{} for _ in range(table["count"])]
+    for key, column in table["columns"].items():
+        values = decode_array(column)
+        kind = column["kind"]
+        for record, value in zip(records, values.tolist()):
+            if kind == "node":
+                value = node_ids[value]
+            elif kind in ("string", "json"):
+                if value == MISSING:
+                    continue
+                value = strings[value] if kind == "string" else json.loads(strings[value])
+            elif value != value:  # NaN = atribut tidak ada
+                continue
+            record[key] = value
+    return records
+
+
+def decode_payload(payload):
+    """Kembalikan payload menjadi (nodes, edges) daftar dict; padanan loader JS."""
+    strings = payload["strings"]
+    nodes = _decode_records(payload["nodes"], strings)
+    edges = _decode_records(payload["edges"], strings, [node["id"] for node in nodes])
+    return nodes, edges
+
+
+def payload_json(payload):
+    """JSON ringkas yang aman disisipkan di dalam tag ``<script>``."""
+    return json.dumps(payload, separators=(',', ':')).replace("</", "<\\/")
+
+
+def payload_html(payload, options, height="600px", width="100%", bgcolor="#ffffff"):
+    """HTML mandiri: vis-network dari CDN, loader utils.js disisipkan inline."""
+    if not isinstance(options, str):
+        options = json.dumps(options)
+    return HTML_TEMPLATE.format(
+        vis_css=VIS_CSS, vis_js=VIS_JS, loader=LOADER_PATH.read_text(encoding='utf-8'),
+        width=width, height=height, bgcolor=bgcolor,
+        payload=payload_json(payload), options=options,
+    )
+
+
+def network_payload_html(net):
+    """Padanan ``network_html(net)`` untuk objek PyVis ``Network`` dengan payload ringkas."""
+    nodes, edges, _, height, width, options = net.get_network_data()
+    return payload_html(graph_payload(nodes, edges), options, height=height, width=width, bgcolor=net.bgcolor)
+
+
+def _json_after(text, marker):
+    start = text.index(marker) + len(marker)
+    value, _ = json.JSONDecoder().raw_decode(text[start:].lstrip())
+    return value
+
+
+def read_pyvis_html(path):
+    """Ambil (nodes, edges, options) dari HTML hasil PyVis (mis. ``nominal.html``)."""
+    text = Path(path).read_text(encoding='utf-8')
+    nodes = _json_after(text, "nodes = new vis.DataSet(")
+    edges = _json_after(text, "edges = new vis.DataSet(")
+    options = _json_after(text, "var options = ")
+    return nodes, edges, options
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi HTML PyVis menjadi HTML dengan payload graf ringkas.")
+    parser.add_argument('inputs', nargs='+', help='file HTML hasil PyVis')
+    parser.add_argument('--suffix', default='.compact.html', help='akhiran nama file keluaran')
+    args = parser.parse_args(argv)
+
+    for path in args.inputs:
+        nodes, edges, options = read_pyvis_html(path)
+        output = str(Path(path).with_suffix('')) + args.suffix
+        with open(output, 'w', encoding='utf-8') as fh:
+            fh.write(payload_html(graph_payload(nodes, edges), options))
+        before, after = os.path.getsize(path), os.path.getsize(output)
+        print(f"{path}: {len(nodes)} node, {len(edges)} edge, {before:,} -> {after:,} byte ({output})")
+
+
+if __name__ == '__main__':
+    main()
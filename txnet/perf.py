@@ -0,0 +1,256 @@
+"""Instrumentasi tahap (waktu, baris, puncak memori) untuk dashboard dan skrip.
+
+Aktif hanya bila variabel lingkungan ``TXNET_PERF`` di-set:
+
+- ``TXNET_PERF=1``: waktu dan jumlah baris per tahap;
+- ``TXNET_PERF=memory``: ditambah puncak memori per tahap (``tracemalloc``,
+  memperlambat alokasi; puncak bersifat perkiraan bila beberapa sesi berjalan
+  bersamaan karena ``tracemalloc`` berlaku untuk seluruh proses).
+
+Setiap tahap yang selesai ditulis sebagai satu baris JSON ke logger
+``txnet.perf`` (ke stderr bila logger belum punya handler) dan ke file
+``TXNET_PERF_LOG`` bila di-set (satu ``FileHandler``, diganti bila path
+berubah dan ditutup saat proses keluar). Rekaman satu
+rerun dapat diekspor sebagai trace Chrome (``chrome://tracing`` / Perfetto).
+
+Saat nonaktif, ``stage()`` hanya membaca satu atribut thread-local lalu
+mengembalikan context manager kosong bersama, sehingga aman dibiarkan di
+produksi::
+
+    recorder = perf.start()            # None bila nonaktif
+    with perf.stage('load_data') as s:
+        df = load()
+        s.rows = len(df)
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+ENV_VAR = 'TXNET_PERF'
+LOG_ENV_VAR = 'TXNET_PERF_LOG'
+
+logger = logging.getLogger('txnet.perf')
+
+_local = threading.local()
+_log_lock = threading.Lock()
+_file_handler = None
+
+
+def mode():
+    """Mode instrumentasi dari lingkungan: ``None``, ``'time'`` atau ``'memory'``."""
+    value = os.environ.get(ENV_VAR, '').strip().lower()
+    if value in ('', '0', 'false', 'off', 'no'):
+        return None
+    return 'memory' if value in ('memory', 'mem') else 'time'
+
+
+def enabled():
+    return mode() is not None
+
+
+class _NullStage:
+    # Context manager kosong bersama: atribut yang di-set diabaikan
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+    def note(self, **attrs):
+        pass
+
+
+NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """Satu tahap terbuka; ``rows`` dan ``attrs`` boleh diisi di dalam blok ``with``."""
+
+    __slots__ = ('recorder', 'name', 'rows', 'attrs', 'start', 'depth', 'mem_start', 'mem_peak')
+
+    def __init__(self, recorder, name, rows=None, attrs=None):
+        self.recorder = recorder
+        self.name = name
+        self.rows = rows
+        self.attrs = attrs or {}
+
+    def __enter__(self):
+        self.recorder._open(self)
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder._close(self, failed=exc[0] is not None)
+        return False
+
+    def note(self, **attrs):
+        """Tambahkan atribut bebas (mis. ukuran HTML) ke rekaman tahap."""
+        self.attrs.update(attrs)
+
+
+class Recorder:
+    """Rekaman tahap untuk satu eksekusi (satu rerun dashboard atau satu skrip)."""
+
+    def __init__(self, memory=False, name='run'):
+        self.name = name
+        self.memory = memory
+        self.records = []
+        self.origin = time.perf_counter()
+        self.wall_origin = time.time()
+        self._stack = []
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name, rows=None, **attrs):
+        return Stage(self, name, rows, attrs)
+
+    def _open(self, stage):
+        stage.depth = len(self._stack)
+        if self.memory:
+            # Puncak sejauh ini milik tahap induk; lalu mulai ukur dari nol untuk tahap ini
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].mem_peak = max(self._stack[-1].mem_peak, peak)
+            tracemalloc.reset_peak()
+            stage.mem_start, stage.mem_peak = current, current
+        self._stack.append(stage)
+        stage.start = time.perf_counter()
+
+    def _close(self, stage, failed=False):
+        end = time.perf_counter()
+        self._stack.pop()
+        record = {
+            'run': self.name,
+            'stage': stage.name,
+            'depth': stage.depth,
+            'start': round(stage.start - self.origin, 6),
+            'wall': round(end - stage.start, 6),
+            'rows': None if stage.rows is None else int(stage.rows),
+        }
+        if self.memory:
+            _, peak = tracemalloc.get_traced_memory()
+            stage.mem_peak = max(stage.mem_peak, peak)
+            record['peak_bytes'] = int(stage.mem_peak - stage.mem_start)
+            if self._stack:
+                self._stack[-1].mem_peak = max(self._stack[-1].mem_peak, stage.mem_peak)
+            tracemalloc.reset_peak()
+        if failed:
+            record['error'] = True
+        if stage.attrs:
+            record['attrs'] = stage.attrs
+        self.records.append(record)
+        _emit(record)
+
+    def summary(self):
+        """Tabel tahap (urut waktu mulai): nama berindentasi, waktu (ms), baris, puncak memori (MB)."""
+        import pandas as pd
+
+        rows = []
+        for record in sorted(self.records, key=lambda r: r['start']):
+            row = {'stage': '  ' * record['depth'] + record['stage'],
+                   'ms': record['wall'] * 1000, 'rows': record['rows']}
+            if self.memory:
+                row['peak_mb'] = record['peak_bytes'] / 2 ** 20
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def trace(self):
+        """Trace format Chrome (event ``X`` dalam mikrodetik)."""
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = {key: record[key] for key in ('rows', 'peak_bytes') if record.get(key) is not None}
+            args.update(record.get('attrs', {}))
+            events.append({'name': record['stage'], 'cat': self.name, 'ph': 'X', 'pid': pid, 'tid': 0,
+                           'ts': record['start'] * 1e6, 'dur': record['wall'] * 1e6, 'args': args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'run': self.name, 'started': self.wall_origin, 'memory': self.memory}}
+
+    def trace_json(self):
+        return json.dumps(self.trace(), default=str)
+
+    def write_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.trace_json())
+
+
+def _emit(record):
+    logger.info(json.dumps(record, default=str))
+
+
+def _configure_logger():
+    # Tanpa konfigurasi logging aplikasi, level INFO logger ini tidak pernah keluar
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    _configure_file_handler(os.environ.get(LOG_ENV_VAR))
+
+
+def _configure_file_handler(path):
+    # Satu FileHandler untuk TXNET_PERF_LOG; handler lama dilepas dan ditutup bila path berubah
+    global _file_handler
+    target = os.path.abspath(path) if path else None
+    with _log_lock:
+        if _file_handler is not None and _file_handler.baseFilename == target:
+            return
+        _close_file_handler()
+        if target is None:
+            return
+        handler = logging.FileHandler(target, mode='a', encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        if logger.level == logging.NOTSET or logger.level > logging.INFO:
+            logger.setLevel(logging.INFO)
+        _file_handler = handler
+
+
+def _close_file_handler():
+    global _file_handler
+    if _file_handler is not None:
+        logger.removeHandler(_file_handler)
+        _file_handler.close()
+        _file_handler = None
+
+
+@atexit.register
+def _shutdown():
+    with _log_lock:
+        _close_file_handler()
+
+
+def start(name='run', memory=None):
+    """Mulai rekaman baru untuk thread ini; ``None`` (tanpa efek) bila instrumentasi nonaktif."""
+    active = mode()
+    if active is None:
+        _local.recorder = None
+        return None
+    _configure_logger()
+    recorder = Recorder(memory=(active == 'memory') if memory is None else memory, name=name)
+    _local.recorder = recorder
+    return recorder
+
+
+def current():
+    """Rekaman aktif thread ini (atau ``None``)."""
+    return getattr(_local, 'recorder', None)
+
+
+def stage(name, rows=None, **attrs):
+    """Context manager pengukur satu tahap; no-op bila tidak ada rekaman aktif."""
+    recorder = getattr(_local, 'recorder', None)
+    if recorder is None:
+        return NULL_STAGE
+    return recorder.stage(name, rows, **attrs)
@@ -0,0 +1,52 @@
+"""Volume transaksi per node dan seleksi top-N berbasis ``argpartition``."""
+
+import numpy as np
+import pandas as pd
+
+DIRECTIONS = ('in', 'out', 'total')
+
+
+def top_k(values, k, candidates=None):
+    """Indeks ``k`` nilai terbesar, terurut menurun.
+
+    Nilai yang sama diurutkan berdasarkan indeks terkecil (setara sort stabil),
+    tetapi hanya kandidat di sekitar batas ke-k yang diurutkan penuh.
+    """
+    values = np.asarray(values)
+    ids = np.arange(len(values)) if candidates is None else np.asarray(candidates, dtype=np.int64)
+    k = min(int(k), len(ids))
+    if k <= 0:
+        return ids[:0]
+    scores = values[ids]
+    if k < len(ids):
+        kth = np.partition(scores, len(ids) - k)[len(ids) - k]
+        keep = scores >= kth
+        ids, scores = ids[keep], scores[keep]
+    order = np.lexsort((ids, -scores))
+    return ids[order[:k]]
+
+
+def node_volume(graph, direction='total', weight='amount'):
+    """Volume per node (``np.bincount`` atas array edge) untuk arah in/out/total."""
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction harus salah satu dari {DIRECTIONS}, bukan {direction!r}")
+    if direction == 'in':
+        return graph.in_strength(weight)
+    if direction == 'out':
+        return graph.out_strength(weight)
+    return graph.strength(weight)
+
+
+def top_entities(graph, n, by='total', weight='amount'):
+    """DataFrame ``n`` entitas teratas berdasarkan inflow, outflow, atau total volume."""
+    inflow, outflow = graph.in_strength(weight), graph.out_strength(weight)
+    volume = {'in': inflow, 'out': outflow, 'total': inflow + outflow}
+    if by not in volume:
+        raise ValueError(f"by harus salah satu dari {DIRECTIONS}, bukan {by!r}")
+    ids = top_k(volume[by], n, candidates=graph.active_nodes())
+    return pd.DataFrame({
+        'node': graph.names[ids],
+        'inflow': inflow[ids],
+        'outflow': outflow[ids],
+        'total': volume['total'][ids],
+    })
@@ -0,0 +1,57 @@
+"""Cache render HTML graf (PyVis) di memori, dikunci dengan hash parameter tampilan.
+
+HTML dihasilkan langsung sebagai string (tanpa file sementara), sehingga sesi
+yang berjalan bersamaan di satu server tidak saling menimpa file, dan tampilan
+yang parameternya tidak berubah cukup diambil dari cache.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def cache_key(*parts):
+    """Hash SHA-256 stabil dari parameter tampilan (filter, node terpilih, versi dataset)."""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def network_html(net):
+    """HTML PyVis sebagai string, tanpa ``save_graph`` ke disk."""
+    return net.generate_html(notebook=False)
+
+
+class RenderCache:
+    """LRU thread-safe dengan jumlah entri terbatas."""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """Kembalikan nilai untuk ``key``; panggil ``render()`` hanya jika belum ada di cache."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        # Render di luar lock agar sesi lain tidak ikut menunggu
+        value = render()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
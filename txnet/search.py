@@ -0,0 +1,95 @@
+"""Indeks pencarian node (prefix + trigram) untuk pemilih node tab Node Network.
+
+Label node ``"N123 (B4)"`` dinormalisasi (UTF-8, huruf ASCII kecil) dan disimpan:
+
+- terurut, untuk pencarian prefix dengan ``np.searchsorted``;
+- sebagai posting list trigram byte (CSR: kode trigram terurut + ``indptr``),
+  untuk pencarian substring: irisan posting list lalu verifikasi.
+
+Semua struktur dibangun vektor sekali per versi dataset; hasil pencarian
+diurutkan menurut degree atau volume dan dipotong per halaman.
+"""
+
+import numpy as np
+import pandas as pd
+
+from txnet.labels import label_matrix, node_banks
+from txnet.ranking import node_volume, top_k
+
+ORDERS = ('degree', 'volume')
+
+# Baris label per blok saat membangun posting list (membatasi array perantara)
+BLOCK_ROWS = 65536
+
+
+def _trigram_codes(byte_matrix):
+    # (n, lebar) uint8 -> kode trigram 24 bit (n, lebar - 2) int32; 0 = melewati akhir label
+    m = byte_matrix.astype(np.int32)
+    codes = (m[:, :-2] << 16) | (m[:, 1:-1] << 8) | m[:, 2:]
+    codes[byte_matrix[:, 2:] == 0] = 0
+    return codes
+
+
+def _trigram_pairs(matrix):
+    # Kunci gabungan (trigram 24 bit, id node 39 bit) unik, dibangun per blok baris
+    blocks = []
+    for start in range(0, len(matrix), BLOCK_ROWS):
+        codes = _trigram_codes(matrix[start:start + BLOCK_ROWS])
+        rows, cols = np.nonzero(codes)
+        blocks.append((codes[rows, cols].astype(np.int64) << 39) | (rows + start))
+    return np.unique(np.concatenate(blocks)) if blocks else np.empty(0, dtype=np.int64)
+
+
+class NodeSearch:
+    """Pencarian node berdasarkan nama/kode bank, dengan hasil berhalaman."""
+
+    def __init__(self, graph):
+        self.names = graph.names
+        self.scores = {'degree': graph.degree(), 'volume': node_volume(graph, 'total')}
+        self.active = graph.active_nodes()
+
+        matrix = label_matrix(graph.names, lower=True)
+        self.labels = np.ascontiguousarray(matrix).view(f'S{matrix.shape[1]}').ravel()
+        self.banks = pd.Series(node_banks(graph.names)).str.lower().to_numpy()
+        self.prefix_order = np.argsort(self.labels, kind='stable')
+        self.sorted_labels = self.labels[self.prefix_order]
+
+        pairs = _trigram_pairs(matrix)
+        self.postings = pairs & ((1 << 39) - 1)
+        self.trigrams, starts = np.unique(pairs >> 39, return_index=True)
+        self.trigram_indptr = np.r_[starts, len(self.postings)]
+
+    def _posting(self, code):
+        i = np.searchsorted(self.trigrams, code)
+        if i == len(self.trigrams) or self.trigrams[i] != code:
+            return self.postings[:0]
+        return self.postings[self.trigram_indptr[i]:self.trigram_indptr[i + 1]]
+
+    def match(self, query):
+        """Id node (urutan id) yang labelnya diawali atau memuat ``query``."""
+        q = query.strip().encode('utf-8').lower()
+        if not q:
+            return self.active
+        lo = np.searchsorted(self.sorted_labels, q, side='left')
+        hi = np.searchsorted(self.sorted_labels, q + b'\xff', side='left')
+        prefix = self.prefix_order[lo:hi]
+        if len(q) < 3:
+            return np.sort(prefix)
+        # Irisan posting list mulai dari trigram paling jarang, lalu verifikasi substring
+        grams = {(q[i] << 16) | (q[i + 1] << 8) | q[i + 2] for i in range(len(q) - 2)}
+        postings = sorted((self._posting(g) for g in grams), key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        found = candidates[np.char.find(self.labels[candidates], q) >= 0]
+        return np.union1d(found, prefix)
+
+    def search(self, query='', bank=None, order='degree', page=0, page_size=20):
+        """Satu halaman hasil (id node terurut skor menurun) dan jumlah total kecocokan."""
+        if order not in ORDERS:
+            raise ValueError(f"order harus salah satu dari {ORDERS}, bukan {order!r}")
+        ids = self.match(query)
+        if bank:
+            ids = ids[self.banks[ids] == bank.strip().lower()]
+        top = top_k(self.scores[order], (page + 1) * page_size, candidates=ids)
+        return top[page * page_size:], len(ids)
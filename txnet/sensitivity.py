@@ -0,0 +1,146 @@
+"""Analisis sensitivitas bobot metrik untuk prioritas retensi & akuisisi.
+
+Versi vektor dari ``core_candidates`` di ``sdc-final.ipynb``: semua vektor bobot
+ditarik sekaligus, skor dihitung per blok sampel, dan top-k per sampel dipilih
+dengan ``np.partition``. Jumlah sampel per blok diturunkan dari anggaran memori
+(``memory_budget`` byte) sehingga puncak memori tidak bergantung ``n_samples``
+dan tetap terbatas untuk jutaan node.
+Dengan seed yang sama frekuensinya identik dengan versi loop.
+"""
+
+import numpy as np
+import pandas as pd
+
+RETENTION_METRICS = {
+    'amt': ['amt_in_deg', 'amt_betweenness', 'amt_pagerank'],
+    'trx': ['trx_in_deg', 'trx_betweenness', 'trx_pagerank'],
+    'unw': ['unw_in_deg', 'unw_betweenness', 'unw_pagerank'],
+}
+ACQUISITION_METRICS = {
+    'amt': ['amt_out_deg', 'amt_closeness'],
+    'trx': ['trx_out_deg', 'trx_closeness'],
+    'unw': ['unw_out_deg', 'unw_closeness'],
+}
+
+# Anggaran memori blok skor; per blok hidup sekitar 4 array float64 (sampel x node):
+# skor + suku per metrik, lalu salinan negatif + hasil np.partition dan mask top-k
+MEMORY_BUDGET = 256 * 2 ** 20
+BLOCK_ARRAYS = 4
+
+
+def _topk_mask(scores, k):
+    # Mask top-k per baris; nilai sama diurutkan berdasarkan posisi (seperti rank().nsmallest(k)).
+    # Skor -inf (node NaN) ikut mengisi sisa slot sesuai posisi bila node berskor kurang dari k
+    if k >= scores.shape[1]:
+        return np.ones(scores.shape, dtype=bool)
+    kth = -np.partition(-scores, k - 1, axis=1)[:, k - 1:k]
+    mask = scores > kth
+    room = k - mask.sum(axis=1)
+    ties = scores == kth
+    # Hanya baris yang nilai ke-k-nya kembar lebih dari sisa slot perlu cumsum
+    tied_rows = np.flatnonzero(ties.sum(axis=1) > room)
+    ties[tied_rows] &= np.cumsum(ties[tied_rows], axis=1) <= room[tied_rows, None]
+    return mask | ties
+
+
+def block_size(n_nodes, memory_budget=MEMORY_BUDGET):
+    """Jumlah sampel per blok agar array skor blok muat dalam ``memory_budget`` byte."""
+    return max(1, memory_budget // (max(n_nodes, 1) * 8 * BLOCK_ARRAYS))
+
+
+def core_candidates(df, metrics, k=20, n_samples=100, seed=42, thresh=0.8, weights=None,
+                    memory_budget=MEMORY_BUDGET):
+    """Node yang masuk top-k pada minimal ``thresh`` bagian simulasi bobot acak.
+
+    ``weights`` (opsional) mengalikan bobot acak per metrik sebelum dinormalisasi;
+    nilai default (semua 1) sama dengan perilaku notebook. Bobot negatif atau
+    semuanya 0 ditolak dengan ``ValueError`` (skor tidak terdefinisi).
+    """
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if (weights < 0).any() or not (weights > 0).any():
+            raise ValueError(f"weights harus non-negatif dengan minimal satu bobot > 0, bukan {weights.tolist()}")
+    rng = np.random.RandomState(seed)
+    W = rng.rand(n_samples, len(metrics))
+    if weights is not None:
+        W = W * weights
+    W = W / W.sum(axis=1, keepdims=True)
+
+    X = df[metrics].to_numpy(dtype=np.float64)
+    # Seperti notebook: skor node dengan metrik NaN adalah NaN, berada di urutan terakhir
+    # rank(), tetapi tetap diambil nsmallest(k) (urut posisi) bila node berskor kurang dari k
+    missing = np.isnan(X).any(axis=1)
+    X = np.where(missing[:, None], 0.0, X)
+    n = len(X)
+    counts = np.zeros(n, dtype=np.int64)
+    k = min(k, n)
+    if k > 0:
+        size = block_size(n, memory_budget)
+        for start in range(0, n_samples, size):
+            w = W[start:start + size]
+            # Akumulasi per metrik dengan urutan yang sama seperti sum(df[m] * w_i)
+            scores = np.multiply(w[:, :1], X[:, 0])
+            term = np.empty_like(scores)
+            for j in range(1, len(metrics)):
+                scores += np.multiply(w[:, j:j + 1], X[:, j], out=term)
+            del term
+            if missing.any():
+                scores[:, missing] = -np.inf
+            counts += _topk_mask(scores, k).sum(axis=0)
+
+    freq = pd.Series(counts / n_samples, index=df['node'].values)
+    return freq[freq >= thresh].sort_values(ascending=False)
+
+
+def candidate_pools(df_metric, home_bank='B1', sep='|'):
+    """Pisahkan tabel metrik menjadi kandidat retensi (bank sendiri) dan akuisisi.
+
+    Calon akuisisi yang pemiliknya sudah punya akun di ``home_bank`` dibuang.
+    """
+    parts = df_metric['node'].str.split(sep, n=1)
+    user, bank = parts.str[0], parts.str[1]
+    df_ret = df_metric[bank == home_bank]
+    df_aq = df_metric[(bank != home_bank) & ~user.isin(user[bank == home_bank].unique())]
+    return df_ret, df_aq
+
+
+def priority_tables(df_metric, basis='amt', k=20, n_samples=200, seed=0, thresh=(0.8, 0.7),
+                    weights=(None, None)):
+    """Tabel Core Retention dan Core Acquisition seperti ``berdasarkan_*.xlsx``."""
+    df_ret, df_aq = candidate_pools(df_metric)
+    core_ret = core_candidates(df_ret, RETENTION_METRICS[basis], k=k, n_samples=n_samples,
+                               seed=seed, thresh=thresh[0], weights=weights[0])
+    core_aq = core_candidates(df_aq, ACQUISITION_METRICS[basis], k=k, n_samples=n_samples,
+                              seed=seed, thresh=thresh[1], weights=weights[1])
+    return core_ret, core_aq
+
+
+def write_priority_workbook(core_ret, core_aq, path):
+    """Simpan hasil ke Excel dengan format sheet yang sama seperti ``berdasarkan_*.xlsx``."""
+    with pd.ExcelWriter(path) as writer:
+        core_ret.rename("frequency").to_frame().to_excel(writer, sheet_name="Core Retention")
+        core_aq.rename("frequency").to_frame().to_excel(writer, sheet_name="Core Acquisition")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Hitung tabel prioritas retensi & akuisisi.")
+    parser.add_argument('metrics', nargs='?', default='df_metric2.csv')
+    parser.add_argument('--basis', choices=sorted(RETENTION_METRICS), default='amt')
+    parser.add_argument('--output', help="default: berdasarkan_nominal.xlsx / berdasarkan_frekuensi.xlsx / tanpa_pembobotan.xlsx")
+    parser.add_argument('-k', type=int, default=20)
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    output = args.output or {'amt': 'berdasarkan_nominal.xlsx', 'trx': 'berdasarkan_frekuensi.xlsx',
+                             'unw': 'tanpa_pembobotan.xlsx'}[args.basis]
+    core_ret, core_aq = priority_tables(pd.read_csv(args.metrics), args.basis, k=args.k,
+                                        n_samples=args.samples, seed=args.seed)
+    write_priority_workbook(core_ret, core_aq, output)
+    print(f"{len(core_ret)} retensi, {len(core_aq)} akuisisi -> {output}")
+
+
+if __name__ == '__main__':
+    main()
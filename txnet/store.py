@@ -0,0 +1,136 @@
+"""Cache kolumnar (Parquet) untuk file Excel sumber.
+
+Workbook diparse sekali lewat openpyxl lalu disimpan sebagai Parquet terkompresi
+dengan nama yang memuat hash isi file sumber. Proses berikutnya cukup
+memory-map file Parquet tersebut; cache dibangun ulang hanya jika isi sumber berubah.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+
+import pandas as pd
+
+CACHE_DIR = os.environ.get("TXNET_CACHE_DIR", ".cache")
+
+# Kolom teks dengan nilai unik sedikit (type, bank) disimpan sebagai kategori
+_CATEGORY_RATIO = 0.5
+
+# Tanpa pyarrow, baca langsung dari Excel seperti sebelumnya
+HAS_ARROW = importlib.util.find_spec("pyarrow") is not None
+
+_digests = {}
+
+
+def file_digest(path):
+    """SHA-256 isi file, di-memo per (path, mtime, size) agar tidak dihitung ulang tiap rerun."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _digests:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        _digests[key] = sha.hexdigest()
+    return _digests[key]
+
+
+def _compact_types(df):
+    for col in df.columns:
+        if df[col].dtype == object and len(df) and df[col].nunique() / len(df) <= _CATEGORY_RATIO:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _cache_stem(path):
+    return os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+
+
+def _cache_prefix(path, cache_dir):
+    return os.path.join(cache_dir, f"{_cache_stem(path)}-{file_digest(path)[:16]}")
+
+
+def _write_atomic(df, target):
+    tmp = f"{target}.{os.getpid()}.tmp"
+    df.to_parquet(tmp, compression="zstd", index=False)
+    os.replace(tmp, target)
+
+
+def _purge_stale(path, prefix, cache_dir):
+    # Hapus cache versi lama dari file sumber yang sama
+    pattern = re.compile(rf"{re.escape(_cache_stem(path))}-[0-9a-f]{{16}}(\.json|-\d+\.parquet)$")
+    current = os.path.basename(prefix)
+    for name in os.listdir(cache_dir):
+        if pattern.match(name) and not name.startswith(current):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def ingest_workbook(path, cache_dir=CACHE_DIR):
+    """Konversi semua sheet workbook ke Parquet (jika belum ada) dan kembalikan manifest-nya."""
+    os.makedirs(cache_dir, exist_ok=True)
+    prefix = _cache_prefix(path, cache_dir)
+    manifest_path = f"{prefix}.json"
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    sheets = pd.read_excel(path, sheet_name=None)
+    manifest = {"source": os.path.basename(path), "digest": file_digest(path), "sheets": []}
+    for i, (sheet_name, sheet_df) in enumerate(sheets.items()):
+        sheet_path = f"{prefix}-{i}.parquet"
+        sheet_df.columns = [str(c) for c in sheet_df.columns]
+        _write_atomic(_compact_types(sheet_df), sheet_path)
+        manifest["sheets"].append({"name": sheet_name, "path": os.path.basename(sheet_path)})
+
+    tmp = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, manifest_path)
+    _purge_stale(path, prefix, cache_dir)
+    return manifest
+
+
+def _read_sheet(entry, cache_dir):
+    return pd.read_parquet(os.path.join(cache_dir, entry["path"]), memory_map=True)
+
+
+def read_sheets(path, cache_dir=CACHE_DIR):
+    """Seperti ``pd.read_excel(path, sheet_name=None)`` tetapi dibaca dari cache Parquet."""
+    if not HAS_ARROW:
+        return pd.read_excel(path, sheet_name=None)
+    manifest = ingest_workbook(path, cache_dir)
+    return {entry["name"]: _read_sheet(entry, cache_dir) for entry in manifest["sheets"]}
+
+
+def read_sheet(path, sheet_name=0, cache_dir=CACHE_DIR):
+    """Seperti ``pd.read_excel(path, sheet_name=...)`` tetapi dibaca dari cache Parquet."""
+    if not HAS_ARROW:
+        return pd.read_excel(path, sheet_name=sheet_name)
+    manifest = ingest_workbook(path, cache_dir)
+    entries = manifest["sheets"]
+    if isinstance(sheet_name, int):
+        entry = entries[sheet_name]
+    else:
+        entry = next(e for e in entries if e["name"] == sheet_name)
+    return _read_sheet(entry, cache_dir)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Konversi workbook Excel ke cache Parquet.")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args(argv)
+    for path in args.paths:
+        manifest = ingest_workbook(path, args.cache_dir)
+        print(f"{path}: {len(manifest['sheets'])} sheet -> {manifest['digest'][:16]}")
+
+
+if __name__ == "__main__":
+    main()
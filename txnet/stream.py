@@ -0,0 +1,426 @@
+"""Ingestion streaming berpotongan (chunk) untuk ekstrak transaksi melebihi memori.
+
+File CSV/Parquet (atau workbook lewat cache Parquet ``txnet.store``) dibaca per
+potongan berukuran terbatas. Tiap potongan:
+
+1. dideduplikasi dengan himpunan hash sidik baris (``row_fingerprints``), setara
+   ``drop_duplicates`` atas seluruh file;
+2. diubah jadi edge dengan ``build_edges``; node dipetakan ke id global lewat
+   tabel hash nama;
+3. dilipat ke tabel edge teragregasi (skema ``aggregate_edges``) dan penghitung
+   per node (jumlah baris dan nominal keluar/masuk).
+
+Ukuran potongan disesuaikan dengan batas memori (``memory_limit``) dan ukuran
+state yang sudah terkumpul; jika state sendiri melampaui batas, ``MemoryError``.
+
+Contoh:
+    python -m txnet.stream transaksi.csv --memory-limit 2G --output .cache/stream
+"""
+
+import argparse
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from txnet.edges import NODE_FORMAT, build_edges
+from txnet.incremental import TRANSACTION_COLUMNS, row_fingerprints
+
+DEFAULT_MEMORY_LIMIT = 1 << 30
+MIN_CHUNK_ROWS = 10_000
+PROBE_ROWS = 10_000
+# Perkiraan memori kerja per baris potongan relatif ke ukuran DataFrame-nya
+# (sidik baris, salinan object, build_edges, kode grup)
+WORK_FACTOR = 6
+PARQUET_BATCH_ROWS = 65_536
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def parse_size(text):
+    """``'512M'``, ``'2G'``, ``'1.5g'`` atau angka byte -> jumlah byte."""
+    if isinstance(text, (int, float)):
+        return int(text)
+    match = re.fullmatch(r'\s*([\d.]+)\s*([kmgt]?)i?b?\s*', str(text).lower())
+    if not match:
+        raise ValueError(f"ukuran memori tidak dikenali: {text!r}")
+    value, unit = match.groups()
+    return int(float(value) * 1024 ** ' kmgt'.index(unit or ' '))
+
+
+class UInt64HashTable:
+    """Tabel hash open addressing (linear probing) untuk kunci uint64, diproses per batch.
+
+    Kunci 0 dipakai sebagai penanda slot kosong sehingga disimpan terpisah.
+    Tanpa ``values`` tabel berlaku sebagai himpunan.
+    """
+
+    def __init__(self, capacity=1024, with_values=True):
+        capacity = 1 << max(int(capacity) - 1, 1).bit_length()
+        self.keys = np.zeros(capacity, dtype=np.uint64)
+        self.values = np.full(capacity, -1, dtype=np.int64) if with_values else None
+        self.size = 0
+        self.zero_value = None
+
+    def __len__(self):
+        return self.size + (self.zero_value is not None)
+
+    @property
+    def nbytes(self):
+        return self.keys.nbytes + (self.values.nbytes if self.values is not None else 0)
+
+    def _slots(self, keys):
+        shift = np.uint64(64 - (len(self.keys).bit_length() - 1))
+        return ((keys * _GOLDEN) >> shift).astype(np.int64)
+
+    def lookup(self, keys):
+        """Nilai per kunci (-1 = tidak ada); untuk himpunan: 0 = ada."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        result = np.full(len(keys), -1, dtype=np.int64)
+        zero = keys == 0
+        if self.zero_value is not None:
+            result[zero] = self.zero_value
+        pending = np.flatnonzero(~zero)
+        slots = self._slots(keys[pending])
+        mask = len(self.keys) - 1
+        while len(pending):
+            current = self.keys[slots]
+            found = current == keys[pending]
+            hit = pending[found]
+            result[hit] = self.values[slots[found]] if self.values is not None else 0
+            probe = ~found & (current != 0)
+            pending, slots = pending[probe], (slots[probe] + 1) & mask
+        return result
+
+    def insert(self, keys, values=None):
+        """Sisipkan kunci yang belum ada (unik di dalam batch)."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        values = np.zeros(len(keys), dtype=np.int64) if values is None else np.asarray(values, dtype=np.int64)
+        zero = keys == 0
+        if zero.any():
+            self.zero_value = int(values[zero][0])
+            keys, values = keys[~zero], values[~zero]
+        if (self.size + len(keys)) * 2 > len(self.keys):
+            self._grow(self.size + len(keys))
+        self._place(keys, values)
+        self.size += len(keys)
+
+    def _place(self, keys, values):
+        slots = self._slots(keys)
+        mask = len(self.keys) - 1
+        pending = np.arange(len(keys))
+        while len(pending):
+            empty = self.keys[slots] == 0
+            # Klaim slot kosong; bila beberapa kunci berebut slot yang sama, satu menang
+            self.keys[slots[empty]] = keys[pending[empty]]
+            won = np.zeros(len(pending), dtype=bool)
+            won[empty] = self.keys[slots[empty]] == keys[pending[empty]]
+            if self.values is not None:
+                self.values[slots[won]] = values[pending[won]]
+            pending, slots = pending[~won], (slots[~won] + 1) & mask
+
+    def _grow(self, needed):
+        occupied = self.keys != 0
+        keys = self.keys[occupied]
+        values = self.values[occupied] if self.values is not None else None
+        capacity = len(self.keys)
+        while needed * 2 > capacity:
+            capacity *= 2
+        self.keys = np.zeros(capacity, dtype=np.uint64)
+        if self.values is not None:
+            self.values = np.full(capacity, -1, dtype=np.int64)
+        self._place(keys, values)
+
+
+class _Column:
+    """Array numpy yang tumbuh (kapasitas berlipat) untuk state per node/edge."""
+
+    def __init__(self, dtype, fill=0):
+        self.data = np.full(1024, fill, dtype=dtype)
+        self.fill = fill
+        self.size = 0
+
+    def resize(self, size):
+        if size > len(self.data):
+            capacity = len(self.data)
+            while capacity < size:
+                capacity *= 2
+            grown = np.full(capacity, self.fill, dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.size = size
+
+    @property
+    def values(self):
+        return self.data[:self.size]
+
+
+class _ChunkReader:
+    """Baca tabel transaksi per ``read(n)`` baris; ``None`` bila habis."""
+
+    def __init__(self, path):
+        self.path = path
+        ext = os.path.splitext(path)[1].lower()
+        if ext in ('.xlsx', '.xls'):
+            from txnet.store import CACHE_DIR, ingest_workbook
+            manifest = ingest_workbook(path)
+            path, ext = os.path.join(CACHE_DIR, manifest['sheets'][0]['path']), '.parquet'
+        if ext in ('.parquet', '.pq', '.arrow', '.feather'):
+            import pyarrow.dataset as ds
+            fmt = 'parquet' if ext in ('.parquet', '.pq') else 'ipc'
+            batches = ds.dataset(path, format=fmt).to_batches(columns=TRANSACTION_COLUMNS,
+                                                            batch_size=PARQUET_BATCH_ROWS)
+            self._batches, self._pending, self._csv = iter(batches), [], None
+        else:
+            self._csv = pd.read_csv(path, usecols=TRANSACTION_COLUMNS, iterator=True)
+
+    def read(self, n_rows):
+        if self._csv is not None:
+            try:
+                return self._csv.get_chunk(n_rows)
+            except StopIteration:
+                return None
+        import pyarrow as pa
+        have = sum(len(b) for b in self._pending)
+        while have < n_rows:
+            batch = next(self._batches, None)
+            if batch is None:
+                break
+            self._pending.append(batch)
+            have += len(batch)
+        if not have:
+            return None
+        table = pa.Table.from_batches(self._pending)
+        self._pending = [table.slice(n_rows).combine_chunks().to_batches()[0]] if have > n_rows else []
+        return table.slice(0, n_rows).to_pandas()
+
+    def close(self):
+        if self._csv is not None:
+            self._csv.close()
+
+
+class StreamAggregator:
+    """State ingestion: sidik baris, id node, edge teragregasi, penghitung per node."""
+
+    def __init__(self, node_format=NODE_FORMAT):
+        self.node_format = node_format
+        self.seen = UInt64HashTable(with_values=False)
+        self.node_table = UInt64HashTable()
+        self.edge_table = UInt64HashTable()
+        self.node_names = []
+        self.name_bytes = 0
+        self.type_names = []
+        self.type_codes = {}
+        self.edge_columns = {
+            'src': _Column(np.int64), 'dst': _Column(np.int64),
+            'amount_tx_idr': _Column(np.float64), 'trx': _Column(np.int64), 'count': _Column(np.int64),
+            'amount_min': _Column(np.float64, np.inf), 'amount_max': _Column(np.float64, -np.inf),
+            'type_first': _Column(np.int64, -1), 'type_last': _Column(np.int64, -1),
+        }
+        self.node_columns = {
+            'rows_out': _Column(np.int64), 'rows_in': _Column(np.int64),
+            'amount_out': _Column(np.float64), 'amount_in': _Column(np.float64),
+        }
+        self.rows_read = 0
+        self.rows_kept = 0
+
+    @property
+    def n_nodes(self):
+        return len(self.node_names)
+
+    @property
+    def n_edges(self):
+        return self.edge_columns['src'].size
+
+    @property
+    def nbytes(self):
+        columns = list(self.edge_columns.values()) + list(self.node_columns.values())
+        return (self.seen.nbytes + self.node_table.nbytes + self.edge_table.nbytes
+                + sum(c.data.nbytes for c in columns) + self.name_bytes)
+
+    def _dedupe(self, chunk):
+        # Kemunculan pertama per sidik di dalam potongan, lalu buang yang sudah pernah terlihat
+        fingerprints = row_fingerprints(chunk)
+        unique, first = np.unique(fingerprints, return_index=True)
+        fresh = self.seen.lookup(unique) < 0
+        self.seen.insert(unique[fresh])
+        return chunk.iloc[np.sort(first[fresh])]
+
+    def _node_ids(self, categories):
+        # Kategori lokal (urut kemunculan) -> id global; node baru ditambahkan sesuai urutan itu
+        names = np.asarray(categories, dtype=object)
+        keys = pd.util.hash_array(names)
+        ids = self.node_table.lookup(keys)
+        new = ids < 0
+        ids[new] = self.n_nodes + np.arange(new.sum())
+        self.node_table.insert(keys[new], ids[new])
+        self.node_names.extend(names[new])
+        # Perkiraan ukuran objek str + pointer list per nama node
+        self.name_bytes += int(sum(len(name) for name in names[new])) + 57 * int(new.sum())
+        for column in self.node_columns.values():
+            column.resize(self.n_nodes)
+        return ids
+
+    def _type_ids(self, types):
+        # Kode tipe global urut kemunculan pertama, sama seperti factorize atas seluruh file
+        codes, uniques = pd.factorize(types)
+        for name in uniques:
+            if name not in self.type_codes:
+                self.type_codes[name] = len(self.type_names)
+                self.type_names.append(name)
+        mapping = np.array([self.type_codes[name] for name in uniques] + [-1], dtype=np.int64)
+        return mapping[codes]
+
+    def add(self, chunk):
+        """Lipat satu potongan transaksi ke state; kembalikan jumlah baris baru."""
+        self.rows_read += len(chunk)
+        chunk = self._dedupe(chunk[TRANSACTION_COLUMNS])
+        self.rows_kept += len(chunk)
+        if chunk.empty:
+            return 0
+
+        edges = build_edges(chunk, self.node_format)
+        types = self._type_ids(chunk['type'])
+        src_codes, dst_codes = edges['source'].array.codes, edges['target'].array.codes
+        keep = (src_codes >= 0) & (dst_codes >= 0)
+        gid = self._node_ids(edges['source'].cat.categories)
+        src, dst = gid[src_codes[keep]], gid[dst_codes[keep]]
+        amount = chunk['amount_tx_idr'].to_numpy(dtype=np.float64)[keep]
+        trx = chunk['trx'].to_numpy(dtype=np.int64)[keep]
+        types = types[keep]
+
+        # Edge potongan -> id edge global (edge baru diberi id sesuai kemunculan pertama)
+        keys = (src.astype(np.uint64) << np.uint64(32)) | dst.astype(np.uint64)
+        unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        eids = self.edge_table.lookup(unique)
+        new = np.flatnonzero(eids < 0)
+        new = new[np.argsort(first[new], kind='stable')]
+        start = self.n_edges
+        eids[new] = start + np.arange(len(new))
+        self.edge_table.insert(unique[new], eids[new])
+        cols = self.edge_columns
+        for column in cols.values():
+            column.resize(start + len(new))
+        cols['src'].data[eids[new]] = src[first[new]]
+        cols['dst'].data[eids[new]] = dst[first[new]]
+        cols['type_first'].data[eids[new]] = types[first[new]]
+
+        row_edge = eids[inverse.ravel()]
+        np.add.at(cols['amount_tx_idr'].data, row_edge, amount)
+        np.add.at(cols['trx'].data, row_edge, trx)
+        np.add.at(cols['count'].data, row_edge, 1)
+        np.minimum.at(cols['amount_min'].data, row_edge, amount)
+        np.maximum.at(cols['amount_max'].data, row_edge, amount)
+        last = np.full(len(unique), -1, dtype=np.int64)
+        np.maximum.at(last, inverse.ravel(), np.arange(len(row_edge)))
+        cols['type_last'].data[eids] = types[last]
+
+        n = self.n_nodes
+        nodes = self.node_columns
+        nodes['rows_out'].data[:n] += np.bincount(src, minlength=n)
+        nodes['rows_in'].data[:n] += np.bincount(dst, minlength=n)
+        nodes['amount_out'].data[:n] += np.bincount(src, weights=amount, minlength=n)
+        nodes['amount_in'].data[:n] += np.bincount(dst, weights=amount, minlength=n)
+        return len(chunk)
+
+    def edges(self):
+        """Tabel edge berskema ``aggregate_edges`` (source/target kategorikal)."""
+        categories = pd.Index(self.node_names, dtype=object)
+        type_categories = pd.Index(self.type_names, dtype=object)
+        cols = {name: column.values for name, column in self.edge_columns.items()}
+        frame = pd.DataFrame({
+            'source': pd.Categorical.from_codes(cols['src'], categories=categories),
+            'target': pd.Categorical.from_codes(cols['dst'], categories=categories),
+        })
+        for name in ('amount_tx_idr', 'trx', 'count', 'amount_min', 'amount_max'):
+            frame[name] = cols[name]
+        for name in ('type_first', 'type_last'):
+            frame[name] = pd.Categorical.from_codes(cols[name], categories=type_categories)
+        return frame
+
+    def nodes(self):
+        """Penghitung per node: jumlah baris dan nominal keluar/masuk."""
+        frame = pd.DataFrame({'node': pd.Index(self.node_names, dtype=object)})
+        for name, column in self.node_columns.items():
+            frame[name] = column.values
+        return frame
+
+
+def _chunk_rows(state, bytes_per_row, memory_limit):
+    free = memory_limit - state.nbytes
+    if free <= 0:
+        raise MemoryError(f"state ingestion ({state.nbytes / 2**20:,.0f} MiB) melebihi batas memori "
+                          f"({memory_limit / 2**20:,.0f} MiB)")
+    return max(MIN_CHUNK_ROWS, int(free / (bytes_per_row * WORK_FACTOR)))
+
+
+def stream_transactions(path, memory_limit=DEFAULT_MEMORY_LIMIT, chunk_rows=None,
+                        node_format=NODE_FORMAT, log=None):
+    """Ingest ``path`` per potongan; kembalikan (``StreamAggregator``, statistik).
+
+    Tanpa ``chunk_rows``, ukuran potongan dihitung ulang tiap potongan dari sisa
+    ``memory_limit`` setelah state terkumpul dan ukuran per baris potongan pertama.
+    """
+    memory_limit = parse_size(memory_limit)
+    state = StreamAggregator(node_format)
+    reader = _ChunkReader(path)
+    start = time.perf_counter()
+    bytes_per_row = None
+    chunks = 0
+    try:
+        while True:
+            n_rows = chunk_rows or (_chunk_rows(state, bytes_per_row, memory_limit) if bytes_per_row else PROBE_ROWS)
+            chunk = reader.read(n_rows)
+            if chunk is None or chunk.empty:
+                break
+            if bytes_per_row is None:
+                bytes_per_row = max(chunk.memory_usage(deep=True).sum() / len(chunk), 1.0)
+            state.add(chunk)
+            chunks += 1
+            if state.nbytes > memory_limit:
+                raise MemoryError(f"state ingestion ({state.nbytes / 2**20:,.0f} MiB) melebihi batas memori "
+                                  f"({memory_limit / 2**20:,.0f} MiB)")
+            if log:
+                elapsed = time.perf_counter() - start
+                log(f"potongan {chunks}: {state.rows_read:,} baris dibaca, {state.rows_kept:,} unik, "
+                    f"{state.n_edges:,} edge, {state.rows_read / elapsed:,.0f} baris/s")
+    finally:
+        reader.close()
+    elapsed = time.perf_counter() - start
+    stats = {
+        'rows': state.rows_read,
+        'unique_rows': state.rows_kept,
+        'duplicates': state.rows_read - state.rows_kept,
+        'nodes': state.n_nodes,
+        'edges': state.n_edges,
+        'chunks': chunks,
+        'seconds': elapsed,
+        'rows_per_second': state.rows_read / elapsed if elapsed > 0 else float('inf'),
+        'state_bytes': state.nbytes,
+    }
+    return state, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingestion streaming transaksi per potongan.")
+    parser.add_argument('input', help='file .csv, .parquet/.arrow, atau .xlsx')
+    parser.add_argument('--memory-limit', default='1G', help='batas memori state + potongan (mis. 512M, 2G)')
+    parser.add_argument('--chunk-rows', type=int, default=None, help='ukuran potongan tetap (default: adaptif)')
+    parser.add_argument('--output', default=None, help='direktori tujuan edges.parquet dan nodes.parquet')
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    state, stats = stream_transactions(args.input, memory_limit=args.memory_limit, chunk_rows=args.chunk_rows,
+                                       log=None if args.quiet else print)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        state.edges().to_parquet(os.path.join(args.output, 'edges.parquet'), index=False)
+        state.nodes().to_parquet(os.path.join(args.output, 'nodes.parquet'), index=False)
+    print(f"{stats['rows']:,} baris ({stats['duplicates']:,} duplikat) -> {stats['nodes']:,} node, "
+          f"{stats['edges']:,} edge dalam {stats['seconds']:.1f}s ({stats['rows_per_second']:,.0f} baris/s)")
+
+
+if __name__ == '__main__':
+    main()
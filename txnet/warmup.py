@@ -0,0 +1,166 @@
+"""Penjadwal prekomputasi latar belakang dengan pergantian versi atomik.
+
+Thread daemon memeriksa versi sumber data (``probe()``, mis. hash isi file)
+setiap ``interval`` detik. Bila versi berubah, tugas-tugas dari ``tasks(versi)``
+dijalankan berurutan (urutan = prioritas) untuk mengisi cache. Selama itu
+``served()`` tetap mengembalikan versi lama; setelah semua tugas selesai versi
+baru dipasang dengan satu penggantian referensi di bawah lock, sehingga setiap
+rerun melihat versi lama atau baru secara utuh.
+
+Tugas tidak memanggil fungsi ber-dekorator Streamlit (thread ini tidak punya
+``ScriptRunContext``); artefak disimpan di ``VersionedCache`` yang juga dibaca
+rerun, sehingga hasil prekomputasi langsung terpakai.
+
+Bila ada tugas yang gagal (mis. file sumber masih disalin), versi lama tetap
+dilayani dan versi tersebut tidak dicoba lagi sampai sumbernya berubah.
+Saat start pertama tidak ada versi lama: versi saat itu langsung dilayani dan
+cache diisi di latar belakang bersamaan dengan sesi pertama.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger('txnet.warmup')
+
+WARM_INTERVAL = float(os.environ.get("TXNET_WARM_INTERVAL", "30"))
+
+
+class _Entry:
+    __slots__ = ('lock', 'ready', 'value')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ready = False
+        self.value = None
+
+
+class VersionedCache:
+    """Artefak mahal per (versi dataset, kunci), dibagi semua sesi dan thread prekomputasi.
+
+    Setiap kunci dibangun sekali walau diminta bersamaan (thread lain menunggu
+    hasilnya). Hanya ``keep`` versi yang terakhir dipakai disimpan; versi lain
+    dibuang seluruhnya.
+    """
+
+    def __init__(self, keep=2):
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._versions = OrderedDict()
+
+    def get(self, version, key, build):
+        """Nilai ``key`` untuk ``version``; ``build()`` hanya dipanggil bila belum ada."""
+        with self._lock:
+            entries = self._versions.get(version)
+            if entries is None:
+                entries = self._versions[version] = {}
+                while len(self._versions) > self.keep:
+                    self._versions.popitem(last=False)
+            self._versions.move_to_end(version)
+            entry = entries.get(key)
+            if entry is None:
+                entry = entries[key] = _Entry()
+        # Bangun di luar lock utama: hanya peminta kunci yang sama ikut menunggu
+        with entry.lock:
+            if not entry.ready:
+                entry.value = build()
+                entry.ready = True
+        return entry.value
+
+    def versions(self):
+        with self._lock:
+            return list(self._versions)
+
+
+class PrecomputeScheduler:
+    """Pantau versi sumber, hangatkan cache versi baru di latar belakang, lalu tukar versi."""
+
+    def __init__(self, probe, tasks, interval=WARM_INTERVAL, log=logger.info):
+        self.probe = probe
+        self.tasks = tasks
+        self.interval = interval
+        self.log = log
+        self._lock = threading.Lock()
+        self._served = None
+        self._warmed = None
+        self._failed = None
+        self._stop = threading.Event()
+        self._thread = None
+        # Status untuk UI (dibaca lewat ``status()``): versi yang sedang disiapkan dan
+        # (tugas selesai, total tugas)
+        self._pending = None
+        self._progress = (0, 0)
+        self.timings = {}
+
+    def served(self):
+        """Versi yang dipakai rerun saat ini."""
+        with self._lock:
+            if self._served is None:
+                # Start pertama: belum ada versi lama yang bisa dilayani
+                self._served = self.probe()
+            return self._served
+
+    def status(self):
+        """``(versi yang sedang disiapkan atau None, tugas selesai, total tugas)``."""
+        with self._lock:
+            return (self._pending,) + self._progress
+
+    def _set_status(self, pending, progress):
+        with self._lock:
+            self._pending, self._progress = pending, progress
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name='txnet-warmup', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.check()
+            self._stop.wait(self.interval)
+
+    def check(self):
+        """Satu putaran: bila versi sumber belum dihangatkan, jalankan ``warm``."""
+        try:
+            version = self.probe()
+        except OSError as exc:
+            self.log(f"sumber data tidak terbaca: {exc}")
+            return False
+        if version in (self._warmed, self._failed):
+            return False
+        return self.warm(version)
+
+    def warm(self, version):
+        """Jalankan semua tugas untuk ``version`` lalu pasang sebagai versi yang dilayani."""
+        self._set_status(version, (0, 0))
+        timings = {}
+        start = time.perf_counter()
+        name = 'daftar tugas'
+        try:
+            tasks = list(self.tasks(version))
+            self._set_status(version, (0, len(tasks)))
+            for i, (name, func) in enumerate(tasks):
+                task_start = time.perf_counter()
+                func()
+                timings[name] = time.perf_counter() - task_start
+                self._set_status(version, (i + 1, len(tasks)))
+        except Exception:
+            logger.exception("prekomputasi versi %s gagal pada tugas %s", version[:12], name)
+            self._failed = version
+            return False
+        finally:
+            self._set_status(None, (0, 0))
+        with self._lock:
+            self._served = self._warmed = version
+            self.timings = timings
+        self._failed = None
+        self.log(f"versi {version[:12]} siap: {len(tasks)} tugas dalam {time.perf_counter() - start:.1f}s")
+        return True